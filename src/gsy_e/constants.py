@@ -57,14 +57,91 @@ SIMULATION_PAUSE_TIMEOUT = 600
 # Also helpful when debugging, in order for the interpreter to have access to all markets that a
 # simulation has ran through.
 RETAIN_PAST_MARKET_STRATEGIES_STATE = False
+
+# Controls whether the hits and misses of the cached Area properties (spot_market,
+# last_past_market, now) are counted in area_property_cache_counters. Only meant for profiling,
+# as the counting adds overhead to every access of the properties.
+COUNT_AREA_PROPERTY_CACHE_ACCESSES = False
+
 KAFKA_MOCK = False
 
 CN_PROFILE_EXPANSION_DAYS = 7
 
 RUN_IN_REALTIME = False
 
+# Controls whether the internal matching engine consumes the live order book view of the markets
+# instead of re-serialising all orders on every matching iteration. In this mode only the time
+# slots whose orders changed since they were last matched are sent to the matching algorithm.
+MATCHING_ENGINE_INCREMENTAL_ORDER_BOOK = False
+
+# Controls whether the analytic solution of the virtual heatpump storage temperature is compared
+# against the (slow) sympy solution of the equation system. Only meant for validation / debugging.
+VALIDATE_HEATPUMP_SOLVER_WITH_SYMPY = False
+
+# Controls whether the state of all virtual heatpumps is populated in one vectorised pass per
+# market cycle (see VirtualHeatpumpFleet), instead of each heatpump solving its own equations.
+VECTORISED_VIRTUAL_HEATPUMP_FLEET = False
+
+# Trade settlements are sent to the blockchain by a background worker (BlockchainSettlementQueue).
+# The simulation blocks on new trades once BLOCKCHAIN_SETTLEMENT_MAX_PENDING of them are waiting.
+BLOCKCHAIN_SETTLEMENT_MAX_PENDING = 10000
+BLOCKCHAIN_SETTLEMENT_BATCH_SIZE = 100
+
+# Controls how the results of the SimulationEndpointBuffer are validated against the JSON schemas
+# on each update:
+# - "full": all results are validated (default, always used by the tests)
+# - "incremental": only the area results that changed since the last update are validated, and
+#   the configuration tree is only rebuilt and validated if a live event changed the grid
+# - "sampled": same as incremental, but only every RESULTS_VALIDATION_SAMPLING_INTERVAL updates
+# - "off": results are not validated, the configuration tree is reused as in incremental mode
+RESULTS_VALIDATION_MODE = os.environ.get("RESULTS_VALIDATION_MODE", "full")
+RESULTS_VALIDATION_SAMPLING_INTERVAL = 10
+
+# Controls whether the results are published to Kafka as deltas (only the results of the areas
+# that changed since the previous message) instead of full snapshots on every update. A full
+# snapshot (keyframe) is still sent every KAFKA_RESULTS_KEYFRAME_INTERVAL messages and whenever
+# the grid configuration changes. Consumers need to support the delta messages, thus opt-in.
+KAFKA_RESULTS_DELTA_PUBLISHING = False
+KAFKA_RESULTS_KEYFRAME_INTERVAL = 96
+
+# Format of the market and area statistics that are exported by ExportAndPlot on every market
+# cycle: "csv" (one csv-file per area and market type), "parquet" or "arrow" (one buffered table
+# per kind of statistics, written every COLUMNAR_EXPORT_ROW_GROUP_SLOTS market slots, requires
+# pyarrow). The columnar export can be converted to the csv-files with
+# gsy_e.gsy_e_core.sim_results.columnar_export.convert_columnar_export_to_csv.
+EXPORT_FORMAT = os.environ.get("EXPORT_FORMAT", "csv")
+COLUMNAR_EXPORT_ROW_GROUP_SLOTS = 96
+
+# Controls whether the strategies update the prices of their open offers and bids in place
+# (MarketBase.amend_order, that keeps the order ids and dispatches a single ORDER_AMENDED event)
+# instead of deleting them and posting new ones, on every price update.
+AMEND_ORDERS_ON_PRICE_UPDATE = False
+
+# Controls whether the trade and split events of a market (OFFER_TRADED, BID_TRADED, OFFER_SPLIT,
+# BID_SPLIT) are delivered only to the child strategies that took part in them (looked up by the
+# name and uuid of the traders), instead of being broadcast to all children of the market area.
+# Strategies that need to observe every trade opt in to the broadcast with observes_all_trades.
+# The market agents of the child market areas keep receiving all trade and split events.
+ROUTE_TRADE_EVENTS_TO_TRADERS = True
+
+# Controls whether ProfilesHandler reads every distinct in-memory profile input (e.g. the same
+# constant rate or profile file of many devices) only once per profile chunk, and shares the
+# read profile (read-only) between all strategies that use this input.
+DEDUPLICATE_PROFILES = True
+
 CONNECT_TO_PROFILES_DB = False
+# Controls whether the profiles of the next window are read from the profiles DB in a background
+# thread while the buffered window is simulated, instead of blocking the market cycle on the DB
+# queries when the buffered window runs out.
+PREFETCH_PROFILES_FROM_DB = False
 SEND_EVENTS_RESPONSES_TO_SDK_VIA_RQ = False
+# Controls whether the events that are sent to the external clients during a tick (the tick,
+# market, trade and finish events of the connected assets, and the events and command responses
+# of the aggregators) are collected and published in one Redis pipeline at the end of the tick,
+# instead of with one Redis round-trip per message.
+PIPELINE_EXTERNAL_EVENTS = True
+# JSON encoder of the pipelined events: "json" or "orjson" (requires orjson).
+EXTERNAL_EVENTS_JSON_ENCODER = os.environ.get("EXTERNAL_EVENTS_JSON_ENCODER", "json")
 
 DEFAULT_SCM_COMMUNITY_NAME = "Community"
 DEFAULT_SCM_GRID_NAME = "Grid"
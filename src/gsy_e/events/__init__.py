@@ -21,6 +21,11 @@ from gsy_e.events.event_structures import MarketEvent, AreaEvent
 
 class EventMixin:
     """Mixin class that injects event handling behavior on the strategy classes."""
+
+    # Strategies that react to trades in which they did not take part set this to True, in order
+    # to receive all trade and split events of the market (see ROUTE_TRADE_EVENTS_TO_TRADERS).
+    observes_all_trades = False
+
     def _event_mapping(self, event):
         # pylint: disable=too-many-return-statements,too-many-branches
         if event == AreaEvent.TICK:
@@ -55,6 +60,8 @@ class EventMixin:
             return self.event_balancing_offer_deleted
         if event == MarketEvent.BALANCING_TRADE:
             return self.event_balancing_trade
+        if event == MarketEvent.ORDER_AMENDED:
+            return self.event_order_amended
         assert False, f"No event {event}."
 
     def event_listener(self, event_type: Union[AreaEvent, MarketEvent], **kwargs):
@@ -113,3 +120,6 @@ class EventMixin:
 
     def event_balancing_trade(self, *, market_id, trade):
         """Event emitted when a balancing trade is created."""
+
+    def event_order_amended(self, *, market_id, order):
+        """Event emitted when the price of an offer or bid is amended (keeping its id)."""
@@ -38,6 +38,7 @@ class MarketEvent(Enum):
     BALANCING_OFFER_SPLIT = 9
     BALANCING_OFFER_DELETED = 10
     BALANCING_TRADE = 11
+    ORDER_AMENDED = 13
 
 
 class AreaEvent(Enum):
@@ -7,6 +7,11 @@ class NonBlockchainInterface:
         self.simulation_id = simulation_id
         print(f"new market created with id: {market_id}")
 
+    def activate(self, trader_ids):
+        pass
+
+    def deactivate(self):
+        pass
 
     def create_new_offer(self, energy, price, seller):
         return str(uuid.uuid4())
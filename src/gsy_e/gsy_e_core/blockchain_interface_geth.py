@@ -5,23 +5,44 @@ import requests
 from web3 import Web3
 from web3.geth import GethPersonal
 
+from gsy_e.gsy_e_core.blockchain_settlement import BlockchainSettlementQueue
+
 RPC_URI = os.getenv('RPC_URI', 'https://bc4p.nowum.fh-aachen.de/blockchain')
 FAUCET_URI = os.getenv('RPC_URI', 'https://bc4p.nowum.fh-aachen.de/faucet/api/add_key')
 CHAIN_ID = os.getenv('CHAIN_ID','123321')
 web3 = Web3(Web3.HTTPProvider(RPC_URI))
 gp = GethPersonal(web3)
 
+
+def request_funds_from_faucet(public_key):
+    res = requests.post(FAUCET_URI, json={'public_key': public_key})
+    print(res)
+
+
+# Shared by the interfaces of all markets, so that accounts and nonces are managed in one place.
+geth_settlement_queue = BlockchainSettlementQueue(web3, gp, CHAIN_ID,
+                                                  faucet=request_funds_from_faucet)
+
+
 class GethBlockchainInterface:
-    def __init__(self, market_id, simulation_id=None, ):
+    def __init__(self, market_id, simulation_id=None, settlement_queue=None):
         self.market_id = market_id
         self.simulation_id = simulation_id
-        self.traders = {}
+        self.settlement_queue = settlement_queue or geth_settlement_queue
+
+    @property
+    def traders(self):
+        return self.settlement_queue.accounts
+
+    def activate(self, trader_ids):
+        # Accounts are created in the background, before the first trade of the traders.
+        self.settlement_queue.create_accounts(trader_ids)
+
+    def deactivate(self):
+        self.settlement_queue.flush()
 
     def create_account(self, trader_id):
-        # trader_id is passphrase
-        self.traders[trader_id] = gp.new_account(trader_id)
-        res = requests.post(FAUCET_URI, json= {'public_key': self.traders[trader_id]})
-        print(res)
+        self.settlement_queue.create_accounts([trader_id])
 
     def create_new_offer(self, energy, price, seller):
         print(f"create_new_offer: {energy} {price} {seller}")
@@ -41,51 +62,5 @@ class GethBlockchainInterface:
 
     def track_trade_event(self, time_slot, trade):
         print(f"track_trade_event: {time_slot} {trade}")
-
-        if trade.seller_id not in self.traders.keys():
-            self.create_account(trade.seller_id)
-        if trade.buyer_id not in self.traders.keys():
-            self.create_account(trade.buyer_id)
-        
-        FROM = self.traders[trade.seller_id]
-        TO = self.traders[trade.buyer_id]
-        nonce = web3.eth.getTransactionCount(FROM)
-        
-        gasPrice = web3.toWei('1', 'gwei')
-        value = web3.toWei(trade.trade_price, 'gwei')
-        tx = {
-                'chainId': int(CHAIN_ID),
-                'nonce': nonce,
-                'from': FROM,
-                'to': TO,
-                'value': value,
-                'gas': 2000000,
-                'gasPrice': gasPrice
-            }
-        try:
-            gp.send_transaction(tx, trade.seller_id)
-        except Exception as e:
-            print(e)
-
-if __name__ == '__main__':
-    #FROM = os.getenv('PUBLIC_KEY','0x2d558F4633FF8011C27401c0070Fd1E981770B94')
-    FROM = gp.new_account('tets')
-    res = requests.post(FAUCET_URI, data= {'public_key': FROM})
-    print(res)
-    nonce = web3.eth.getTransactionCount(FROM)
-    gasPrice = web3.toWei('1', 'gwei')
-    value = web3.toWei(1, 'gwei')
-
-    # my public_key
-    TO = '0x8dC8e161975dC5dD6B0DD6D948bC6d469Ae01cD8'
-
-    tx = {
-            'chainId': int(CHAIN_ID),
-            'nonce': nonce,
-            'from': FROM,
-            'to': TO,
-            'value': value,
-            'gas': 2000000,
-            'gasPrice': gasPrice
-        }
-    gp.send_transaction(tx, self.market_id)
\ No newline at end of file
+        self.settlement_queue.submit(time_slot, trade.seller_id, trade.buyer_id,
+                                     trade.trade_price)
@@ -0,0 +1,224 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import gsy_e.constants
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SettlementTransaction:
+    """Transaction that settles a trade on the blockchain."""
+    time_slot: Any
+    seller_id: str
+    buyer_id: str
+    trade_price: float
+
+
+@dataclass(frozen=True)
+class _AccountsCreation:
+    trader_ids: Tuple[str, ...]
+
+
+_STOP_WORKER = object()
+
+
+class BlockchainSettlementQueue:
+    """Send the trade settlements to the blockchain from a background worker thread.
+
+    The simulation thread only enqueues the settlements, therefore market ticks do not wait on
+    RPC round-trips. The worker drains the queue in batches, groups the transactions of a batch
+    per market slot and sends them in order. Nonces are fetched from the node once per account
+    and managed locally afterwards. The queue is bounded: when max_pending settlements are
+    waiting, submit() blocks until the worker catches up (back-pressure).
+
+    web3_client and personal are expected to expose the web3 eth / geth personal API
+    (eth.getTransactionCount, toWei, new_account, send_transaction), so that any in-process
+    provider can be used instead of a geth node.
+    """
+
+    def __init__(self, web3_client, personal, chain_id: int,
+                 faucet: Optional[Callable[[str], None]] = None,
+                 max_pending: Optional[int] = None, batch_size: Optional[int] = None,
+                 gas: int = 2000000, gas_price_gwei: int = 1):
+        # pylint: disable=too-many-arguments
+        self._web3 = web3_client
+        self._personal = personal
+        self._chain_id = int(chain_id)
+        self._faucet = faucet
+        self._batch_size = batch_size or gsy_e.constants.BLOCKCHAIN_SETTLEMENT_BATCH_SIZE
+        self._queue = queue.Queue(
+            maxsize=max_pending or gsy_e.constants.BLOCKCHAIN_SETTLEMENT_MAX_PENDING)
+        self._gas = gas
+        self._gas_price_gwei = gas_price_gwei
+        # trader_id -> account address. Only mutated by the worker thread.
+        self._accounts: Dict[str, str] = {}
+        # account address -> next nonce. Only mutated by the worker thread.
+        self._nonces: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self.sent_transactions = 0
+        self.failed_transactions = 0
+
+    @property
+    def accounts(self) -> Dict[str, str]:
+        """Return the accounts that were created, keyed by trader id."""
+        return dict(self._accounts)
+
+    @property
+    def pending(self) -> int:
+        """Return the (approximate) number of queued items that were not processed yet."""
+        return self._queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread, if it is not running already."""
+        with self._thread_lock:
+            if self.is_running:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="blockchain-settlement", daemon=True)
+            self._thread.start()
+
+    def create_accounts(self, trader_ids: Iterable[str]) -> None:
+        """Schedule the creation of the accounts of the traders that do not have one yet."""
+        trader_ids = tuple(trader_id for trader_id in trader_ids
+                           if trader_id not in self._accounts)
+        if trader_ids:
+            self._put(_AccountsCreation(trader_ids))
+
+    def submit(self, time_slot, seller_id: str, buyer_id: str, trade_price: float) -> None:
+        """Schedule the settlement of a trade. Blocks while the queue is full."""
+        self._put(SettlementTransaction(time_slot, seller_id, buyer_id, trade_price))
+
+    def _put(self, item) -> None:
+        self.start()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            log.warning("Blockchain settlement queue is full (%s pending items), waiting for "
+                        "the worker to catch up.", self._queue.maxsize)
+            self._queue.put(item)
+
+    def flush(self) -> None:
+        """Block until all queued settlements have been sent."""
+        if self._queue.unfinished_tasks:
+            self.start()
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush the pending settlements and stop the worker thread."""
+        self.flush()
+        with self._thread_lock:
+            if not self.is_running:
+                return
+            self._queue.put(_STOP_WORKER)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                should_stop = self._process_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if should_stop:
+                return
+
+    def _process_batch(self, batch: List) -> bool:
+        transactions_per_slot: Dict[Any, List[SettlementTransaction]] = {}
+        should_stop = False
+        for item in batch:
+            if item is _STOP_WORKER:
+                should_stop = True
+            elif isinstance(item, _AccountsCreation):
+                for trader_id in item.trader_ids:
+                    self._get_account(trader_id)
+            else:
+                transactions_per_slot.setdefault(item.time_slot, []).append(item)
+
+        for time_slot, transactions in transactions_per_slot.items():
+            log.debug("Sending %s settlement transactions for slot %s.",
+                      len(transactions), time_slot)
+            for transaction in transactions:
+                self._send_transaction(transaction)
+        return should_stop
+
+    def _get_account(self, trader_id: str) -> Optional[str]:
+        if trader_id in self._accounts:
+            return self._accounts[trader_id]
+        try:
+            # trader_id is the passphrase of the account
+            account = self._personal.new_account(trader_id)
+        except Exception as ex:  # pylint: disable=broad-except
+            log.error("Creating blockchain account for %s failed: %s", trader_id, ex)
+            return None
+        self._accounts[trader_id] = account
+        if self._faucet is not None:
+            try:
+                self._faucet(account)
+            except Exception as ex:  # pylint: disable=broad-except
+                log.error("Requesting funds for account %s failed: %s", account, ex)
+        return account
+
+    def _get_nonce(self, account: str) -> int:
+        if account not in self._nonces:
+            self._nonces[account] = self._web3.eth.getTransactionCount(account)
+        return self._nonces[account]
+
+    def _send_transaction(self, transaction: SettlementTransaction) -> None:
+        seller_account = self._get_account(transaction.seller_id)
+        buyer_account = self._get_account(transaction.buyer_id)
+        if seller_account is None or buyer_account is None:
+            self.failed_transactions += 1
+            return
+        try:
+            tx = {
+                "chainId": self._chain_id,
+                "nonce": self._get_nonce(seller_account),
+                "from": seller_account,
+                "to": buyer_account,
+                "value": self._web3.toWei(transaction.trade_price, "gwei"),
+                "gas": self._gas,
+                "gasPrice": self._web3.toWei(self._gas_price_gwei, "gwei")
+            }
+            self._personal.send_transaction(tx, transaction.seller_id)
+        except Exception as ex:  # pylint: disable=broad-except
+            log.error("Sending settlement transaction %s failed: %s", transaction, ex)
+            # The local nonce might be out of sync with the node, fetch it again on next use.
+            self._nonces.pop(seller_account, None)
+            self.failed_transactions += 1
+            return
+        self._nonces[seller_account] += 1
+        self.sent_transactions += 1
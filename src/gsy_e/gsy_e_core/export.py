@@ -21,7 +21,7 @@ import logging
 import os
 import pathlib
 import shutil
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.data_classes import (BalancingOffer, BalancingTrade, Bid, MarketClearingState,
@@ -34,6 +34,7 @@ import gsy_e.constants
 from gsy_e.gsy_e_core.area_serializer import area_to_string
 from gsy_e.gsy_e_core.enums import PAST_MARKET_TYPE_FILE_SUFFIX_MAPPING
 from gsy_e.gsy_e_core.matching_engine_singleton import bid_offer_matcher
+from gsy_e.gsy_e_core.sim_results.columnar_export import ColumnarExportWriter
 from gsy_e.gsy_e_core.sim_results.file_export_endpoints import file_export_endpoints_factory
 from gsy_e.gsy_e_core.sim_results.results_plots import (PlotAverageTradePrice, PlotDeviceStats,
                                                         PlotEnergyProfile,
@@ -51,6 +52,13 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Names of the columnar export tables that contain the orders / trades of the markets.
+MARKET_MEMBER_TABLE_NAMES = {
+    "trades": "trades",
+    "offer_history": "offers",
+    "bid_history": "bids",
+}
+
 
 results_field_to_json_filename_mapping = {
     "area_throughput": "area_throughput",
@@ -84,6 +92,7 @@ class ExportAndPlot:
         self.endpoint_buffer = endpoint_buffer
         self.file_stats_endpoint = file_export_endpoints_factory()
         self.raw_data_subdir = None
+        self._columnar_writer = None
         try:
             if path is not None:
                 path = os.path.abspath(path)
@@ -102,6 +111,10 @@ class ExportAndPlot:
             return
 
         self.plot_dir = os.path.join(self.directory, "plot")
+        if gsy_e.constants.EXPORT_FORMAT != "csv":
+            self._columnar_writer = ColumnarExportWriter(
+                self.directory, gsy_e.constants.EXPORT_FORMAT,
+                gsy_e.constants.COLUMNAR_EXPORT_ROW_GROUP_SLOTS)
 
     def _export_json_data(self) -> None:
         """Write aggregated results into JSON files."""
@@ -134,6 +147,9 @@ class ExportAndPlot:
         if power_flow:
             power_flow.export_power_flow_results(self.plot_dir)
 
+        if self._columnar_writer is not None:
+            self._columnar_writer.close()
+
         if not os.path.exists(self.plot_dir):
             os.makedirs(self.plot_dir)
 
@@ -167,6 +183,20 @@ class ExportAndPlot:
     def data_to_csv(self, area: Area, is_first: bool) -> None:
         """Wrapper for recursive function self._export_area_with_children."""
         self._export_area_with_children(area, self.directory, is_first)
+        if self._columnar_writer is not None:
+            self._columnar_writer.end_slot()
+
+    def _write_rows(self, table_name: str, file_path: str, labels: Tuple,
+                    rows: Iterable[Tuple], is_first: bool) -> None:
+        """Append the rows to the csv-file, or to the columnar table if enabled."""
+        if self._columnar_writer is not None:
+            self._columnar_writer.write_rows(table_name, file_path, labels, rows)
+            return
+        with open(file_path, "a", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            if is_first:
+                writer.writerow(labels)
+            writer.writerows(rows)
 
     def area_tree_summary_to_json(self, data: Dict) -> None:
         """Write area tree information to JSON file."""
@@ -327,59 +357,50 @@ class ExportAndPlot:
         """Export clearing rate as in a csv-file."""
         file_path = self._file_path(directory, f"{area.slug}-{file_suffix}")
         labels = ("slot",) + MarketClearingState.csv_fields()
+
+        def _rows():
+            for market in area.past_markets:
+                market_clearing = bid_offer_matcher.matcher.match_algorithm.state.clearing.get(
+                    market.id)
+                if market_clearing is None:
+                    continue
+                for time, clearing in market_clearing.items():
+                    if market.time_slot > time:
+                        yield market.time_slot_str, time, clearing
         try:
-            with open(file_path, "a", encoding="utf-8") as csv_file:
-                writer = csv.writer(csv_file)
-                if is_first:
-                    writer.writerow(labels)
-                for market in area.past_markets:
-                    market_clearing = bid_offer_matcher.matcher.match_algorithm.state.clearing.get(
-                        market.id)
-                    if market_clearing is None:
-                        continue
-                    for time, clearing in market_clearing.items():
-                        if market.time_slot > time:
-                            row = (market.time_slot_str, time, clearing)
-                            writer.writerow(row)
+            self._write_rows(file_suffix, file_path, labels, _rows(), is_first)
         except OSError:
             _log.exception("Could not export area market_clearing_rate")
 
-    @staticmethod
     def _export_future_offers_bid_trades_to_csv_files(
-            future_markets: "FutureMarkets", market_member: str, file_path: dir,
+            self, future_markets: "FutureMarkets", market_member: str, file_path: dir,
             labels: Tuple, is_first: bool = False) -> None:
         """
         Export files containing individual future offers, bids (*-bids*/*-offers*.csv files).
         """
+        def _rows():
+            if not future_markets.market_time_slots:
+                return
+            time_slot = future_markets.market_time_slots[0]
+            for offer_or_bid in getattr(future_markets, market_member):
+                if offer_or_bid.time_slot == time_slot:
+                    yield (time_slot,) + offer_or_bid.csv_values()
         try:
-            with open(file_path, "a", encoding="utf-8") as csv_file:
-                writer = csv.writer(csv_file)
-                if is_first:
-                    writer.writerow(labels)
-                if not future_markets.market_time_slots:
-                    return
-                time_slot = future_markets.market_time_slots[0]
-                for offer_or_bid in getattr(future_markets, market_member):
-                    if offer_or_bid.time_slot == time_slot:
-                        row = (time_slot,) + offer_or_bid.csv_values()
-                        writer.writerow(row)
+            self._write_rows(MARKET_MEMBER_TABLE_NAMES[market_member], file_path, labels,
+                             _rows(), is_first)
         except OSError:
             _log.exception("Could not export offers, bids, trades")
 
-    @staticmethod
-    def _export_offers_bids_trades_to_csv_files(past_markets: List, market_member: str,
+    def _export_offers_bids_trades_to_csv_files(self, past_markets: List, market_member: str,
                                                 file_path: dir, labels: Tuple,
                                                 is_first: bool = False) -> None:
         """ Export files containing individual offers, bids (*-bids*/*-offers*.csv files)."""
+        rows = ((market.time_slot,) + offer_or_bid.csv_values()
+                for market in past_markets
+                for offer_or_bid in getattr(market, market_member))
         try:
-            with open(file_path, "a", encoding="utf-8") as csv_file:
-                writer = csv.writer(csv_file)
-                if is_first:
-                    writer.writerow(labels)
-                for market in past_markets:
-                    for offer_or_bid in getattr(market, market_member):
-                        row = (market.time_slot,) + offer_or_bid.csv_values()
-                        writer.writerow(row)
+            self._write_rows(MARKET_MEMBER_TABLE_NAMES[market_member], file_path, labels,
+                             rows, is_first)
         except OSError:
             _log.exception("Could not export offers, bids, trades")
 
@@ -394,12 +415,8 @@ class ExportAndPlot:
             return
 
         try:
-            with open(self._file_path(directory, file_name), "a", encoding="utf-8") as csv_file:
-                writer = csv.writer(csv_file)
-                if is_first:
-                    writer.writerow(data.labels)
-                for row in rows:
-                    writer.writerow(row)
+            self._write_rows("area-stats", self._file_path(directory, file_name), data.labels,
+                             rows, is_first)
         except OSError:
             _log.exception("Could not export area data.")
 
@@ -413,6 +430,8 @@ class CoefficientExportAndPlot(ExportAndPlot):
         self._time_slot = time_slot
         self._scm_manager = scm_manager
         self._export_area_with_children(area, self.directory, is_first)
+        if self._columnar_writer is not None:
+            self._columnar_writer.end_slot()
 
     def _export_area_with_children(self, area: Area, directory: dir,
                                    is_first: bool = False) -> None:
@@ -439,19 +458,16 @@ class CoefficientExportAndPlot(ExportAndPlot):
     def _export_scm_trades_to_csv_files(
             self, area_uuid: str, file_path: dir, labels: Tuple, is_first: bool = False) -> None:
         """ Export files containing individual SCM trades."""
+        def _rows():
+            if not self._scm_manager:
+                return
+            after_meter_data = self._scm_manager.get_after_meter_data(area_uuid)
+            if not after_meter_data:
+                return
+
+            for trade in after_meter_data.trades:
+                yield (self._time_slot,) + trade.csv_values()
         try:
-            with open(file_path, "a", encoding="utf-8") as csv_file:
-                writer = csv.writer(csv_file)
-                if is_first:
-                    writer.writerow(labels)
-                if not self._scm_manager:
-                    return
-                after_meter_data = self._scm_manager.get_after_meter_data(area_uuid)
-                if not after_meter_data:
-                    return
-
-                for trade in after_meter_data.trades:
-                    row = (self._time_slot,) + trade.csv_values()
-                    writer.writerow(row)
+            self._write_rows("trades", file_path, labels, _rows(), is_first)
         except OSError:
             _log.exception("Could not export offers, bids, trades")
@@ -0,0 +1,62 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import random
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class FairnessScheduler:
+    """Random order in which the children of the areas receive the events, in order to ensure
+    fairness between them.
+
+    The permutation of the children of an area is generated once per tick (with a Fisher-Yates
+    shuffle of a seeded random generator), and reused for all events of the area during the
+    tick. The permutations of different areas are drawn independently, also if they have the
+    same number of children. Thus the order only depends on the seed and on the sequence of the
+    ticks, and the dispatching of an event does not draw a random number per child.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+        self._permutations: Dict[Tuple[Hashable, int], List[int]] = {}
+
+    def seed(self, seed: Optional[int]) -> None:
+        """Reset the random generator to the seed, and drop the permutations of the tick."""
+        self._random.seed(seed)
+        self._permutations.clear()
+
+    def next_tick(self) -> None:
+        """Drop the permutations of the current tick, new ones are generated on demand."""
+        self._permutations.clear()
+
+    def get_permutation(self, key: Hashable, number_of_items: int) -> List[int]:
+        """Return the permutation of the indexes of number_of_items items of the key (e.g. the
+        uuid of the area whose children are ordered) for the current tick."""
+        permutation = self._permutations.get((key, number_of_items))
+        if permutation is None:
+            permutation = list(range(number_of_items))
+            self._random.shuffle(permutation)
+            self._permutations[(key, number_of_items)] = permutation
+        return permutation
+
+    def shuffled(self, key: Hashable, items: Sequence[T]) -> List[T]:
+        """Return the items of the key in the order of its permutation of the current tick."""
+        if len(items) < 2:
+            return list(items)
+        return [items[index] for index in self.get_permutation(key, len(items))]
@@ -15,6 +15,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+from gsy_e.gsy_e_core.fairness_scheduler import FairnessScheduler
 from gsy_e.gsy_e_core.user_profile_handler import ProfilesHandler
 from gsy_e.gsy_e_core.global_stats import (
     ExternalConnectionGlobalStatistics, SCMExternalConnectionGlobalStatistics)
@@ -26,6 +27,7 @@ class GlobalObjects:
     profiles_handler = ProfilesHandler()
     external_global_stats = ExternalConnectionGlobalStatistics()
     scm_external_global_stats = SCMExternalConnectionGlobalStatistics()
+    fairness_scheduler = FairnessScheduler()
 
 
 global_objects = GlobalObjects()
@@ -15,13 +15,16 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 import gsy_e.constants
 from gsy_e.gsy_e_core.market_counters import ExternalTickCounter
 from gsy_e.gsy_e_core.util import (find_object_of_same_weekday_and_time,
                                    get_market_maker_rate_from_config)
 
+if TYPE_CHECKING:
+    from gsy_e.models.area import Area
+
 
 class ExternalConnectionGlobalStatistics:
     """
@@ -33,6 +36,10 @@ class ExternalConnectionGlobalStatistics:
         self.external_tick_counter = None
         self.current_feed_in_tariff = None
         self.current_market_maker_rate = None
+        # area uuid -> dict of the area_stats_tree_dict that contains the stats of the area
+        self._area_parent_dicts: Dict[str, Dict] = {}
+        # areas whose stats changed since the last update of the area_stats_tree_dict
+        self._dirty_areas: Dict[str, "Area"] = {}
 
     def __call__(self, root_area, ticks_per_slot):
         self.root_area = root_area
@@ -63,11 +70,31 @@ class ExternalConnectionGlobalStatistics:
         """Update the global statistics"""
         if self.root_area.current_market is None:
             return
+        self._area_parent_dicts = {}
+        self._dirty_areas = {}
         self._create_grid_tree_dict(self.root_area, self.area_stats_tree_dict)
         if market_cycle:
             self._buffer_feed_in_tariff(self.root_area, self.root_area.current_market.time_slot)
             self._buffer_market_maker_rate()
 
+    def mark_area_dirty(self, area: "Area") -> None:
+        """Mark the stats of the area (e.g. of an asset that traded) as changed. The stats of
+        the area are updated by the next update or update_dirty_areas."""
+        self._dirty_areas[area.uuid] = area
+
+    def update_dirty_areas(self) -> None:
+        """Update the stats of the areas that were marked as changed since the last update,
+        without rebuilding the stats of all other areas."""
+        if not self._dirty_areas:
+            return
+        dirty_areas, self._dirty_areas = self._dirty_areas, {}
+        if self.root_area is None or self.root_area.current_market is None:
+            return
+        for area_uuid, area in dirty_areas.items():
+            parent_dict = self._area_parent_dicts.get(area_uuid)
+            if parent_dict is not None:
+                self._create_grid_tree_dict(area, parent_dict)
+
     def is_it_time_for_external_tick(self, current_tick_in_slot: int) -> bool:
         """Returns true if it is time for broadcasting event_tick to external strategies"""
         return self.external_tick_counter.is_it_time_for_external_tick(current_tick_in_slot)
@@ -76,6 +103,7 @@ class ExternalConnectionGlobalStatistics:
         # the lazy import is needed in order to avoid circular imports
         # pylint: disable=import-outside-toplevel
         from gsy_e.models.strategy.external_strategies import ExternalMixin
+        self._area_parent_dicts[area.uuid] = outdict
         outdict[area.uuid] = {}
         if area.children:
             if area.current_market:
@@ -8,6 +8,7 @@ from gsy_framework.live_events.b2b import B2BLiveEvents
 from gsy_e.gsy_e_core.area_serializer import area_from_dict
 from gsy_e.gsy_e_core.exceptions import LiveEventException
 from gsy_e.gsy_e_core.global_objects_singleton import global_objects
+from gsy_e.models.area.area_base import AreaChildrenList
 from gsy_e.models.area.event_dispatcher import DispatcherFactory
 from gsy_e.models.strategy.infinite_bus import InfiniteBusStrategy
 from gsy_e.models.strategy.market_maker_strategy import MarketMakerStrategy
@@ -22,6 +23,14 @@ class CreateAreaEvent:
         self.area_representation = area_representation
         self.created_area = area_from_dict(self.area_representation, self.config)
 
+    def find_area(self, root_area):
+        """Return the area of the tree that the event should be applied to."""
+        return root_area.get_area_by_uuid(self.parent_uuid)
+
+    def update_area_uuid_index(self, area_uuid_index):
+        """Add the created area to the uuid index of the tree."""
+        area_uuid_index.add(self.created_area)
+
     def apply(self, area):
         """Trigger the area creation."""
         if area.uuid != self.parent_uuid:
@@ -75,6 +84,13 @@ class UpdateAreaEvent:
         self.area_uuid = area_uuid
         self.area_params = area_params
 
+    def find_area(self, root_area):
+        """Return the area of the tree that the event should be applied to."""
+        return root_area.get_area_by_uuid(self.area_uuid)
+
+    def update_area_uuid_index(self, area_uuid_index):
+        """The uuid of the area cannot be updated, therefore the index is not affected."""
+
     def apply(self, area):
         """Trigger the area update."""
         if area.uuid != self.area_uuid:
@@ -136,13 +152,27 @@ class DeleteAreaEvent:
 
     def __init__(self, area_uuid):
         self.area_uuid = area_uuid
+        self.deleted_area = None
+
+    def find_area(self, root_area):
+        """Return the area of the tree that the event should be applied to (the parent)."""
+        area = root_area.get_area_by_uuid(self.area_uuid)
+        return area.parent if area is not None else None
+
+    def update_area_uuid_index(self, area_uuid_index):
+        """Remove the deleted area and its descendants from the uuid index of the tree."""
+        if self.deleted_area is not None:
+            area_uuid_index.remove(self.deleted_area)
 
     def apply(self, area):
         """Trigger the area deletion."""
-        if self.area_uuid not in [c.uuid for c in area.children]:
+        self.deleted_area = next(
+            (c for c in area.children if c.uuid == self.area_uuid), None)
+        if self.deleted_area is None:
             return False
 
-        area.children = [c for c in area.children if c.uuid != self.area_uuid]
+        area.children = AreaChildrenList(
+            area, [c for c in area.children if c.uuid != self.area_uuid])
         if len(area.children) == 0:
             area.dispatcher = DispatcherFactory(area)()
         return True
@@ -158,6 +188,14 @@ class ForwardMarketsEvent:
         self._area_uuid = area_uuid
         self._event_params = event_params
 
+    def find_area(self, root_area):
+        """Return the area of the tree that the event should be applied to (the parent)."""
+        area = root_area.get_area_by_uuid(self._area_uuid)
+        return area.parent if area is not None else None
+
+    def update_area_uuid_index(self, area_uuid_index):
+        """The event does not change the tree, therefore the index is not affected."""
+
     def apply(self, area):
         """Trigger the forward market event."""
         if self._area_uuid not in [c.uuid for c in area.children]:
@@ -217,20 +255,21 @@ class LiveEvents:
                     self._event_buffer = []
                 raise LiveEventException(ex) from ex
 
-    def _handle_event(self, area, event):
+    @staticmethod
+    def _handle_event(root_area, event):
+        area = event.find_area(root_area)
+        if area is None:
+            return False
         try:
-            if event.apply(area) is True:
-                return True
+            if event.apply(area) is not True:
+                return False
         except LiveEventException as ex:
             logging.error("Event %s failed to apply on area %s. Exception: %s. Traceback: %s",
                           event, area.name, ex, traceback.format_exc())
             return False
-        if not area.children:
-            return False
-        for child in area.children:
-            if self._handle_event(child, event) is True:
-                return True
-        return False
+        event.update_area_uuid_index(root_area.area_uuid_index)
+        root_area.topology_version += 1
+        return True
 
     def _handle_events(self, root_area, event_buffer):
         with self._lock:
@@ -1,7 +1,7 @@
 import json
 import logging
-from copy import deepcopy
 from threading import Lock
+from typing import Dict, FrozenSet
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.enums import SpotMarketTypeEnum
@@ -32,6 +32,8 @@ class AggregatorHandler:
         self.device_aggregator_mapping = {}
         self.lock = Lock()
         self.grid_buffer = {}
+        # aggregator uuid -> uuids of the devices whose stats are sent to the aggregator
+        self._visible_devices: Dict[str, FrozenSet[str]] = {}
 
     def set_aggregator_device_mapping(self, aggregator_device):
         """Sets the aggregator_device_mapping derived from the aggregator_device_mapping
@@ -42,6 +44,7 @@ class AggregatorHandler:
             for aggr, devices in self.aggregator_device_mapping.items()
             for dev in devices
         }
+        self._visible_devices.clear()
 
     def is_controlling_device(self, device_uuid):
         """Return if the aggregator is controlling the device with specified uuid."""
@@ -52,24 +55,44 @@ class AggregatorHandler:
         aggregator_uuid = self.device_aggregator_mapping[device_uuid]
         create_subdict_or_update(batch_event_dict, aggregator_uuid, event)
 
+    def remove_device(self, device_uuid: str) -> None:
+        """Stop sending the events and the stats of the device to its aggregator."""
+        self.device_aggregator_mapping.pop(device_uuid, None)
+        self._visible_devices.clear()
+
+    def _get_visible_devices(self, aggregator_uuid: str) -> FrozenSet[str]:
+        """Return the devices that are connected to the aggregator. The result is cached until
+        the mapping of the devices to the aggregators changes."""
+        if aggregator_uuid not in self._visible_devices:
+            self._visible_devices[aggregator_uuid] = frozenset(
+                device_uuid
+                for device_uuid in self.aggregator_device_mapping.get(aggregator_uuid, [])
+                if device_uuid in self.device_aggregator_mapping)
+        return self._visible_devices[aggregator_uuid]
+
     def _delete_not_owned_devices_from_dict(self, area_stats_tree_dict, aggregator_uuid):
         """Wrapper for _delete_not_owned_devices"""
-        out_dict = deepcopy(area_stats_tree_dict)
-        self._delete_not_owned_devices(area_stats_tree_dict, aggregator_uuid, out_dict)
-        return out_dict
+        return self._delete_not_owned_devices(
+            area_stats_tree_dict, self._get_visible_devices(aggregator_uuid))
 
-    def _delete_not_owned_devices(self, indict: dict, aggregator_uuid: str, outdict: dict):
+    def _delete_not_owned_devices(self, indict: dict, visible_devices: FrozenSet[str]) -> dict:
         """Only sent area info from areas that are connected to an external client and
-        to the same aggregator from the to be sent area_stats_tree_dict"""
+        to the same aggregator from the to be sent area_stats_tree_dict.
+
+        The stats are not copied: the returned tree only contains new dicts for the areas with
+        children, and references the (read-only) stats of the devices of the aggregator."""
+        outdict = {}
         for area_uuid, area_dict in indict.items():
             if "children" in area_dict:
-                self._delete_not_owned_devices(indict[area_uuid]["children"],
-                                               aggregator_uuid,
-                                               outdict[area_uuid]["children"])
+                outdict[area_uuid] = {
+                    **area_dict,
+                    "children": self._delete_not_owned_devices(
+                        area_dict["children"], visible_devices)}
+            elif area_uuid in visible_devices:
+                outdict[area_uuid] = area_dict
             else:
-                if (area_uuid not in self.device_aggregator_mapping or
-                        area_uuid not in self.aggregator_device_mapping[aggregator_uuid]):
-                    outdict[area_uuid] = {"area_name": area_dict["area_name"]}
+                outdict[area_uuid] = {"area_name": area_dict["area_name"]}
+        return outdict
 
     def _create_grid_tree_event_dict(self, aggregator_uuid: str) -> dict:
         """Accumulate area_stats_tree_dict information and initiate a event dictionary
@@ -103,11 +126,18 @@ class AggregatorHandler:
         aggregator_uuid = self.device_aggregator_mapping[device_uuid]
         if aggregator_uuid not in self.batch_trade_events:
             self.batch_trade_events[aggregator_uuid] = {"trade_list": []}
-
-        self.batch_trade_events[aggregator_uuid].update(
-            self._create_grid_tree_event_dict(aggregator_uuid))
+        # The grid tree is added once per aggregator when the trade events are published.
         self.batch_trade_events[aggregator_uuid]["trade_list"].append(trade_info)
 
+    def _add_grid_tree_to_trade_events(self):
+        """Add the grid tree (with the stats of the assets that traded) to the trade events."""
+        if not self.batch_trade_events:
+            return
+        if ConstSettings.MASettings.MARKET_TYPE != SpotMarketTypeEnum.COEFFICIENTS.value:
+            global_objects.external_global_stats.update_dirty_areas()
+        for aggregator_uuid, trade_event in self.batch_trade_events.items():
+            trade_event.update(self._create_grid_tree_event_dict(aggregator_uuid))
+
     def aggregator_callback(self, payload):
         """Entrypoint for aggregator related commands"""
         message = json.loads(payload["data"])
@@ -150,6 +180,7 @@ class AggregatorHandler:
                 "status": "SELECTED", "aggregator_uuid": message["aggregator_uuid"],
                 "device_uuid": message["device_uuid"],
                 "transaction_id": message["transaction_id"]}
+        self._visible_devices.clear()
         self.redis_db.publish(
             AggregatorChannels().response, json.dumps(response_message)
         )
@@ -162,6 +193,7 @@ class AggregatorHandler:
                     del self.device_aggregator_mapping[message["device_uuid"]]
                     self.aggregator_device_mapping[message["aggregator_uuid"]]\
                         .remove(message["device_uuid"])
+                    self._visible_devices.clear()
                 response_message = {
                     "status": "UNSELECTED", "aggregator_uuid": message["aggregator_uuid"],
                     "device_uuid": message["device_uuid"],
@@ -202,6 +234,7 @@ class AggregatorHandler:
     def _delete_aggregator(self, message):
         if message["aggregator_uuid"] in self.aggregator_device_mapping:
             del self.aggregator_device_mapping[message["aggregator_uuid"]]
+            self._visible_devices.clear()
             success_response_message = {
                 "status": "deleted", "aggregator_uuid": message["aggregator_uuid"],
                 "transaction_id": message["transaction_id"]}
@@ -275,7 +308,7 @@ class AggregatorHandler:
             if ConstSettings.MASettings.MARKET_TYPE != SpotMarketTypeEnum.COEFFICIENTS.value:
                 publish_event_dict["num_ticks"] = (
                         100 / gsy_e.constants.DISPATCH_EVENT_TICK_FREQUENCY_PERCENT)
-            redis.publish_json(
+            redis.publish_event_json(
                 AggregatorChannels(gsy_e.constants.CONFIGURATION_ID, aggregator_uuid).events,
                 publish_event_dict)
 
@@ -292,6 +325,7 @@ class AggregatorHandler:
         self._publish_all_events_from_one_type(redis, self.batch_market_cycle_events, "market")
         self._publish_all_events_from_one_type(redis, self.batch_tick_events, "tick")
         self._publish_all_events_from_one_type(redis, self.batch_finished_events, "finish")
+        self._add_grid_tree_to_trade_events()
         self._publish_all_events_from_one_type(redis, self.batch_trade_events, "trade")
 
     def publish_all_commands_responses(self, redis):
@@ -299,7 +333,7 @@ class AggregatorHandler:
         via redis to the client"""
         for transaction_id, batch_commands in self.responses_batch_commands.items():
             for aggregator_uuid, response_body in batch_commands.items():
-                redis.publish_json(
+                redis.publish_event_json(
                     AggregatorChannels(
                         gsy_e.constants.CONFIGURATION_ID, aggregator_uuid).batch_commands_response,
                     {
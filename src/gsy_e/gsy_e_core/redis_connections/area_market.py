@@ -29,6 +29,8 @@ from rq import Queue
 import gsy_e.constants
 from gsy_e.constants import REDIS_PUBLISH_RESPONSE_TIMEOUT
 from gsy_e.gsy_e_core.redis_connections.aggregator import AggregatorHandler
+from gsy_e.gsy_e_core.redis_connections.event_publisher import (
+    PipelinedEventPublisher, get_json_encoder)
 from gsy_e.gsy_e_core.redis_connections.simulation import REDIS_URL
 
 log = logging.getLogger(__name__)
@@ -151,10 +153,13 @@ class ExternalConnectionCommunicator(ResettableCommunicator):
     def __init__(self, is_enabled):
         self.is_enabled = is_enabled
         self.aggregator = None
+        self.event_publisher = None
         if self.is_enabled:
             super().__init__()
             self.channel_callback_dict = {}
             self.aggregator = AggregatorHandler(self.redis_db)
+            self.event_publisher = PipelinedEventPublisher(
+                self.redis_db, get_json_encoder(gsy_e.constants.EXTERNAL_EVENTS_JSON_ENCODER))
 
     def activate(self):
         """Connect to aggregator.
@@ -200,17 +205,36 @@ class ExternalConnectionCommunicator(ResettableCommunicator):
             return
         self.aggregator.approve_batch_commands()
 
+    def publish_event_json(self, channel: str, data: Dict):
+        """Publish an event to the external clients. If PIPELINE_EXTERNAL_EVENTS is enabled, the
+        event is published with all other events of the tick in
+        publish_aggregator_commands_responses_events."""
+        if not self.is_enabled:
+            return
+        if gsy_e.constants.PIPELINE_EXTERNAL_EVENTS:
+            self.event_publisher.publish_json(channel, data)
+        else:
+            self.publish_json(channel, data)
+
     def publish_aggregator_commands_responses_events(self):
-        """Wrapper for publishing aggregator command responses and events."""
+        """Wrapper for publishing aggregator command responses and events, and all events that
+        were collected during the tick."""
         if not self.is_enabled:
             return
         self.aggregator.publish_all_commands_responses(self)
         self.aggregator.publish_all_events(self)
+        self.event_publisher.flush()
 
 
 class RQExternalConnectionCommunicator(ExternalConnectionCommunicator, RQResettableCommunicator):
     """Communicator for sending messages using redis queue including utils for aggregator."""
 
+    def publish_event_json(self, channel: str, data: Dict):
+        """Enqueue the event directly, the redis queue messages are not pipelined."""
+        if not self.is_enabled:
+            return
+        self.publish_json(channel, data)
+
 
 def external_redis_communicator_factory(is_enabled: bool) -> ExternalConnectionCommunicator:
     """Return either a rq or pubsub based external communicator including aggregator utils."""
@@ -0,0 +1,102 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import json
+import logging
+from typing import Callable, Dict, List, Tuple, Union
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+JSONEncoder = Callable[[Dict], Union[str, bytes]]
+
+
+def _encode_with_orjson(data: Dict) -> Union[str, bytes]:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Fall back to json for the values that orjson does not support (e.g. big integers).
+        return json.dumps(data)
+
+
+JSON_ENCODERS: Dict[str, JSONEncoder] = {
+    "json": json.dumps,
+    "orjson": _encode_with_orjson,
+}
+
+
+def get_json_encoder(name: str) -> JSONEncoder:
+    """Return the JSON encoder with the given name, json.dumps if it is not available."""
+    if name == "orjson" and orjson is None:
+        log.warning("The orjson JSON encoder is not installed, json is used instead.")
+        return json.dumps
+    if name not in JSON_ENCODERS:
+        log.warning("Unknown JSON encoder %s, json is used instead.", name)
+        return json.dumps
+    return JSON_ENCODERS[name]
+
+
+class PipelinedEventPublisher:
+    """Collect the messages that are published on Redis channels (e.g. the events of the
+    external clients during a tick), and publish them all in one Redis pipeline on flush().
+
+    The pipeline does not use a transaction (MULTI / EXEC), it only sends all PUBLISH commands
+    in one round-trip. The messages are encoded when they are added, so later changes of the
+    published dicts do not change the messages, and are published in the order they were added.
+    """
+
+    def __init__(self, redis_db: Redis, json_encoder: JSONEncoder = json.dumps):
+        self.redis_db = redis_db
+        self.json_encoder = json_encoder
+        self._messages: List[Tuple[str, Union[str, bytes]]] = []
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def publish_json(self, channel: str, data: Dict) -> None:
+        """Add the json serializable dict to the messages of the next flush."""
+        self._messages.append((channel, self.json_encoder(data)))
+
+    def flush(self) -> None:
+        """Publish all collected messages in one pipeline. If publishing fails, it is retried
+        once, and the messages are dropped if the retry fails as well."""
+        if not self._messages:
+            return
+        messages, self._messages = self._messages, []
+        try:
+            self._publish(messages)
+        except RedisError as ex:
+            log.error("Publishing %s events via Redis failed, retrying. Exception: %s",
+                      len(messages), ex)
+            try:
+                self._publish(messages)
+            except RedisError as retry_ex:
+                log.error("Publishing %s events via Redis failed again, the events are dropped. "
+                          "Exception: %s", len(messages), retry_ex)
+
+    def _publish(self, messages: List[Tuple[str, Union[str, bytes]]]) -> None:
+        pipeline = self.redis_db.pipeline(transaction=False)
+        for channel, message in messages:
+            pipeline.publish(channel, message)
+        pipeline.execute()
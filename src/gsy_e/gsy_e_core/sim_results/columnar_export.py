@@ -0,0 +1,299 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_log = logging.getLogger(__name__)
+
+COLUMNAR_EXPORT_SUBDIR = "columnar"
+MANIFEST_FILE_NAME = "manifest.json"
+CSV_FILE_COLUMN = "csv_file"
+FILE_FORMAT_EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+
+def _import_pyarrow():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as ex:
+        raise ImportError("The columnar export requires pyarrow, "
+                          "please install it (pip install pyarrow).") from ex
+    return pyarrow
+
+
+def _get_column_type(value: Any) -> str:
+    """Return the name of the arrow type that stores the value without changing its str()."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "string"
+    if isinstance(value, int):
+        return "int64" if -2 ** 63 <= value < 2 ** 63 else "string"
+    if isinstance(value, float):
+        return "float64"
+    return "string"
+
+
+def _merge_column_types(column_type: str, other_column_type: str) -> str:
+    if column_type == "null":
+        return other_column_type
+    if other_column_type in ("null", column_type):
+        return column_type
+    return "string"
+
+
+class ColumnarTableWriter:
+    """Buffer the rows of one table and write them as Parquet / Arrow IPC row groups.
+
+    The column types are inferred from all rows of the table: columns that only contain integers
+    are stored as int64, columns that only contain floats as float64, and all other columns
+    (e.g. with mixed types) as strings (the str() of the value, which is also what the csv module
+    writes). If the rows of a later row group widen the type of a column, the row groups that were
+    already written are rewritten with the new types. As the types can only be widened, this
+    happens at most a few times per table.
+    """
+
+    def __init__(self, file_path: str, labels: Tuple[str, ...], file_format: str):
+        self._pa = _import_pyarrow()
+        self.file_path = file_path
+        self._labels = (CSV_FILE_COLUMN,) + tuple(labels)
+        self._file_format = file_format
+        self._columns: List[List] = [[] for _ in self._labels]
+        self._column_types = ["string"] + ["null"] * len(labels)
+        self._schema = None
+        self._writer = None
+
+    @property
+    def buffered_rows(self) -> int:
+        """Return the number of rows that were not written to the file yet."""
+        return len(self._columns[0])
+
+    def append(self, csv_file: str, row: Iterable) -> None:
+        """Buffer one row of the CSV file."""
+        for column, value in zip(self._columns, (csv_file, *row)):
+            column.append(value)
+
+    def _infer_column_types(self) -> List[str]:
+        column_types = []
+        for column, column_type in zip(self._columns, self._column_types):
+            for value in column:
+                if column_type == "string":
+                    break
+                column_type = _merge_column_types(column_type, _get_column_type(value))
+            column_types.append(column_type)
+        return column_types
+
+    def _create_schema(self):
+        pa = self._pa
+        return pa.schema([(label, getattr(pa, column_type)())
+                          for label, column_type in zip(self._labels, self._column_types)])
+
+    def _create_writer(self, file_path: str):
+        if self._file_format == "parquet":
+            return self._pa.parquet.ParquetWriter(file_path, self._schema)
+        return self._pa.ipc.new_file(file_path, self._schema)
+
+    def _to_table(self, columns: List[List]):
+        pa = self._pa
+        return pa.Table.from_arrays(
+            [pa.array([None if value is None else str(value) for value in column]
+                      if field.type == pa.string() else column, type=field.type)
+             for column, field in zip(columns, self._schema)],
+            schema=self._schema)
+
+    def _read_row_groups(self, file_path: str) -> Iterator[List[List]]:
+        pa = self._pa
+        with pa.OSFile(file_path, "rb") as source:
+            if self._file_format == "parquet":
+                parquet_file = pa.parquet.ParquetFile(source)
+                row_groups = (parquet_file.read_row_group(index)
+                              for index in range(parquet_file.num_row_groups))
+            else:
+                reader = pa.ipc.open_file(source)
+                row_groups = (reader.get_batch(index)
+                              for index in range(reader.num_record_batches))
+            for row_group in row_groups:
+                yield [row_group.column(index).to_pylist()
+                       for index in range(len(self._labels))]
+
+    def _rewrite_written_row_groups(self) -> None:
+        """Rewrite the row groups that were already written with the current schema."""
+        self._writer.close()
+        written_file_path = f"{self.file_path}.old"
+        os.replace(self.file_path, written_file_path)
+        self._writer = self._create_writer(self.file_path)
+        for columns in self._read_row_groups(written_file_path):
+            self._writer.write_table(self._to_table(columns))
+        os.remove(written_file_path)
+
+    def flush(self) -> None:
+        """Write the buffered rows as one row group."""
+        if not self.buffered_rows:
+            return
+        column_types = self._infer_column_types()
+        if self._schema is None or column_types != self._column_types:
+            self._column_types = column_types
+            self._schema = self._create_schema()
+            if self._writer is None:
+                self._writer = self._create_writer(self.file_path)
+            else:
+                self._rewrite_written_row_groups()
+        self._writer.write_table(self._to_table(self._columns))
+        self._columns = [[] for _ in self._labels]
+
+    def close(self) -> None:
+        """Write the remaining rows and close the file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ColumnarExportWriter:
+    """Export the rows of all CSV files of ExportAndPlot into a few columnar tables.
+
+    Instead of appending to one CSV file per area and market type on every market cycle, the rows
+    are buffered in one ColumnarTableWriter per table (e.g. trades, offers, bids, area stats) and
+    written as one row group every row_group_slots market slots. The CSV file that every row
+    belongs to is stored in the csv_file column, and the labels of each CSV file are stored in a
+    manifest, so that the CSV files can be recreated with convert_columnar_export_to_csv.
+    """
+
+    def __init__(self, directory: str, file_format: str = "parquet",
+                 row_group_slots: int = 96):
+        if file_format not in FILE_FORMAT_EXTENSIONS:
+            raise ValueError(f"Unsupported columnar export format {file_format}.")
+        _import_pyarrow()
+        self._root_directory = str(directory)
+        self._directory = os.path.join(self._root_directory, COLUMNAR_EXPORT_SUBDIR)
+        os.makedirs(self._directory, exist_ok=True)
+        self._file_format = file_format
+        self._row_group_slots = max(row_group_slots, 1)
+        self._slots_since_flush = 0
+        self._tables: Dict[Tuple[str, Tuple[str, ...]], ColumnarTableWriter] = {}
+        self._table_names: Dict[str, int] = defaultdict(int)
+        # CSV file path (relative to the export directory) -> table file name and labels
+        self._csv_files: Dict[str, Dict] = {}
+
+    def _get_table(self, table_name: str, labels: Tuple[str, ...]) -> ColumnarTableWriter:
+        table = self._tables.get((table_name, labels))
+        if table is None:
+            # Tables with the same name but different labels (e.g. the stats of different asset
+            # types) are written to separate files.
+            variant = self._table_names[table_name]
+            self._table_names[table_name] += 1
+            file_name = table_name if variant == 0 else f"{table_name}-{variant}"
+            table = ColumnarTableWriter(
+                os.path.join(self._directory,
+                             f"{file_name}.{FILE_FORMAT_EXTENSIONS[self._file_format]}"),
+                labels, self._file_format)
+            self._tables[(table_name, labels)] = table
+        return table
+
+    def write_rows(self, table_name: str, csv_file_path: str, labels: Tuple[str, ...],
+                   rows: Iterable[Iterable]) -> None:
+        """Buffer the rows that would have been appended to the CSV file."""
+        labels = tuple(labels)
+        csv_file = os.path.relpath(csv_file_path, self._root_directory)
+        table = self._get_table(table_name, labels)
+        if csv_file not in self._csv_files:
+            self._csv_files[csv_file] = {
+                "table": os.path.basename(table.file_path), "labels": list(labels)}
+        for row in rows:
+            table.append(csv_file, row)
+
+    def end_slot(self) -> None:
+        """Write the row groups of all tables every row_group_slots market slots."""
+        self._slots_since_flush += 1
+        if self._slots_since_flush >= self._row_group_slots:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows of all tables."""
+        for table in self._tables.values():
+            table.flush()
+        self._slots_since_flush = 0
+
+    def close(self) -> None:
+        """Write the remaining rows, close all tables and write the manifest."""
+        for table in self._tables.values():
+            table.close()
+        with open(os.path.join(self._directory, MANIFEST_FILE_NAME), "w",
+                  encoding="utf-8") as manifest_file:
+            json.dump({"format": self._file_format, "csv_files": self._csv_files},
+                      manifest_file, indent=2)
+
+
+def _read_table(file_path: str, file_format: str):
+    pa = _import_pyarrow()
+    if file_format == "parquet":
+        return pa.parquet.read_table(file_path)
+    with pa.memory_map(file_path, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def convert_columnar_export_to_csv(directory: str,
+                                   output_directory: Optional[str] = None) -> List[str]:
+    """Recreate the CSV files of ExportAndPlot from the columnar export of the directory.
+
+    Returns the paths of the created CSV files.
+    """
+    columnar_directory = os.path.join(directory, COLUMNAR_EXPORT_SUBDIR)
+    output_directory = output_directory or directory
+    with open(os.path.join(columnar_directory, MANIFEST_FILE_NAME), encoding="utf-8") as manifest:
+        manifest = json.load(manifest)
+
+    rows_per_csv_file = defaultdict(list)
+    for table_file in {csv_file["table"] for csv_file in manifest["csv_files"].values()}:
+        table_path = os.path.join(columnar_directory, table_file)
+        if not os.path.exists(table_path):
+            # No rows were exported for the CSV files of this table.
+            continue
+        table = _read_table(table_path, manifest["format"])
+        labels = table.column_names[1:]
+        for row in table.to_pylist():
+            rows_per_csv_file[row[CSV_FILE_COLUMN]].append([row[label] for label in labels])
+
+    csv_file_paths = []
+    for csv_file, csv_file_info in manifest["csv_files"].items():
+        csv_file_path = os.path.join(output_directory, csv_file)
+        os.makedirs(os.path.dirname(csv_file_path), exist_ok=True)
+        with open(csv_file_path, "w", encoding="utf-8") as output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(csv_file_info["labels"])
+            writer.writerows(rows_per_csv_file.get(csv_file, []))
+        csv_file_paths.append(csv_file_path)
+    return csv_file_paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert the columnar (Parquet / Arrow) export of a simulation to CSV files")
+    parser.add_argument("-d", "--directory", help="export directory of the simulation",
+                        type=str, required=True)
+    parser.add_argument("-o", "--output-directory", help="directory of the CSV files",
+                        type=str)
+    args = vars(parser.parse_args())
+    convert_columnar_export_to_csv(args["directory"], args["output_directory"])
@@ -17,7 +17,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, Iterable, List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set
 
 from gsy_framework.constants_limits import (
     DATE_TIME_FORMAT, DATE_TIME_UI_FORMAT, ConstSettings, GlobalConfig)
@@ -27,7 +27,9 @@ from gsy_framework.sim_results.all_results import ResultsHandler
 from gsy_framework.utils import get_json_dict_memory_allocation_size
 from pendulum import DateTime
 
+import gsy_e.constants
 from gsy_e.gsy_e_core.sim_results.offer_bids_trades_hr_stats import OfferBidTradeGraphStats
+from gsy_e.gsy_e_core.sim_results.results_delta import ResultsDeltaEncoder, get_results_size_kB
 from gsy_e.gsy_e_core.util import (get_feed_in_tariff_rate_from_config,
                                    get_market_maker_rate_from_config)
 from gsy_e.models.strategy.commercial_producer import CommercialStrategy
@@ -89,7 +91,15 @@ class SimulationEndpointBuffer:
         self.random_seed = random_seed if random_seed is not None else ""
         self.status = ""
         self.area_result_dict = self._create_area_tree_dict(area)
+        # Root area and topology version that self.area_result_dict was created for.
+        self._area_result_dict_topology = (area, getattr(area, "topology_version", None))
+        self._configuration_tree_changed = True
         self.flattened_area_core_stats_dict = {}
+        # Areas whose results changed since they were last validated (incremental validation).
+        self._changed_area_uuids: Set[str] = set()
+        self._updates_since_validation = 0
+        # Areas whose results were populated during the current update.
+        self._populated_area_uuids: Set[str] = set()
         self.simulation_progress = {
             "eta_seconds": 0,
             "elapsed_time_seconds": 0,
@@ -106,14 +116,25 @@ class SimulationEndpointBuffer:
         self.results_validator = None
         self._create_results_validator()
 
+        self._results_delta_encoder = (
+            ResultsDeltaEncoder(gsy_e.constants.KAFKA_RESULTS_KEYFRAME_INTERVAL)
+            if gsy_e.constants.KAFKA_RESULTS_DELTA_PUBLISHING else None)
+
     def prepare_results_for_publish(self) -> Dict:
         """Validate, serialise and check size of the results before sending to gsy-web."""
         result_report = self._generate_result_report()
 
-        message_size = get_json_dict_memory_allocation_size(result_report)
+        if self._results_delta_encoder is not None:
+            result_report = self._results_delta_encoder.encode(result_report)
+            message_size = get_results_size_kB(result_report)
+        else:
+            message_size = get_json_dict_memory_allocation_size(result_report)
         if message_size > 64000:
             logging.error("Do not publish message bigger than 64 MB, "
                           "current message size %s MB.", (message_size / 1000.0))
+            if self._results_delta_encoder is not None:
+                # The following deltas would be based on results that were never published.
+                self._results_delta_encoder.reset()
             return {}
         logging.debug("Publishing %s KB of data via Redis.", message_size)
         return result_report
@@ -134,11 +155,12 @@ class SimulationEndpointBuffer:
                      calculate_results: bool) -> None:
         # pylint: disable=too-many-arguments
         """Wrapper for handling of all results."""
-        self.area_result_dict = self._create_area_tree_dict(area)
+        self._update_area_result_dict(area)
         self.status = simulation_status
         self._calculate_and_update_last_market_time_slot(area)
         self.simulation_state["general"] = sim_state
         self._populate_core_stats_and_sim_state(area)
+        self._remove_results_of_removed_areas()
         self.simulation_progress = {
             "eta_seconds": progress_info.eta.seconds if progress_info.eta else None,
             "elapsed_time_seconds": progress_info.elapsed_time.seconds,
@@ -157,7 +179,60 @@ class SimulationEndpointBuffer:
         self.result_area_uuids = set()
         self._update_results_area_uuids(area)
 
-        self.validate_results()
+        self._validate_updated_results()
+
+    @staticmethod
+    def _is_incremental_validation_mode() -> bool:
+        return gsy_e.constants.RESULTS_VALIDATION_MODE in ("incremental", "sampled", "off")
+
+    def _update_area_result_dict(self, area: "AreaBase") -> None:
+        """Rebuild the configuration tree, unless it can be reused from the last update."""
+        topology = (area, getattr(area, "topology_version", None))
+        if (self._is_incremental_validation_mode() and
+                self._area_result_dict_topology[0] is topology[0] and
+                self._area_result_dict_topology[1] == topology[1]):
+            return
+        self.area_result_dict = self._create_area_tree_dict(area)
+        self._area_result_dict_topology = topology
+        self._configuration_tree_changed = True
+
+    def _set_area_core_stats_and_state(
+            self, area: "AreaBase", core_stats_dict: Dict, area_state: Dict) -> None:
+        """Store the results of the area, keeping track of the areas whose results changed."""
+        if self._is_incremental_validation_mode() and (
+                self.flattened_area_core_stats_dict.get(area.uuid) != core_stats_dict or
+                self.simulation_state["areas"].get(area.uuid) != area_state):
+            self._changed_area_uuids.add(area.uuid)
+        self.flattened_area_core_stats_dict[area.uuid] = core_stats_dict
+        self.simulation_state["areas"][area.uuid] = area_state
+        self._populated_area_uuids.add(area.uuid)
+
+    def _remove_results_of_removed_areas(self) -> None:
+        """Drop the results and state of the areas that were not populated during the update,
+        because they were removed from the grid (e.g. by a live event)."""
+        populated_area_uuids, self._populated_area_uuids = self._populated_area_uuids, set()
+        if not populated_area_uuids:
+            # The results were not populated, because the first market was not created yet.
+            return
+        for area_uuid in self.flattened_area_core_stats_dict.keys() - populated_area_uuids:
+            self.flattened_area_core_stats_dict.pop(area_uuid)
+            self.simulation_state["areas"].pop(area_uuid, None)
+            self._changed_area_uuids.discard(area_uuid)
+
+    def _validate_updated_results(self) -> None:
+        """Validate the results of the last update according to RESULTS_VALIDATION_MODE."""
+        validation_mode = gsy_e.constants.RESULTS_VALIDATION_MODE
+        if validation_mode == "off":
+            self._changed_area_uuids.clear()
+            return
+        if not self._is_incremental_validation_mode():
+            self.validate_results()
+            return
+        self._updates_since_validation += 1
+        if (validation_mode == "sampled" and self._updates_since_validation <
+                gsy_e.constants.RESULTS_VALIDATION_SAMPLING_INTERVAL):
+            return
+        self.validate_changed_results()
 
     def validate_results(self):
         """Validate updated stats and raise exceptions if they are not valid."""
@@ -166,6 +241,28 @@ class SimulationEndpointBuffer:
         self.results_validator.validate_configuration_tree(self.area_result_dict)
         self.results_validator.validate_simulation_state(self.simulation_state)
 
+    def validate_changed_results(self):
+        """Validate the stats that changed since the last validation.
+
+        Only the results of the areas that changed are validated, and the configuration tree only
+        if it was rebuilt. Raise exceptions if they are not valid.
+        """
+        changed_area_uuids = self._changed_area_uuids
+        self.results_validator.validate_simulation_raw_data(
+            {area_uuid: self.flattened_area_core_stats_dict[area_uuid]
+             for area_uuid in changed_area_uuids
+             if area_uuid in self.flattened_area_core_stats_dict})
+        if self._configuration_tree_changed:
+            self.results_validator.validate_configuration_tree(self.area_result_dict)
+        self.results_validator.validate_simulation_state({
+            **self.simulation_state,
+            "areas": {area_uuid: self.simulation_state["areas"][area_uuid]
+                      for area_uuid in changed_area_uuids
+                      if area_uuid in self.simulation_state["areas"]}})
+        self._changed_area_uuids = set()
+        self._configuration_tree_changed = False
+        self._updates_since_validation = 0
+
     def _create_results_validator(self):
         self.results_validator = SimulationResultValidator(is_scm=False)
 
@@ -366,9 +463,7 @@ class SimulationEndpointBuffer:
                 for trade in area.strategy.trades[area.parent.spot_market]:
                     core_stats_dict["trades"].append(trade.serializable_dict())
 
-        self.flattened_area_core_stats_dict[area.uuid] = core_stats_dict
-
-        self.simulation_state["areas"][area.uuid] = area.get_state()
+        self._set_area_core_stats_and_state(area, core_stats_dict, area.get_state())
 
         for child in area.children:
             self._populate_core_stats_and_sim_state(child)
@@ -456,9 +551,7 @@ class CoefficientEndpointBuffer(SimulationEndpointBuffer):
         else:
             core_stats_dict.update(area.get_results_dict())
 
-        self.flattened_area_core_stats_dict[area.uuid] = core_stats_dict
-
-        self.simulation_state["areas"][area.uuid] = area.get_state()
+        self._set_area_core_stats_and_state(area, core_stats_dict, area.get_state())
 
         for child in area.children:
             self._populate_core_stats_and_sim_state(child)
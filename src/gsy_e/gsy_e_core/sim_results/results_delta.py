@@ -0,0 +1,113 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import json
+from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+KEYFRAME_MESSAGE_TYPE = "keyframe"
+DELTA_MESSAGE_TYPE = "delta"
+
+
+def serialize_results(results: Dict) -> bytes:
+    """Serialise the results to JSON, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(results, default=str).encode("utf-8")
+
+
+def get_results_size_kB(results: Dict) -> float:  # pylint: disable=invalid-name
+    """Return the size of the serialised results in kB."""
+    return len(serialize_results(results)) / 1000.0
+
+
+class ResultsDeltaEncoder:
+    """Encode consecutive result reports of the SimulationEndpointBuffer as keyframes and deltas.
+
+    A keyframe is the full result report. A delta only contains the results and state of the
+    areas that changed since the previous report (which include their new trades), the ids of
+    the areas that were removed, and the small top-level fields (status, progress etc.).
+    A keyframe is sent every keyframe_interval reports, and whenever the configuration tree
+    changes. Every message has a sequence number, and deltas reference the sequence number of
+    the keyframe they are based on, so that consumers can detect gaps.
+    """
+
+    _AREA_RESULTS_KEYS = ("simulation_raw_data", "simulation_state", "configuration_tree")
+
+    def __init__(self, keyframe_interval: int):
+        self._keyframe_interval = max(keyframe_interval, 1)
+        self._sequence_number = -1
+        self._keyframe_sequence_number: Optional[int] = None
+        self._last_raw_data: Dict[str, Dict] = {}
+        self._last_area_states: Dict[str, Dict] = {}
+        self._last_configuration_tree: Optional[Dict] = None
+
+    def reset(self) -> None:
+        """Force the next encoded report to be a keyframe (e.g. if a message was not sent)."""
+        self._keyframe_sequence_number = None
+
+    def _should_send_keyframe(self, report: Dict) -> bool:
+        if self._keyframe_sequence_number is None:
+            return True
+        if self._sequence_number - self._keyframe_sequence_number >= self._keyframe_interval:
+            return True
+        configuration_tree = report["configuration_tree"]
+        return (configuration_tree is not self._last_configuration_tree and
+                configuration_tree != self._last_configuration_tree)
+
+    def encode(self, report: Dict) -> Dict:
+        """Return the message that should be published for the result report."""
+        self._sequence_number += 1
+        raw_data = report["simulation_raw_data"]
+        area_states = report["simulation_state"]["areas"]
+
+        if self._should_send_keyframe(report):
+            self._keyframe_sequence_number = self._sequence_number
+            message = {**report,
+                       "message_type": KEYFRAME_MESSAGE_TYPE,
+                       "sequence_number": self._sequence_number}
+        else:
+            message = {key: value for key, value in report.items()
+                       if key not in self._AREA_RESULTS_KEYS}
+            message.update({
+                "message_type": DELTA_MESSAGE_TYPE,
+                "sequence_number": self._sequence_number,
+                "keyframe_sequence_number": self._keyframe_sequence_number,
+                "simulation_raw_data": self._get_changed_entries(self._last_raw_data, raw_data),
+                "simulation_state": {
+                    **report["simulation_state"],
+                    "areas": self._get_changed_entries(self._last_area_states, area_states)},
+                "removed_area_uuids": sorted(
+                    (self._last_raw_data.keys() - raw_data.keys()) |
+                    (self._last_area_states.keys() - area_states.keys()))
+            })
+
+        # The endpoint buffer replaces (instead of mutating) the entries of the areas on every
+        # update, therefore a shallow copy is enough to keep track of the sent results.
+        self._last_raw_data = dict(raw_data)
+        self._last_area_states = dict(area_states)
+        self._last_configuration_tree = report["configuration_tree"]
+        return message
+
+    @staticmethod
+    def _get_changed_entries(last_entries: Dict[str, Dict], entries: Dict[str, Dict]) -> Dict:
+        return {area_uuid: entry for area_uuid, entry in entries.items()
+                if area_uuid not in last_entries or last_entries[area_uuid] != entry}
@@ -27,6 +27,7 @@ from gsy_framework.constants_limits import ConstSettings
 from numpy import random
 
 from gsy_e.gsy_e_core.exceptions import SimulationException
+from gsy_e.gsy_e_core.global_objects_singleton import global_objects
 from gsy_e.models.config import SimulationConfig
 
 if TYPE_CHECKING:
@@ -65,6 +66,7 @@ class SimulationSetup:
             seed = random_seed
             log.info("Random seed: %s", random_seed)
         self.seed = int(seed)
+        global_objects.fairness_scheduler.seed(self.seed)
 
     def _log_traversal_length(self, area: "Area") -> None:
         no_of_levels = self._get_setup_levels(area) + 1
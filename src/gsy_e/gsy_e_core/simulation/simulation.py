@@ -223,6 +223,7 @@ class Simulation:
                             current_tick_in_slot)):
                     global_objects.external_global_stats.update()
 
+                global_objects.fairness_scheduler.next_tick()
                 self.area.tick_and_dispatch()
                 self.area.execute_actions_after_tick_event()
                 bid_offer_matcher.event_tick(
@@ -252,6 +253,7 @@ class Simulation:
     def _simulation_stopped_finish_actions(self, slot_count: int, status="finished") -> None:
         self.status.sim_status = status
         self._deactivate_areas(self.area)
+        global_objects.profiles_handler.deactivate()
         self.config.external_redis_communicator.publish_aggregator_commands_responses_events()
         bid_offer_matcher.event_finish()
         if not self.status.stopped:
@@ -480,6 +482,7 @@ class CoefficientSimulation(Simulation):
 
             scm_manager = SCMManager(self.area, self._get_current_market_time_slot(slot_no))
 
+            global_objects.fairness_scheduler.next_tick()
             self.area.calculate_home_after_meter_data(
                 self.progress_info.current_slot_time, scm_manager)
 
@@ -518,6 +521,7 @@ class CoefficientSimulation(Simulation):
     def _simulation_stopped_finish_actions(self, slot_count: int, status="finished") -> None:
         self.status.sim_status = status
         self._deactivate_areas(self.area)
+        global_objects.profiles_handler.deactivate()
         self.config.external_redis_communicator.publish_aggregator_commands_responses_events()
         if not self.status.stopped:
             self.progress_info.update(
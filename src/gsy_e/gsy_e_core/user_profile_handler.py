@@ -18,11 +18,13 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import logging
 import os
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, TYPE_CHECKING, List, Optional
+from pathlib import PurePath
+from typing import Any, Callable, Dict, TYPE_CHECKING, Iterable, List, Optional, Set, Tuple
 
 import pytz
-from gsy_framework.constants_limits import GlobalConfig
+from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.read_user_profile import read_arbitrary_profile, InputProfileTypes
 from gsy_framework.utils import generate_market_slot_list
 from pendulum import DateTime, instance, duration
@@ -80,8 +82,12 @@ class ProfileDBConnectionHandler:
     def __init__(self):
         self._user_profiles: Dict[uuid.UUID, Dict[DateTime, float]] = {}
         self._profile_types: Dict[uuid.UUID, InputProfileTypes] = {}
-        self._buffered_times: List[DateTime] = []
+        self._buffered_times: Set[DateTime] = set()
         self._profile_uuids: Optional[List[uuid.UUID]] = []
+        # Profiles of the next window that are read in the background, as
+        # (time stamp of the window, profile uuids used in the setup, future of the handler)
+        self._prefetch: Optional[Tuple[DateTime, List, Future]] = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
 
     @staticmethod
     def _convert_pendulum_to_datetime(time_stamp):
@@ -161,11 +167,13 @@ class ProfileDBConnectionHandler:
             start_time (datetime): first timestamp of the queried profile chunks (TZ unaware)
             end_time (datetime): last timestamp of the queried profile chunks (TZ unaware)
 
-        Returns: A pony orm selection of the queried data
+        Returns: A pony orm selection of the (profile_uuid, time, value) tuples of the queried
+                 data, that are fetched as plain rows without creating entity objects
 
         """
         selection = select(
-            datapoint for datapoint in self.Profile_Database_ProfileTimeSeries
+            (datapoint.profile_uuid, datapoint.time, datapoint.value)
+            for datapoint in self.Profile_Database_ProfileTimeSeries
             if datapoint.profile_uuid in self._profile_uuids
             and datapoint.time >= start_time and datapoint.time <= end_time
         )
@@ -211,19 +219,34 @@ class ProfileDBConnectionHandler:
         start_time, end_time = self._get_start_end_time(current_timestamp)
         query_ret_val = self._get_profiles_from_db(self._convert_pendulum_to_datetime(start_time),
                                                    self._convert_pendulum_to_datetime(end_time))
-
-        for profile_uuid in self._profile_uuids:
-            self._user_profiles[profile_uuid] = {
-                self._strip_timezone_and_create_pendulum_instance_from_datetime(
-                    data_point.time): data_point.value
-                for data_point in query_ret_val if data_point.profile_uuid == profile_uuid
-            }
+        self._user_profiles.update(self._group_datapoints_by_profile(query_ret_val))
 
         for profile_uuid, profile_timeseries in self._user_profiles.items():
             if not profile_timeseries:
                 self._user_profiles[profile_uuid] = self.get_first_week_from_profile(
                     profile_uuid, current_timestamp)
 
+    def _group_datapoints_by_profile(
+            self, datapoints: Iterable[Tuple[uuid.UUID, datetime, float]]
+    ) -> Dict[uuid.UUID, Dict[DateTime, float]]:
+        """ Groups the (profile_uuid, time, value) rows of a query by the profile uuids used in
+        the setup, in a single pass over the rows. All profiles share the same time stamps,
+        thus each time stamp is converted to a pendulum instance only once.
+
+        """
+        profiles = {profile_uuid: {} for profile_uuid in self._profile_uuids}
+        time_stamps: Dict[datetime, DateTime] = {}
+        for profile_uuid, time, value in datapoints:
+            profile = profiles.get(profile_uuid)
+            if profile is None:
+                continue
+            time_stamp = time_stamps.get(time)
+            if time_stamp is None:
+                time_stamp = time_stamps[time] = (
+                    self._strip_timezone_and_create_pendulum_instance_from_datetime(time))
+            profile[time_stamp] = value
+        return profiles
+
     def _buffer_time_slots(self):
         """ Buffers a list of time_slots that are currently buffered in the user profiles.
         These are user to decide whether to rotate the buffer
@@ -231,9 +254,9 @@ class ProfileDBConnectionHandler:
         """
         if len(self._profile_uuids) > 0:
             time_stamps = self._user_profiles[self._profile_uuids[0]].keys()
-            self._buffered_times = list(time_stamps)
+            self._buffered_times = set(time_stamps)
         else:
-            self._buffered_times = []
+            self._buffered_times = set()
 
     @staticmethod
     def _get_start_end_time(current_timestamp: DateTime) -> (DateTime, DateTime):
@@ -264,10 +287,92 @@ class ProfileDBConnectionHandler:
 
         """
         if self._should_buffer_profiles(current_timestamp):
-            self.buffer_profile_types()
-            self._buffer_profile_uuid_list(uuids_used_in_setup)
-            self._buffer_all_profiles(current_timestamp)
-            self._buffer_time_slots()
+            if not self._swap_prefetched_profiles(current_timestamp, uuids_used_in_setup):
+                self.buffer_profile_types()
+                self._buffer_profile_uuid_list(uuids_used_in_setup)
+                self._buffer_all_profiles(current_timestamp)
+                self._buffer_time_slots()
+            if gsy_e.constants.PREFETCH_PROFILES_FROM_DB:
+                self._prefetch_next_profiles(current_timestamp, uuids_used_in_setup)
+
+    def _get_next_buffering_timestamp(self, current_timestamp: DateTime) -> Optional[DateTime]:
+        """Return the first market slot after the current one that is not buffered, None if it
+        is after the end of the simulation."""
+        if not self._buffered_times:
+            return None
+        next_timestamp = current_timestamp + GlobalConfig.slot_length
+        while next_timestamp in self._buffered_times:
+            next_timestamp += GlobalConfig.slot_length
+        if (not GlobalConfig.is_canary_network() and
+                next_timestamp >= GlobalConfig.start_date + GlobalConfig.sim_duration):
+            return None
+        return next_timestamp
+
+    def _prefetch_next_profiles(self, current_timestamp: DateTime,
+                                uuids_used_in_setup: List) -> None:
+        """ Starts reading the profiles of the window that follows the buffered one in a
+        background thread, while the buffered window is simulated.
+
+        """
+        next_timestamp = self._get_next_buffering_timestamp(current_timestamp)
+        if next_timestamp is None:
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="profiles-prefetch")
+        uuids_used_in_setup = list(uuids_used_in_setup)
+        self._prefetch = (next_timestamp, uuids_used_in_setup, self._prefetch_executor.submit(
+            self._read_profiles_from_db, next_timestamp, uuids_used_in_setup))
+
+    def stop_prefetching(self) -> None:
+        """ Cancels the prefetching of the profiles (if it did not start yet), and shuts down the
+        prefetching thread after waiting for a running prefetch to finish.
+
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            prefetch[2].cancel()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True)
+            self._prefetch_executor = None
+
+    def _read_profiles_from_db(self, current_timestamp: DateTime,
+                               uuids_used_in_setup: List) -> "ProfileDBConnectionHandler":
+        """Read all profile information from the DB into a new handler."""
+        handler = self.__class__()
+        handler.buffer_profile_types()
+        handler._buffer_profile_uuid_list(uuids_used_in_setup)
+        handler._buffer_all_profiles(current_timestamp)
+        handler._buffer_time_slots()
+        return handler
+
+    def _swap_prefetched_profiles(self, current_timestamp: DateTime,
+                                  uuids_used_in_setup: List) -> bool:
+        """ Replaces the buffered profiles with the prefetched ones, if they were read for the
+        current time stamp. Waits for the prefetching to finish if it is still running.
+
+        Returns: True if the prefetched profiles were used
+
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is None:
+            return False
+        prefetched_timestamp, prefetched_uuids, future = prefetch
+        if (prefetched_timestamp != current_timestamp or
+                prefetched_uuids != list(uuids_used_in_setup)):
+            future.cancel()
+            return False
+        try:
+            handler = future.result()
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Prefetching the profiles of %s failed, reading them again.",
+                          current_timestamp)
+            return False
+        self._profile_types.update(handler._profile_types)
+        self._profile_uuids = handler._profile_uuids
+        self._user_profiles.update(handler._user_profiles)
+        self._buffered_times = handler._buffered_times
+        return True
 
     def get_profile_type_from_db_buffer(self, profile_uuid: str) -> InputProfileTypes:
         """Read type of profile."""
@@ -286,6 +391,41 @@ class ProfileDBConnectionHandler:
         return self._user_profiles[uuid.UUID(profile_uuid)]
 
 
+class ReadOnlyProfile(dict):
+    """Profile (time slot -> value) that is shared between strategies, thus cannot be modified.
+
+    Copies of the profile (e.g. deep copies of a strategy) are plain dicts.
+    """
+    _content_key: Optional[frozenset] = None
+    _indexes: Optional[Dict[Callable, Any]] = None
+
+    @property
+    def content_key(self) -> frozenset:
+        """Hashable representation of the content of the profile."""
+        if self._content_key is None:
+            self._content_key = frozenset(self.items())
+        return self._content_key
+
+    def get_index(self, create_index: Callable[[Dict], Any]) -> Any:
+        """Return the index of the profile that is created by create_index. As the profile
+        cannot be modified, the index is created once and shared between the strategies."""
+        if self._indexes is None:
+            self._indexes = {}
+        if create_index not in self._indexes:
+            self._indexes[create_index] = create_index(self)
+        return self._indexes[create_index]
+
+    def _raise_read_only(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is shared between strategies and cannot be "
+                        "modified.")
+
+    __setitem__ = __delitem__ = __ior__ = _raise_read_only
+    pop = popitem = setdefault = update = clear = _raise_read_only
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
 class ProfilesHandler:
     """
     Handles profiles rotation of all profiles (stored in DB and in memory)
@@ -295,6 +435,8 @@ class ProfilesHandler:
         self._current_timestamp = GlobalConfig.start_date
         self._start_date = GlobalConfig.start_date
         self._duration = GlobalConfig.sim_duration
+        # Content-addressed cache of the profiles that were read from in-memory inputs
+        self._profile_cache: Dict[Tuple, ReadOnlyProfile] = {}
 
     def activate(self):
         """Connect to DB, update current timestamp and get the first chunk of data from the DB"""
@@ -303,6 +445,11 @@ class ProfilesHandler:
         if self.db:
             self.db.buffer_profile_types()
 
+    def deactivate(self):
+        """Stop the background reading of the profiles from the DB at the end of the simulation"""
+        if self.db:
+            self.db.stop_prefetching()
+
     def _connect_to_db(self):
         if gsy_e.constants.CONNECT_TO_PROFILES_DB:
             self.db = ProfileDBConnectionHandler()
@@ -314,6 +461,9 @@ class ProfilesHandler:
         return self._current_timestamp
 
     def _update_current_time(self, timestamp: DateTime):
+        if timestamp != self._current_timestamp:
+            # The cached profiles were read for another timestamp, thus cannot be reused.
+            self._profile_cache.clear()
         self._current_timestamp = timestamp
 
     def update_time_and_buffer_profiles(self, timestamp: DateTime, area: "Area") -> None:
@@ -333,9 +483,55 @@ class ProfilesHandler:
             return read_arbitrary_profile(profile_type,
                                           db_profile,
                                           current_timestamp=self.current_timestamp)
-        return read_arbitrary_profile(profile_type,
-                                      profile,
-                                      current_timestamp=self.current_timestamp)
+        return self.read_profile(profile_type, profile, current_timestamp=self.current_timestamp)
+
+    @staticmethod
+    def _get_profile_cache_key(profile_type: InputProfileTypes, profile,
+                               current_timestamp: Optional[DateTime]) -> Optional[Tuple]:
+        """Return the key of the profile input in the profile cache (None if not cacheable)."""
+        if not gsy_e.constants.DEDUPLICATE_PROFILES:
+            return None
+        if isinstance(profile, ReadOnlyProfile):
+            content = profile.content_key
+        elif isinstance(profile, dict):
+            try:
+                content = frozenset(profile.items())
+            except TypeError:
+                return None
+        elif isinstance(profile, (str, int, float, PurePath)):
+            content = profile
+        else:
+            return None
+        # The read profile also depends on the simulation settings, that the tests modify.
+        return (profile_type, type(profile), content, current_timestamp,
+                GlobalConfig.start_date, GlobalConfig.sim_duration, GlobalConfig.slot_length,
+                GlobalConfig.is_canary_network(),
+                ConstSettings.FutureMarketSettings.FUTURE_MARKET_DURATION_HOURS)
+
+    def read_profile(self, profile_type: InputProfileTypes, profile,
+                     current_timestamp: DateTime = None) -> Dict[DateTime, float]:
+        """ Wrapper of read_arbitrary_profile that reads every distinct input only once
+        All strategies with the same input (e.g. the same constant rate or profile file) share
+        the same read-only profile, which saves the memory and the time to read the profile
+        for every device of large setups.
+
+        Args:
+            profile_type (InputProfileTypes): Type of the profile
+            profile (any of str, dict, float): Any arbitrary input
+                                               (same input as for read_arbitrary_profile)
+            current_timestamp (DateTime): optional, start of the profile chunk
+
+        Returns: Profile chunk as dictionary
+
+        """
+        kwargs = {} if current_timestamp is None else {"current_timestamp": current_timestamp}
+        cache_key = self._get_profile_cache_key(profile_type, profile, current_timestamp)
+        if cache_key is None:
+            return read_arbitrary_profile(profile_type, profile, **kwargs)
+        if cache_key not in self._profile_cache:
+            self._profile_cache[cache_key] = ReadOnlyProfile(
+                read_arbitrary_profile(profile_type, profile, **kwargs))
+        return self._profile_cache[cache_key]
 
     def rotate_profile(self, profile_type: InputProfileTypes,
                        profile,
@@ -354,8 +550,8 @@ class ProfilesHandler:
 
         """
         if profile_uuid is None and self.should_create_profile(profile):
-            return read_arbitrary_profile(profile_type,
-                                          profile, current_timestamp=self.current_timestamp)
+            return self.read_profile(profile_type, profile,
+                                     current_timestamp=self.current_timestamp)
         if self.time_to_rotate_profile(profile):
             return self._read_new_datapoints_from_buffer_or_rotate_profile(
                 profile, profile_uuid, profile_type)
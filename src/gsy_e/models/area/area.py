@@ -15,6 +15,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+from collections import Counter
 from logging import getLogger
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
@@ -51,6 +52,34 @@ if TYPE_CHECKING:
     from gsy_e.models.strategy import BaseStrategy
     from gsy_e.models.strategy.trading_strategy_base import TradingStrategyBase
 
+_NOT_CACHED = object()
+
+
+class AreaPropertyCacheCounters:
+    """Count the accesses of the cached Area properties, in order to profile their overhead.
+    The accesses are only counted if COUNT_AREA_PROPERTY_CACHE_ACCESSES is enabled.
+
+    A hit is an access that was served from the cache, a miss one that had to recompute the
+    value (e.g. rebuild the market lists or perform the pendulum arithmetic).
+    """
+
+    def __init__(self):
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.hits.clear()
+        self.misses.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Return the counters per property."""
+        return {name: {"hits": self.hits[name], "misses": self.misses[name]}
+                for name in sorted(set(self.hits) | set(self.misses))}
+
+
+area_property_cache_counters = AreaPropertyCacheCounters()
+
 
 class Area(AreaBase):
     # pylint: disable=too-many-public-methods
@@ -77,6 +106,13 @@ class Area(AreaBase):
                          grid_fee_constant)
         self.display_type = "Area" if self.strategy is None else self.strategy.__class__.__name__
         self.current_tick = 0
+        # Cached values of the spot_market, last_past_market and now properties. The market
+        # caches are also keyed by the market dicts, their sizes and last time slots, the now
+        # cache by the tick, in order to stay valid if the markets / tick are changed outside
+        # of the market cycle.
+        self._spot_market_cache = (None, -1, None, _NOT_CACHED)
+        self._last_past_market_cache = (None, -1, None, _NOT_CACHED)
+        self._now_cache = (None, None, None, _NOT_CACHED)
         self.throughput = throughput
         event_list = event_list if event_list is not None else []
         self.events = Events(event_list, self)
@@ -175,6 +211,8 @@ class Area(AreaBase):
             self.current_tick = current_tick
 
         self._bc = blockchain_interface_factory(bc, self.uuid, simulation_id)
+        if self.children:
+            self._bc.activate([self.uuid] + [child.uuid for child in self.children])
 
         if self.strategy:
             if self.parent:
@@ -203,6 +241,9 @@ class Area(AreaBase):
     def deactivate(self):
         """Deactivate the area."""
         self.cycle_markets(deactivate=True)
+        if self._bc is not None:
+            # Wait for the pending trade settlements to be sent to the blockchain.
+            self._bc.deactivate()
         if self.redis_ext_conn is not None:
             self.redis_ext_conn.deactivate()
         if self.strategy:
@@ -219,6 +260,7 @@ class Area(AreaBase):
         `_trigger_event` is used internally to avoid multiple event chains during
         initial area activation.
         """
+        self._invalidate_cached_properties()
 
         current_tick_in_slot = int(self.current_tick % self.config.ticks_per_slot)
         tick_at_the_slot_start = self.current_tick - current_tick_in_slot
@@ -240,6 +282,7 @@ class Area(AreaBase):
 
         self.log.debug("Cycling markets")
         self._markets.rotate_markets(now_value)
+        self._invalidate_cached_properties()
 
         # create new future markets:
         if self.future_markets:
@@ -262,6 +305,7 @@ class Area(AreaBase):
         # TODO: Refactor and port the future, spot, settlement and balancing market creation to
         # AreaMarkets class, in order to create all necessary markets with one call.
         changed = self._markets.create_new_spot_market(now_value, AvailableMarketTypes.SPOT, self)
+        self._invalidate_cached_properties()
 
         # create new settlement market
         if (self.last_past_market and
@@ -367,6 +411,7 @@ class Area(AreaBase):
 
         """
         self.current_tick += 1
+        self._invalidate_cached_properties()
         self._consume_commands_from_aggregator()
         if self.children:
             self.spot_market.update_clock(self.now)
@@ -392,6 +437,12 @@ class Area(AreaBase):
             f"<Area '{self.name}' markets: "
             f"{[t.format(gsy_e.constants.TIME_FORMAT) for t in self._markets.markets]}>")
 
+    def _invalidate_cached_properties(self) -> None:
+        """Drop the cached market and time properties, they are recomputed on next access."""
+        self._spot_market_cache = (None, -1, None, _NOT_CACHED)
+        self._last_past_market_cache = (None, -1, None, _NOT_CACHED)
+        self._now_cache = (None, None, None, _NOT_CACHED)
+
     @property
     def all_markets(self):
         """Return all markets that the area is involved with."""
@@ -423,9 +474,18 @@ class Area(AreaBase):
         In this default implementation "current time" is defined by the number of ticks that
         have passed.
         """
-        return self.config.start_date.add(
-            seconds=self.config.tick_length.seconds * self.current_tick
-        )
+        config = self.config
+        current_tick, start_date, tick_length, now = self._now_cache
+        if (current_tick == self.current_tick and start_date is config.start_date and
+                tick_length is config.tick_length):
+            if gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES:
+                area_property_cache_counters.hits["now"] += 1
+            return now
+        if gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES:
+            area_property_cache_counters.misses["now"] += 1
+        now = config.start_date.add(seconds=config.tick_length.seconds * self.current_tick)
+        self._now_cache = (self.current_tick, config.start_date, config.tick_length, now)
+        return now
 
     @property
     def past_markets(self) -> List:
@@ -453,18 +513,25 @@ class Area(AreaBase):
     @property
     def spot_market(self):
         """Return the "current" market (i.e. the one currently "running")."""
-        try:
-            return self.all_markets[-1]
-        except IndexError:
-            return None
+        markets = self._markets.markets
+        last_time_slot = next(reversed(markets), None)
+        cached_markets, cached_size, cached_time_slot, spot_market = self._spot_market_cache
+        if (cached_markets is markets and cached_size == len(markets) and
+                cached_time_slot == last_time_slot):
+            if gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES:
+                area_property_cache_counters.hits["spot_market"] += 1
+            return spot_market
+        if gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES:
+            area_property_cache_counters.misses["spot_market"] += 1
+        spot_market = next(
+            (market for market in reversed(markets.values()) if market.in_sim_duration), None)
+        self._spot_market_cache = (markets, len(markets), last_time_slot, spot_market)
+        return spot_market
 
     @property
     def current_market(self):
         """Return the "most recent past market" (the one that has been finished last)."""
-        try:
-            return list(self._markets.past_markets.values())[-1]
-        except IndexError:
-            return None
+        return self.last_past_market
 
     @property
     def current_balancing_market(self):
@@ -493,10 +560,21 @@ class Area(AreaBase):
     @property
     def last_past_market(self):
         """Return the most recent of the area's past markets."""
-        try:
-            return list(self._markets.past_markets.values())[-1]
-        except IndexError:
-            return None
+        past_markets = self._markets.past_markets
+        last_time_slot = next(reversed(past_markets), None)
+        cached_markets, cached_size, cached_time_slot, last_past_market = (
+            self._last_past_market_cache)
+        if (cached_markets is past_markets and cached_size == len(past_markets) and
+                cached_time_slot == last_time_slot):
+            if gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES:
+                area_property_cache_counters.hits["last_past_market"] += 1
+            return last_past_market
+        if gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES:
+            area_property_cache_counters.misses["last_past_market"] += 1
+        last_past_market = past_markets[last_time_slot] if past_markets else None
+        self._last_past_market_cache = (
+            past_markets, len(past_markets), last_time_slot, last_past_market)
+        return last_past_market
 
     @property
     def future_market_time_slots(self) -> List[DateTime]:
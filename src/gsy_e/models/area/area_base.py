@@ -16,7 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 from logging import getLogger
-from typing import TYPE_CHECKING, List, Union, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Optional
 from uuid import uuid4
 
 from gsy_framework.area_validator import validate_area
@@ -56,10 +56,15 @@ def check_area_name_exists_in_parent_area(parent_area, name):
 
 
 class AreaChildrenList(list):
-    """Class to define the children of an area."""
+    """Class to define the children of an area.
+
+    The version is incremented on every change of the list, so that indexes of the children
+    (e.g. the trader index of the AreaDispatcher) can detect that they need to be rebuilt.
+    """
 
     def __init__(self, parent_area, *args, **kwargs):
         self.parent_area = parent_area
+        self.version = 0
         super().__init__(*args, **kwargs)
 
     def _validate_before_insertion(self, item):
@@ -69,10 +74,88 @@ class AreaChildrenList(list):
     def append(self, item: "Area") -> None:
         self._validate_before_insertion(item)
         super().append(item)
+        self.version += 1
 
     def insert(self, index, item):
         self._validate_before_insertion(item)
         super().insert(index, item)
+        self.version += 1
+
+    def extend(self, items):
+        super().extend(items)
+        self.version += 1
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def remove(self, item):
+        super().remove(item)
+        self.version += 1
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def __setitem__(self, index, item):
+        super().__setitem__(index, item)
+        self.version += 1
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.version += 1
+
+
+class AreaUUIDIndex:
+    """Index of the areas of a subtree of the grid, keyed by area uuid.
+
+    The index is maintained explicitly when areas are added or removed via the live events.
+    Areas that are attached to the tree by other means are found by rebuilding the index when
+    a uuid is not found in it.
+    """
+
+    def __init__(self, root_area: "AreaBase"):
+        self._root_area = root_area
+        self._areas: Dict[str, "AreaBase"] = {}
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self._areas)
+
+    def rebuild(self) -> None:
+        """Rebuild the index by traversing the whole subtree."""
+        self._areas = {}
+        self.add(self._root_area)
+
+    def add(self, area: "AreaBase") -> None:
+        """Add an area and all its descendants to the index."""
+        areas_to_visit = [area]
+        while areas_to_visit:
+            area = areas_to_visit.pop()
+            self._areas[area.uuid] = area
+            areas_to_visit.extend(area.children)
+
+    def remove(self, area: "AreaBase") -> None:
+        """Remove an area and all its descendants from the index."""
+        areas_to_visit = [area]
+        while areas_to_visit:
+            area = areas_to_visit.pop()
+            if self._areas.get(area.uuid) is area:
+                del self._areas[area.uuid]
+            areas_to_visit.extend(area.children)
+
+    def get(self, area_uuid: str) -> Optional["AreaBase"]:
+        """Return the area with the given uuid, or None if it is not part of the subtree."""
+        area = self._areas.get(area_uuid)
+        if area is None:
+            self.rebuild()
+            area = self._areas.get(area_uuid)
+        return area
 
 
 class AreaBase:
@@ -112,6 +195,21 @@ class AreaBase:
         self._config = config
         self._set_grid_fees(grid_fee_constant, grid_fee_percentage)
         self.current_market_time_slot = None
+        self._area_uuid_index: Optional[AreaUUIDIndex] = None
+        # Incremented when a live event changes the tree, in order for the results of the tree to
+        # be rebuilt. Only maintained on the root area.
+        self.topology_version = 0
+
+    @property
+    def area_uuid_index(self) -> AreaUUIDIndex:
+        """Return the uuid index of the areas of the subtree (built on first access)."""
+        if self._area_uuid_index is None:
+            self._area_uuid_index = AreaUUIDIndex(self)
+        return self._area_uuid_index
+
+    def get_area_by_uuid(self, area_uuid: str) -> Optional["AreaBase"]:
+        """Return the area of the subtree that has the given uuid, None if there is none."""
+        return self.area_uuid_index.get(area_uuid)
 
     @property
     def now(self) -> DateTime:
@@ -21,9 +21,9 @@ from typing import TYPE_CHECKING, List, Optional
 
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.utils import key_in_dict_and_not_none
-from numpy.random import random
 from pendulum import DateTime
 
+from gsy_e.gsy_e_core.global_objects_singleton import global_objects
 from gsy_e.models.area.area_base import AreaBase
 from gsy_e.models.config import SimulationConfig
 from gsy_e.models.strategy.external_strategies import ExternalMixin
@@ -164,14 +164,14 @@ class CoefficientArea(AreaBase):
         """Recursive function that calculates the home after meter data."""
         if self._is_home_area():
             self._calculate_home_after_meter_data(current_time_slot, scm_manager)
-        for child in sorted(self.children, key=lambda _: random()):
+        for child in global_objects.fairness_scheduler.shuffled(self.uuid, self.children):
             child.calculate_home_after_meter_data(current_time_slot, scm_manager)
 
     def trigger_energy_trades(self, scm_manager: "SCMManager") -> None:
         """Recursive function that triggers energy trading on all children of the root area."""
         if self._is_home_area():
             scm_manager.calculate_home_energy_bills(self.uuid)
-        for child in sorted(self.children, key=lambda _: random()):
+        for child in global_objects.fairness_scheduler.shuffled(self.uuid, self.children):
             child.trigger_energy_trades(scm_manager)
 
     @property
@@ -13,8 +13,15 @@ _deserialize_event = {
 
 
 def assign_events_to_areas(area, area_events, settings_events):
-    selected_events = [event for event in area_events
-                       if "area_uuid" in event and event["area_uuid"] == area.uuid]
+    area_events_per_uuid = {}
+    for event in area_events:
+        if "area_uuid" in event:
+            area_events_per_uuid.setdefault(event["area_uuid"], []).append(event)
+    _assign_events_to_areas(area, area_events_per_uuid, settings_events)
+
+
+def _assign_events_to_areas(area, area_events_per_uuid, settings_events):
+    selected_events = area_events_per_uuid.get(area.uuid, [])
     event_list = deepcopy(settings_events)
     if len(selected_events) == 1:
         selected_events = selected_events[0]
@@ -31,7 +38,7 @@ def assign_events_to_areas(area, area_events, settings_events):
     if not area.children:
         return
     for child in area.children:
-        assign_events_to_areas(child, area_events, settings_events)
+        _assign_events_to_areas(child, area_events_per_uuid, settings_events)
 
 
 def generate_settings_events(settings_events):
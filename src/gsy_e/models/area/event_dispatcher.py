@@ -16,17 +16,18 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 from logging import getLogger
-from typing import Union, Dict, TYPE_CHECKING, Optional
+from typing import Union, Dict, TYPE_CHECKING, Optional, List, Set
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.enums import AvailableMarketTypes
 from gsy_framework.enums import SpotMarketTypeEnum
-from numpy.random import random
 from pendulum import DateTime
 
+from gsy_e import constants
 from gsy_e.events.event_structures import MarketEvent, AreaEvent
 from gsy_e.gsy_e_core.enums import FORWARD_MARKET_TYPES
 from gsy_e.gsy_e_core.exceptions import WrongMarketTypeException
+from gsy_e.gsy_e_core.global_objects_singleton import global_objects
 from gsy_e.gsy_e_core.redis_connections.area_market import RedisCommunicator
 from gsy_e.models.area.redis_dispatcher.area_event_dispatcher import RedisAreaEventDispatcher
 from gsy_e.models.area.redis_dispatcher.area_to_market_publisher import AreaToMarketEventPublisher
@@ -49,6 +50,41 @@ log = getLogger(__name__)
 
 EVENT_DISPATCHING_VIA_REDIS = ConstSettings.GeneralSettings.EVENT_DISPATCHING_VIA_REDIS
 
+# Events that only concern the traders of the order / trade, mapped to the event argument that
+# contains the order / trade.
+TRADER_EVENT_ARGUMENTS = {
+    MarketEvent.OFFER_TRADED: "trade",
+    MarketEvent.BID_TRADED: "bid_trade",
+    MarketEvent.OFFER_SPLIT: "original_offer",
+    MarketEvent.BID_SPLIT: "original_bid",
+}
+
+
+def _get_trader_keys(event_type: MarketEvent, kwargs: Dict) -> Optional[Set[str]]:
+    """Return the names and uuids of the traders of the order / trade of the event, None if
+    they can not be determined."""
+    order_or_trade = kwargs.get(TRADER_EVENT_ARGUMENTS[event_type])
+    if order_or_trade is None:
+        return None
+    if event_type is MarketEvent.OFFER_SPLIT:
+        traders = [order_or_trade.seller]
+    elif event_type is MarketEvent.BID_SPLIT:
+        traders = [order_or_trade.buyer]
+    else:
+        traders = [order_or_trade.seller, order_or_trade.buyer]
+        match_details = order_or_trade.match_details or {}
+        if match_details.get("offer") is not None:
+            traders.append(match_details["offer"].seller)
+        if match_details.get("bid") is not None:
+            traders.append(match_details["bid"].buyer)
+    trader_keys = set()
+    for trader in traders:
+        if trader is None:
+            continue
+        trader_keys.update((trader.name, trader.uuid, trader.origin, trader.origin_uuid))
+    trader_keys.discard(None)
+    return trader_keys
+
 
 class AreaDispatcher:
     """
@@ -63,6 +99,12 @@ class AreaDispatcher:
         self._future_agent: Optional[FutureAgent] = None
         self._forward_agents: Optional[Dict[AvailableMarketTypes, FutureAgent]] = {}
         self.area = area
+        # Index of the children of the area that receive the trader events, see
+        # _get_children_for_trader_event
+        self._indexed_children: Optional[List["Area"]] = None
+        self._indexed_children_version: Optional[int] = None
+        self._children_per_trader: Dict[str, "Area"] = {}
+        self._trade_observer_children: List["Area"] = []
 
     @property
     def spot_agents(self) -> Dict[DateTime, OneSidedAgent]:
@@ -140,7 +182,8 @@ class AreaDispatcher:
         if not self.area.events.is_connected:
             return
 
-        for child in sorted(self.area.children, key=lambda _: random()):
+        for child in global_objects.fairness_scheduler.shuffled(
+                self.area.uuid, self.area.children):
             if not child.children:
                 continue
             self._broadcast_notification_to_single_agent(
@@ -174,8 +217,12 @@ class AreaDispatcher:
                 event_type not in [AreaEvent.ACTIVATE, AreaEvent.MARKET_CYCLE]):
             return
 
+        children = self.area.children
+        if event_type in TRADER_EVENT_ARGUMENTS and constants.ROUTE_TRADE_EVENTS_TO_TRADERS:
+            children = self._get_children_for_trader_event(event_type, kwargs)
+
         # Broadcast to children in random order to ensure fairness
-        for child in sorted(self.area.children, key=lambda _: random()):
+        for child in global_objects.fairness_scheduler.shuffled(self.area.uuid, children):
             child.dispatcher.event_listener(event_type, **kwargs)
 
         # TODO: Enable the following block once GSYE-340 is implemented
@@ -204,6 +251,43 @@ class AreaDispatcher:
             self._broadcast_notification_to_area_and_child_agents(
                 AvailableMarketTypes.FUTURE, event_type, **kwargs)
 
+    def _update_children_index(self) -> None:
+        children = self.area.children
+        version = getattr(children, "version", None)
+        if (version is not None and children is self._indexed_children and
+                version == self._indexed_children_version):
+            return
+        self._indexed_children = children
+        self._indexed_children_version = version
+        self._children_per_trader = {}
+        self._trade_observer_children = []
+        for child in children:
+            if child.strategy is None or child.strategy.observes_all_trades:
+                self._trade_observer_children.append(child)
+            else:
+                self._children_per_trader[child.name] = child
+                self._children_per_trader[child.uuid] = child
+
+    def _get_children_for_trader_event(
+            self, event_type: MarketEvent, kwargs: Dict) -> List["Area"]:
+        """
+        Return the children of the area that should receive the trade / split event: the
+        children whose strategy took part in the trade (looked up by the names and uuids of the
+        traders), the children whose strategy observes all trades and the children without a
+        strategy (that forward the event to nobody). The index of the children is rebuilt when
+        the children of the area change.
+        """
+        trader_keys = _get_trader_keys(event_type, kwargs)
+        if trader_keys is None:
+            return self.area.children
+        self._update_children_index()
+        children = list(self._trade_observer_children)
+        for trader_key in trader_keys:
+            child = self._children_per_trader.get(trader_key)
+            if child is not None and child not in children:
+                children.append(child)
+        return children
+
     def _should_dispatch_to_strategies(self, event_type: Union[AreaEvent, MarketEvent]) -> bool:
         if event_type is AreaEvent.ACTIVATE:
             return True
@@ -37,6 +37,9 @@ from gsy_e.models.market.grid_fees.constant_grid_fees import ConstantGridFees
 from gsy_e.models.market.market_redis_connection import (
     MarketRedisEventSubscriber, MarketRedisEventPublisher,
     TwoSidedMarketRedisEventSubscriber)
+from gsy_e.models.market.market_trades import MarketTrades
+from gsy_e.models.market.order_book_index import OrderBookView
+from gsy_e.models.market.versioned_orders import VersionedOrders
 
 if TYPE_CHECKING:
     from gsy_e.models.config import SimulationConfig
@@ -97,12 +100,14 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
         self.time_slot = time_slot
         self.readonly = readonly
         # offer-id -> Offer
-        self.offers: Dict[str, Offer] = {}
+        self.offers: Dict[str, Offer] = VersionedOrders()
         self.offer_history: List[Offer] = []
         self.notification_listeners: List[Callable] = []
-        self.bids: Dict[str, Bid] = {}
+        self.bids: Dict[str, Bid] = VersionedOrders()
         self.bid_history: List[Bid] = []
-        self.trades: List[Trade] = []
+        # order-id -> index of the order in offer_history / bid_history
+        self._order_history_indexes: Dict[str, int] = {}
+        self._trades = MarketTrades()
         self.const_fee_rate: Optional[float] = None
         self.now: DateTime = time_slot
 
@@ -130,6 +135,16 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
 
         self._open_market_slot_parameters: Dict[DateTime, MarketSlotParams] = {}
         self.no_new_order = True
+        self._order_book_view = OrderBookView(self._get_order_time_slot_str)
+
+    @property
+    def trades(self) -> MarketTrades:
+        """Return the trades of the market, indexed by the names of the traders."""
+        return self._trades
+
+    @trades.setter
+    def trades(self, trades: List[Trade]) -> None:
+        self._trades = MarketTrades(trades)
 
     @property
     def time_slot_str(self):
@@ -202,6 +217,16 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
         offers = [offer.serializable_dict() for offer in self.offers.values()]
         return {self.time_slot_str: {"bids": bids, "offers": offers}}
 
+    def _get_order_time_slot_str(self, _order: Union[Bid, Offer]) -> str:
+        """Return the time slot string that the order is grouped under in orders_per_slot."""
+        return self.time_slot_str
+
+    @property
+    def order_book_view(self) -> OrderBookView:
+        """Return the view of the open orders, synchronised with the current orders."""
+        self._order_book_view.refresh(self.bids, self.offers)
+        return self._order_book_view
+
     def add_listener(self, listener: Callable):
         """Append a callable function to the notification_listeners list."""
         self.notification_listeners.append(listener)
@@ -216,6 +241,30 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
             for listener in sorted(self.notification_listeners, key=lambda l: random()):
                 listener(event, market_id=self.id, **kwargs)
 
+    def _add_order_to_history(
+            self, history: List[Union[Offer, Bid]], order: Union[Offer, Bid]) -> None:
+        """Append the order to the offer / bid history."""
+        self._order_history_indexes[order.id] = len(history)
+        history.append(order)
+
+    def _replace_order_in_history(
+            self, history: List[Union[Offer, Bid]], order: Union[Offer, Bid]) -> None:
+        """Replace the order with the same id in the offer / bid history (e.g. when it is
+        amended). Orders that were not added to the history are not added."""
+        index = self._order_history_indexes.get(order.id)
+        if index is None:
+            return
+        if index >= len(history) or history[index].id != order.id:
+            # The history was modified (e.g. the orders of past slots were removed), reindex it.
+            self._order_history_indexes = {
+                history_order.id: history_index
+                for orders in (self.offer_history, self.bid_history)
+                for history_index, history_order in enumerate(orders)}
+            index = self._order_history_indexes.get(order.id)
+            if index is None:
+                return
+        history[index] = order
+
     def _update_stats_after_trade(
             self, trade: Trade, order: Union[Offer, Bid]) -> None:
         """Update the instance state in response to an occurring trade."""
@@ -273,21 +322,21 @@ class MarketBase:  # pylint: disable=too-many-instance-attributes
     def bought_energy(self, buyer: str) -> float:
         """Return the aggregated bought energy value by the passed-in buyer."""
 
-        return sum(trade.traded_energy for trade in self.trades if trade.buyer.name == buyer)
+        return self.trades.stats_of_trader(buyer).bought_energy
 
     def sold_energy(self, seller: str) -> float:
         """Return the aggregated sold energy value by the passed-in seller."""
 
-        return sum(trade.traded_energy for trade in self.trades if trade.seller.name == seller)
+        return self.trades.stats_of_trader(seller).sold_energy
 
     def total_spent(self, buyer: str) -> float:
         """Return the aggregated money spent by the passed-in buyer."""
 
-        return sum(trade.trade_price for trade in self.trades if trade.buyer.name == buyer)
+        return self.trades.stats_of_trader(buyer).total_spent
 
     def total_earned(self, seller: str) -> float:
         """Return the aggregated money earned by the passed-in seller."""
-        return sum(trade.trade_price for trade in self.trades if trade.seller.name == seller)
+        return self.trades.stats_of_trader(seller).total_earned
 
     @staticmethod
     def _calculate_closing_time(delivery_time: DateTime) -> DateTime:
@@ -90,7 +90,7 @@ class BalancingMarket(OneSidedMarket):
             time_slot=self.time_slot)
         self.offers[offer.id] = offer
 
-        self.offer_history.append(offer)
+        self._add_order_to_history(self.offer_history, offer)
         log.debug("[BALANCING_OFFER][NEW][%s] %s", self.time_slot_str, offer)
         if dispatch_event is True:
             self._notify_listeners(MarketEvent.BALANCING_OFFER, offer=offer)
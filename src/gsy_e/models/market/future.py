@@ -19,7 +19,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from collections import UserDict
 from copy import deepcopy
 from logging import getLogger
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING, Union
 
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig, DATE_TIME_FORMAT
 from gsy_framework.data_classes import Bid, Offer, Trade, TraderDetails
@@ -29,6 +29,7 @@ from pendulum import DateTime, duration
 from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
 from gsy_e.models.market import GridFee, lock_market_action, MarketSlotParams
 from gsy_e.models.market.two_sided import TwoSidedMarket
+from gsy_e.models.market.versioned_orders import VersionedOrdersMixin
 
 if TYPE_CHECKING:
     from gsy_e.models.area.event_dispatcher import AreaDispatcher
@@ -41,7 +42,7 @@ class FutureMarketException(Exception):
     """Exception specific to the Future markets."""
 
 
-class FutureOrders(UserDict):
+class FutureOrders(VersionedOrdersMixin, UserDict):
     """Special mapping object to keep track of a future market's orders."""
     def __init__(self, *args, **kwargs):
         self.slot_order_mapping = {}
@@ -52,12 +53,14 @@ class FutureOrders(UserDict):
         if order.time_slot not in self.slot_order_mapping:
             self.slot_order_mapping[order.time_slot] = []
         self.slot_order_mapping[order.time_slot].append(order)
+        self._increment_version()
 
     def __delitem__(self, order_id):
         order = self.data.get(order_id, None)
         if order:
             self.slot_order_mapping[order.time_slot].remove(order)
         del self.data[order_id]
+        self._increment_version()
 
 
 class FutureMarkets(TwoSidedMarket):
@@ -159,6 +162,9 @@ class FutureMarkets(TwoSidedMarket):
                 [offer.serializable_dict() for offer in offers_list])
         return orders_dict
 
+    def _get_order_time_slot_str(self, order: Union[Bid, Offer]) -> str:
+        return order.time_slot.format(DATE_TIME_FORMAT)
+
     @staticmethod
     def _remove_old_orders_from_list(order_list: List, current_market_time_slot: DateTime) -> List:
         return [
@@ -0,0 +1,126 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from gsy_framework.data_classes import Trade
+
+
+class TraderTradeStats:
+    """Running aggregates of the trades of one trader in a market."""
+
+    __slots__ = ("bought_energy", "sold_energy", "total_spent", "total_earned")
+
+    def __init__(self):
+        self.bought_energy = 0
+        self.sold_energy = 0
+        self.total_spent = 0
+        self.total_earned = 0
+
+
+class MarketTrades(list):
+    """List of the trades of a market, indexed by the names of the traders.
+
+    Every appended trade is registered to the trades of its seller and its buyer, and the sold /
+    bought energy and the earned / spent money of both are updated. Therefore, the trades and
+    the aggregates of a trader are available without iterating over all trades of the market.
+    The aggregates are summed in the same order as the trades, thus they are identical to the
+    sums over the list of trades. All modifications other than append / extend (e.g. removal of
+    the trades of past market slots) rebuild the index.
+    """
+
+    def __init__(self, trades: Iterable["Trade"] = ()):
+        super().__init__()
+        self._trades_by_trader: Dict[str, List["Trade"]] = {}
+        self._stats_by_trader: Dict[str, TraderTradeStats] = {}
+        self.extend(trades)
+
+    def __reduce__(self):
+        # The index is rebuilt from the trades when the object is copied / unpickled.
+        return self.__class__, (list(self),)
+
+    def _register(self, trade: "Trade") -> None:
+        seller = trade.seller.name
+        buyer = trade.buyer.name
+        for trader in (seller,) if seller == buyer else (seller, buyer):
+            self._trades_by_trader.setdefault(trader, []).append(trade)
+        seller_stats = self._stats_by_trader.setdefault(seller, TraderTradeStats())
+        seller_stats.sold_energy += trade.traded_energy
+        seller_stats.total_earned += trade.trade_price
+        buyer_stats = self._stats_by_trader.setdefault(buyer, TraderTradeStats())
+        buyer_stats.bought_energy += trade.traded_energy
+        buyer_stats.total_spent += trade.trade_price
+
+    def _rebuild_index(self) -> None:
+        self._trades_by_trader = {}
+        self._stats_by_trader = {}
+        for trade in self:
+            self._register(trade)
+
+    def append(self, trade: "Trade") -> None:
+        super().append(trade)
+        self._register(trade)
+
+    def extend(self, trades: Iterable["Trade"]) -> None:
+        for trade in trades:
+            self.append(trade)
+
+    def __iadd__(self, trades: Iterable["Trade"]) -> "MarketTrades":
+        self.extend(trades)
+        return self
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._rebuild_index()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._rebuild_index()
+
+    def insert(self, index, trade: "Trade") -> None:
+        super().insert(index, trade)
+        self._rebuild_index()
+
+    def pop(self, *args) -> "Trade":
+        trade = super().pop(*args)
+        self._rebuild_index()
+        return trade
+
+    def remove(self, trade: "Trade") -> None:
+        super().remove(trade)
+        self._rebuild_index()
+
+    def clear(self) -> None:
+        super().clear()
+        self._rebuild_index()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild_index()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._rebuild_index()
+
+    def of_trader(self, trader_name: str) -> List["Trade"]:
+        """Return the trades in which the trader is the seller or the buyer."""
+        return self._trades_by_trader.get(trader_name, [])
+
+    def stats_of_trader(self, trader_name: str) -> TraderTradeStats:
+        """Return the aggregated energy and money traded by the trader."""
+        return self._stats_by_trader.get(trader_name) or TraderTradeStats()
@@ -15,10 +15,9 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from copy import deepcopy
 from logging import getLogger
 from math import isclose
-from typing import Union, Dict, Optional, Callable, Tuple
+from typing import Union, Mapping, Optional, Callable, Tuple
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.data_classes import Offer, Trade, TradeBidOfferInfo, TraderDetails, Bid
@@ -33,6 +32,7 @@ from gsy_e.gsy_e_core.exceptions import (
     NegativePriceOrdersException, NegativeEnergyOrderException)
 from gsy_e.gsy_e_core.util import short_offer_bid_log_str
 from gsy_e.models.market import MarketBase, lock_market_action, GridFee
+from gsy_e.models.market.versioned_orders import get_orders_snapshot
 
 log = getLogger(__name__)
 
@@ -86,16 +86,17 @@ class OneSidedMarket(MarketBase):
             limit_float_precision(original_price / energy)) * energy
 
     @lock_market_action
-    def get_offers(self) -> Dict:
+    def get_offers(self) -> Mapping[str, Offer]:
         """
-        Retrieves a copy of all open offers of the market. The copy of the offers guarantees
-        that the return dict will remain unaffected from any mutations of the market offer list
-        that might happen concurrently (more specifically can be used in for loops without raising
-        the 'dict changed size during iteration' exception)
-        Returns: dict with open offers, offer id as keys, and Offer objects as values
+        Retrieves a read-only snapshot of all open offers of the market. The snapshot guarantees
+        that the returned mapping will remain unaffected from any mutations of the market offer
+        list that might happen concurrently (more specifically can be used in for loops without
+        raising the 'dict changed size during iteration' exception). The snapshot is shared by all
+        callers until the offers of the market change, therefore it should not be modified.
+        Returns: mapping with open offers, offer id as keys, and Offer objects as values
 
         """
-        return deepcopy(self.offers)
+        return get_orders_snapshot(self.offers)
 
     @lock_market_action
     def offer(  # pylint: disable=too-many-arguments, too-many-locals
@@ -133,7 +134,7 @@ class OneSidedMarket(MarketBase):
 
         self.offers[offer.id] = offer
         if add_to_history is True:
-            self.offer_history.append(offer)
+            self._add_order_to_history(self.offer_history, offer)
 
         log.debug("%s[OFFER][NEW][%s][%s] %s",
                   self._debug_log_market_type_identifier, self.name,
@@ -148,6 +149,41 @@ class OneSidedMarket(MarketBase):
 
         self._notify_listeners(MarketEvent.OFFER, offer=offer)
 
+    @lock_market_action
+    def amend_order(self, order_id: str, new_price: float,
+                    original_price: Optional[float] = None) -> Union[Offer, Bid]:
+        """Update the price of an open order, keeping its id.
+
+        The order is replaced by a new order object with the updated price (grid fees are applied
+        the same way as for new orders), and a single ORDER_AMENDED event is dispatched instead of
+        the deletion of the order and the creation of a new one.
+        """
+        if self.readonly:
+            raise MarketReadOnlyException()
+        offer = self.offers.get(order_id)
+        if not offer:
+            raise OfferNotFoundException()
+        if original_price is None:
+            original_price = new_price
+
+        price = self._update_new_offer_price_with_fee(new_price, original_price, offer.energy)
+        if price < 0.0:
+            raise NegativePriceOrdersException(
+                "Negative price after taxes, offer cannot be amended.")
+
+        amended_offer = Offer(offer.id, self.now, price, offer.energy,
+                              offer.seller, original_price,
+                              time_slot=offer.time_slot)
+        self.offers[offer.id] = amended_offer
+        self._replace_order_in_history(self.offer_history, amended_offer)
+
+        log.debug("%s[OFFER][AMEND][%s][%s] %s",
+                  self._debug_log_market_type_identifier, self.name,
+                  self.time_slot_str or amended_offer.time_slot, amended_offer)
+        self._notify_listeners(MarketEvent.ORDER_AMENDED, order=amended_offer)
+        self.no_new_order = False
+        return amended_offer
+
     @lock_market_action
     def delete_offer(self, offer_or_id: Union[str, Offer]) -> None:
         """Delete the offer from cache and notify listeners."""
@@ -0,0 +1,227 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from collections import deque
+from copy import deepcopy
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from gsy_framework.data_classes import Bid, Offer, Trade
+
+
+class OriginOrderIndex:
+    """Secondary index of the orders of a market, keyed by the origin uuid of the trader.
+
+    The index is built from the market orders mapping in a single pass, and is kept valid
+    lazily: stale entries (orders that are not in the market anymore) are dropped on lookup,
+    and new orders (e.g. residuals) are registered via add(). The lookup returns the first
+    order that was inserted for the origin, in the same order as the market orders mapping.
+    """
+
+    def __init__(self, orders: Mapping[str, Union[Bid, Offer]], trader_attribute: str):
+        self._orders = orders
+        self._trader_attribute = trader_attribute
+        self._index: Dict[str, Dict[str, None]] = {}
+        for order in orders.values():
+            self.add(order)
+
+    def add(self, order: Union[Bid, Offer]) -> None:
+        """Register an order to the index."""
+        origin_uuid = getattr(order, self._trader_attribute).origin_uuid
+        if origin_uuid is None:
+            return
+        self._index.setdefault(origin_uuid, {})[order.id] = None
+
+    def get(self, origin_uuid: Optional[str]) -> Optional[Union[Bid, Offer]]:
+        """Return the first open order of the market that was placed by origin_uuid."""
+        if origin_uuid is None:
+            # Many orders may have origin_uuid=None; Avoid looking for them as it is inaccurate.
+            return None
+        order_ids = self._index.get(origin_uuid)
+        while order_ids:
+            order_id = next(iter(order_ids))
+            order = self._orders.get(order_id)
+            if order is not None:
+                return order
+            del order_ids[order_id]
+        return None
+
+
+class RecommendationsQueue:
+    """FIFO queue of bid/offer match recommendations, indexed by the ids of their orders.
+
+    The index allows to replace the orders of the pending recommendations with their residuals
+    after a partial trade, without scanning the whole list of recommendations.
+    """
+
+    def __init__(self, recommendations: Iterable[Dict]):
+        self._sequence = count()
+        self._queue = deque()
+        self._by_offer_id: Dict[str, Dict[int, Dict]] = {}
+        self._by_bid_id: Dict[str, Dict[int, Dict]] = {}
+        for recommendation in recommendations:
+            self._append(recommendation)
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _append(self, recommendation: Dict) -> None:
+        position = next(self._sequence)
+        self._queue.append((position, recommendation))
+        self._by_offer_id.setdefault(recommendation["offer"]["id"], {})[position] = recommendation
+        self._by_bid_id.setdefault(recommendation["bid"]["id"], {})[position] = recommendation
+
+    def popleft(self) -> Dict:
+        """Remove and return the oldest pending recommendation."""
+        position, recommendation = self._queue.popleft()
+        self._remove_from_index(self._by_offer_id, recommendation["offer"]["id"], position)
+        self._remove_from_index(self._by_bid_id, recommendation["bid"]["id"], position)
+        return recommendation
+
+    @staticmethod
+    def _remove_from_index(index: Dict[str, Dict[int, Dict]], order_id: str,
+                           position: int) -> None:
+        pending = index.get(order_id)
+        if pending is None:
+            return
+        pending.pop(position, None)
+        if not pending:
+            del index[order_id]
+
+    def to_list(self):
+        """Return the pending recommendations, in order."""
+        return [recommendation for _, recommendation in self._queue]
+
+    def replace_orders_with_residuals(self, offer_trade: Trade, bid_trade: Trade) -> None:
+        """Replace the traded offer/bid of the pending recommendations with their residuals."""
+        if offer_trade.residual is not None:
+            pending = self._by_offer_id.pop(offer_trade.match_details["offer"].id, {})
+            residual_pending = self._by_offer_id.setdefault(offer_trade.residual.id, {})
+            for position, recommendation in pending.items():
+                recommendation["offer"] = offer_trade.residual.serializable_dict()
+                residual_pending[position] = recommendation
+            if not residual_pending:
+                del self._by_offer_id[offer_trade.residual.id]
+
+        if bid_trade.residual is not None:
+            pending = self._by_bid_id.pop(bid_trade.match_details["bid"].id, {})
+            residual_pending = self._by_bid_id.setdefault(bid_trade.residual.id, {})
+            for position, recommendation in pending.items():
+                recommendation["bid"] = bid_trade.residual.serializable_dict()
+                self._adapt_matching_requirements_in_residuals(recommendation, bid_trade)
+                residual_pending[position] = recommendation
+            if not residual_pending:
+                del self._by_bid_id[bid_trade.residual.id]
+
+    @staticmethod
+    def _adapt_matching_requirements_in_residuals(recommendation: Dict, bid_trade: Trade) -> None:
+        if "energy" not in (recommendation.get("matching_requirements") or {}).get(
+                "bid_requirement", {}):
+            return
+        for index, requirement in enumerate(recommendation["bid"]["requirements"]):
+            if requirement == recommendation["matching_requirements"]["bid_requirement"]:
+                bid_requirement = deepcopy(requirement)
+                bid_requirement["energy"] -= bid_trade.traded_energy
+                recommendation["bid"]["requirements"][index] = bid_requirement
+                recommendation["matching_requirements"]["bid_requirement"] = bid_requirement
+                return
+
+
+class OrderBookView:
+    """Live view of the open orders of a market, in the format consumed by the matching engine.
+
+    The serialised orders are cached per order object, so that only orders that were added
+    (new, residual or re-posted) since the last refresh need to be serialised. Removed orders
+    are detected by comparing the cached order objects with the market orders. Time slots whose
+    orders changed are tracked, in order for the matching engine to only re-match those.
+    """
+
+    def __init__(self, time_slot_str_getter: Callable[[Union[Bid, Offer]], str]):
+        self._time_slot_str_getter = time_slot_str_getter
+        # order_id -> (order, time_slot_str, serialised order)
+        self._bids: Dict[str, Tuple[Bid, str, Dict]] = {}
+        self._offers: Dict[str, Tuple[Offer, str, Dict]] = {}
+        # time_slot_str -> {"bids": {order_id: serialised bid}, "offers": {...}}
+        self._orders_per_slot: Dict[str, Dict[str, Dict[str, Dict]]] = {}
+        # time_slot_str -> {"bids": [...], "offers": [...]}, sorted by energy rate
+        self._sorted_orders_per_slot: Dict[str, Dict[str, List[Dict]]] = {}
+        self._changed_time_slots: Set[str] = set()
+
+    def refresh(self, bids: Mapping[str, Bid], offers: Mapping[str, Offer]) -> None:
+        """Synchronise the view with the open orders of the market."""
+        self._refresh_orders(self._bids, bids, "bids")
+        self._refresh_orders(self._offers, offers, "offers")
+
+    def _refresh_orders(self, cached_orders: Dict[str, Tuple], orders: Mapping,
+                        order_type: str) -> None:
+        for order_id, (order, time_slot, _) in list(cached_orders.items()):
+            if orders.get(order_id) is not order:
+                del cached_orders[order_id]
+                del self._orders_per_slot[time_slot][order_type][order_id]
+                self._set_time_slot_changed(time_slot)
+
+        for order_id, order in orders.items():
+            if order_id in cached_orders:
+                continue
+            time_slot = self._time_slot_str_getter(order)
+            serialised_order = order.serializable_dict()
+            cached_orders[order_id] = (order, time_slot, serialised_order)
+            self._orders_per_slot.setdefault(
+                time_slot, {"bids": {}, "offers": {}})[order_type][order_id] = serialised_order
+            self._set_time_slot_changed(time_slot)
+
+    def _set_time_slot_changed(self, time_slot: str) -> None:
+        self._changed_time_slots.add(time_slot)
+        self._sorted_orders_per_slot.pop(time_slot, None)
+
+    def _get_sorted_orders(self, time_slot: str) -> Dict[str, List[Dict]]:
+        if time_slot not in self._sorted_orders_per_slot:
+            orders = self._orders_per_slot[time_slot]
+            self._sorted_orders_per_slot[time_slot] = {
+                "bids": sorted(orders["bids"].values(),
+                               key=lambda bid: bid["energy_rate"], reverse=True),
+                "offers": sorted(orders["offers"].values(),
+                                 key=lambda offer: offer["energy_rate"])}
+        return self._sorted_orders_per_slot[time_slot]
+
+    @property
+    def changed_time_slots(self) -> Set[str]:
+        """Return the time slots whose orders changed since they were last matched."""
+        return self._changed_time_slots
+
+    def orders_per_slot(self, only_changed: bool = False) -> Dict[str, Dict[str, List[Dict]]]:
+        """Return the serialised open orders per time slot.
+
+        Bids are sorted by descending and offers by ascending energy rate. The returned lists
+        are shared with the view and should not be mutated.
+        """
+        time_slots = self._changed_time_slots if only_changed else self._orders_per_slot
+        return {time_slot: self._get_sorted_orders(time_slot)
+                for time_slot in time_slots
+                if time_slot in self._orders_per_slot}
+
+    def set_time_slots_matched(self, time_slots: Iterable[str]) -> None:
+        """Mark the orders of the time slots as matched, until any of them changes."""
+        self._changed_time_slots.difference_update(time_slots)
+        for time_slot in time_slots:
+            orders = self._orders_per_slot.get(time_slot)
+            if orders is not None and not orders["bids"] and not orders["offers"]:
+                del self._orders_per_slot[time_slot]
+                self._sorted_orders_per_slot.pop(time_slot, None)
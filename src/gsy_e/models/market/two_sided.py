@@ -16,10 +16,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import uuid
-from copy import deepcopy
 from logging import getLogger
 from math import isclose
-from typing import Dict, List, Union, Tuple, Optional
+from typing import Dict, List, Mapping, Union, Tuple, Optional
 
 from gsy_framework.constants_limits import ConstSettings
 from gsy_framework.data_classes import (
@@ -32,11 +31,13 @@ from pendulum import DateTime
 from gsy_e.constants import FLOATING_POINT_TOLERANCE
 from gsy_e.events.event_structures import MarketEvent
 from gsy_e.gsy_e_core.exceptions import (
-    BidNotFoundException, InvalidBidOfferPairException, InvalidTrade,
+    BidNotFoundException, InvalidBidOfferPairException, InvalidTrade, MarketReadOnlyException,
     NegativePriceOrdersException, NegativeEnergyOrderException, NegativeEnergyTradeException)
 from gsy_e.gsy_e_core.util import short_offer_bid_log_str, is_external_matching_enabled
 from gsy_e.models.market import lock_market_action
 from gsy_e.models.market.one_sided import OneSidedMarket
+from gsy_e.models.market.order_book_index import OriginOrderIndex, RecommendationsQueue
+from gsy_e.models.market.versioned_orders import get_orders_snapshot
 
 log = getLogger(__name__)
 
@@ -72,16 +73,17 @@ class TwoSidedMarket(OneSidedMarket):
                 f", V: {self.accumulated_trade_price})>")
 
     @lock_market_action
-    def get_bids(self) -> Dict:
+    def get_bids(self) -> Mapping[str, Bid]:
         """
-        Retrieves a copy of all open bids of the market. The copy of the bids guarantees
-        that the return dict will remain unaffected from any mutations of the market bid list
+        Retrieves a read-only snapshot of all open bids of the market. The snapshot guarantees
+        that the returned mapping will remain unaffected from any mutations of the market bid list
         that might happen concurrently (more specifically can be used in for loops without raising
-        the 'dict changed size during iteration' exception)
-        Returns: dict with open bids, bid id as keys, and Bid objects as values
+        the 'dict changed size during iteration' exception). The snapshot is shared by all callers
+        until the bids of the market change, therefore it should not be modified.
+        Returns: mapping with open bids, bid id as keys, and Bid objects as values
 
         """
-        return deepcopy(self.bids)
+        return get_orders_snapshot(self.bids)
 
     def _update_requirements_prices(self, bid):
         requirements = []
@@ -131,7 +133,7 @@ class TwoSidedMarket(OneSidedMarket):
 
         self.bids[bid.id] = bid
         if add_to_history is True:
-            self.bid_history.append(bid)
+            self._add_order_to_history(self.bid_history, bid)
         if dispatch_event is True:
             self.dispatch_market_bid_event(bid)
         log.debug("%s[BID][NEW][%s] %s", self._debug_log_market_type_identifier,
@@ -143,6 +145,36 @@ class TwoSidedMarket(OneSidedMarket):
         """Dispatch the BID event to the listeners."""
         self._notify_listeners(MarketEvent.BID, bid=bid)
 
+    @lock_market_action
+    def amend_order(self, order_id: str, new_price: float,
+                    original_price: Optional[float] = None) -> Union[Offer, Bid]:
+        """Update the price of an open bid or offer, keeping its id."""
+        bid = self.bids.get(order_id)
+        if not bid:
+            return super().amend_order(order_id, new_price, original_price)
+        if self.readonly:
+            raise MarketReadOnlyException()
+        if original_price is None:
+            original_price = new_price
+
+        price = self.fee_class.update_incoming_bid_with_fee(
+            new_price / bid.energy, original_price / bid.energy) * bid.energy
+        if price < 0.0:
+            raise NegativePriceOrdersException(
+                "Negative price after taxes, bid cannot be amended.")
+
+        amended_bid = Bid(bid.id, self.now, price, bid.energy,
+                          bid.buyer, original_price,
+                          time_slot=bid.time_slot)
+        self.bids[bid.id] = amended_bid
+        self._replace_order_in_history(self.bid_history, amended_bid)
+
+        log.debug("%s[BID][AMEND][%s] %s", self._debug_log_market_type_identifier,
+                  self.time_slot_str or amended_bid.time_slot, amended_bid)
+        self._notify_listeners(MarketEvent.ORDER_AMENDED, order=amended_bid)
+        self.no_new_order = False
+        return amended_bid
+
     @lock_market_action
     def delete_bid(self, bid_or_id: Union[str, Bid]):
         """Delete bid object."""
@@ -244,8 +276,9 @@ class TwoSidedMarket(OneSidedMarket):
                 raise BidNotFoundException(
                     f"Bid {accepted_bid.id} not found in self.bids ({self.name}).") from exception
         else:
-            # full bid trade, nothing further to do here
-            pass
+            # full bid trade, update the bid of the market and not the bid of the caller (that
+            # might belong to a snapshot of the bids)
+            bid = market_bid
 
         fee_price, trade_price = self._determine_bid_price(trade_offer_info, energy)
         fee_price = limit_float_precision(fee_price)
@@ -300,33 +333,18 @@ class TwoSidedMarket(OneSidedMarket):
                                     offer=offer)
         return bid_trade, trade
 
-    def _get_offer_from_seller_origin_id(self, seller_origin_id):
-        """Get the first offer that has the same seller_origin_id."""
-        if seller_origin_id is None:
-            # Many offers may have seller_origin_id=None; Avoid looking for them as it is
-            # inaccurate.
-            return None
-
-        return next(iter(
-            [offer for offer in self.offers.values()
-             if offer.seller.origin_uuid == seller_origin_id]), None)
-
-    def _get_bid_from_buyer_origin_id(self, buyer_origin_id):
-        if buyer_origin_id is None:
-            # Many bids may have buyer_origin_id=None; Avoid looking for them as it is inaccurate.
-            return None
-
-        return next(iter(
-            [bid for bid in self.bids.values()
-             if bid.buyer.origin_uuid == buyer_origin_id]), None)
-
     def match_recommendations(
             self, recommendations: List[BidOfferMatch.serializable_dict]) -> bool:
         """Match a list of bid/offer pairs, create trades and residual offers/bids.
         Returns True if trades were actually performed, False otherwise."""
         were_trades_performed = False
-        while recommendations:
-            recommended_pair = BidOfferMatch.from_dict(recommendations.pop(0))
+        recommendations_queue = RecommendationsQueue(recommendations)
+        # The origin indexes are only needed if the recommended orders are not in the market
+        # anymore, therefore they are built lazily.
+        offers_by_origin: Optional[OriginOrderIndex] = None
+        bids_by_origin: Optional[OriginOrderIndex] = None
+        while recommendations_queue:
+            recommended_pair = BidOfferMatch.from_dict(recommendations_queue.popleft())
 
             market_offer = self.offers.get(recommended_pair.offer["id"])
             # TODO: This is a temporary solution based on the fact that trading strategies do not
@@ -334,7 +352,9 @@ class TwoSidedMarket(OneSidedMarket):
             # replaced by a global offer / bid identifier instead of tracking the original order
             # by seller / buyer.
             if not market_offer:
-                market_offer = self._get_offer_from_seller_origin_id(
+                if offers_by_origin is None:
+                    offers_by_origin = OriginOrderIndex(self.offers, "seller")
+                market_offer = offers_by_origin.get(
                     recommended_pair.offer["seller"]["origin_uuid"])
                 if market_offer is None:
                     raise InvalidBidOfferPairException("Offer does not exist in the market")
@@ -342,7 +362,9 @@ class TwoSidedMarket(OneSidedMarket):
 
             market_bid = self.bids.get(recommended_pair.bid["id"])
             if not market_bid:
-                market_bid = self._get_bid_from_buyer_origin_id(
+                if bids_by_origin is None:
+                    bids_by_origin = OriginOrderIndex(self.bids, "buyer")
+                market_bid = bids_by_origin.get(
                     recommended_pair.bid["buyer"]["origin_uuid"])
                 if market_bid is None:
                     raise InvalidBidOfferPairException("Bid does not exist in the market")
@@ -382,10 +404,11 @@ class TwoSidedMarket(OneSidedMarket):
                 trade_bid_info, min(recommended_pair.selected_energy,
                                     market_offer.energy, market_bid.energy))
             were_trades_performed = True
-            recommendations = (
-                self._replace_offers_bids_with_residual_in_recommendations_list(
-                    recommendations, offer_trade, bid_trade)
-            )
+            recommendations_queue.replace_orders_with_residuals(offer_trade, bid_trade)
+            if offers_by_origin is not None and offer_trade.residual is not None:
+                offers_by_origin.add(offer_trade.residual)
+            if bids_by_origin is not None and bid_trade.residual is not None:
+                bids_by_origin.add(bid_trade.residual)
         return were_trades_performed
 
     @staticmethod
@@ -490,32 +513,6 @@ class TwoSidedMarket(OneSidedMarket):
         :return: The updated matching offer/bid pair list with existing offer/bid
         replaced with corresponding residual offer/bid
         """
-
-        def _adapt_matching_requirements_in_residuals(recommendation):
-            if "energy" in (recommendation.get("matching_requirements") or {}).get(
-                    "bid_requirement", {}):
-                for index, requirement in enumerate(recommendation["bid"]["requirements"]):
-                    if requirement == recommendation["matching_requirements"]["bid_requirement"]:
-                        bid_requirement = deepcopy(requirement)
-                        bid_requirement["energy"] -= bid_trade.traded_energy
-                        recommendation["bid"]["requirements"][index] = bid_requirement
-                        recommendation["matching_requirements"][
-                            "bid_requirement"] = bid_requirement
-                        return recommendation
-            return recommendation
-
-        def replace_recommendations_with_residuals(recommendation: Dict):
-            if (recommendation["offer"]["id"] == offer_trade.match_details["offer"].id and
-                    offer_trade.residual is not None):
-                recommendation["offer"] = offer_trade.residual.serializable_dict()
-            if (recommendation["bid"]["id"] == bid_trade.match_details["bid"].id and
-                    bid_trade.residual is not None):
-                recommendation["bid"] = bid_trade.residual.serializable_dict()
-                recommendation = _adapt_matching_requirements_in_residuals(recommendation)
-
-            return recommendation
-
-        if offer_trade.residual or bid_trade.residual:
-            recommendations = [replace_recommendations_with_residuals(recommendation)
-                               for recommendation in recommendations]
-        return recommendations
+        recommendations_queue = RecommendationsQueue(recommendations)
+        recommendations_queue.replace_orders_with_residuals(offer_trade, bid_trade)
+        return recommendations_queue.to_list()
@@ -0,0 +1,101 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from copy import copy
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from gsy_framework.data_classes import Bid, Offer
+
+
+def _copy_orders(orders: Mapping[str, Union["Bid", "Offer"]]
+                 ) -> Dict[str, Union["Bid", "Offer"]]:
+    return {order_id: copy(order) for order_id, order in orders.items()}
+
+
+class VersionedOrdersMixin:
+    """Keep a version number of an orders mapping and a read-only snapshot of its orders.
+
+    The version is incremented on every modification of the mapping. The snapshot is a frozen
+    copy of the mapping and of its orders, that is only recreated if the orders were modified
+    since the last snapshot. Therefore, all readers of an unchanged market share the same
+    snapshot. The orders are copied because the markets update some of them in place (e.g. the
+    price of the accepted orders on a trade), which must not change the orders of the snapshots.
+    """
+    version = 0
+    # The copy is kept as a plain dict (and not as a mappingproxy) so that the orders mapping
+    # can still be copied and pickled.
+    _snapshot: Optional[Tuple[int, Dict[str, Union["Bid", "Offer"]]]] = None
+
+    def _increment_version(self) -> None:
+        self.version += 1
+
+    def snapshot(self) -> Mapping[str, Union["Bid", "Offer"]]:
+        """Return a read-only view of the orders that is not affected by later modifications."""
+        if self._snapshot is None or self._snapshot[0] != self.version:
+            self._snapshot = (self.version, _copy_orders(self))
+        return MappingProxyType(self._snapshot[1])
+
+
+class VersionedOrders(VersionedOrdersMixin, dict):
+    """Mapping of order id -> order of a market that keeps track of its modifications."""
+
+    def __setitem__(self, order_id, order):
+        super().__setitem__(order_id, order)
+        self._increment_version()
+
+    def __delitem__(self, order_id):
+        super().__delitem__(order_id)
+        self._increment_version()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._increment_version()
+        return result
+
+    def pop(self, *args):
+        order = super().pop(*args)
+        self._increment_version()
+        return order
+
+    def popitem(self):
+        item = super().popitem()
+        self._increment_version()
+        return item
+
+    def setdefault(self, order_id, default=None):
+        order = super().setdefault(order_id, default)
+        self._increment_version()
+        return order
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._increment_version()
+
+    def clear(self):
+        super().clear()
+        self._increment_version()
+
+
+def get_orders_snapshot(orders: Mapping[str, Union["Bid", "Offer"]]
+                        ) -> Mapping[str, Union["Bid", "Offer"]]:
+    """Return a read-only snapshot of the orders mapping of a market."""
+    if isinstance(orders, VersionedOrdersMixin):
+        return orders.snapshot()
+    # Plain mappings (e.g. assigned to the market by the tests) are copied on every call.
+    return MappingProxyType(_copy_orders(orders))
@@ -18,6 +18,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Callable
 
+import gsy_e.constants
+
 
 class MatchingEngineMatcherInterface(ABC):
     """Interface for matching engine matchers' public methods."""
@@ -55,7 +57,16 @@ class MatchingEngineMatcherInterface(ABC):
                 continue
             while True:
                 # Perform matching until all recommendations and their residuals are handled.
-                orders = market.orders_per_slot()
+                if gsy_e.constants.MATCHING_ENGINE_INCREMENTAL_ORDER_BOOK:
+                    order_book_view = market.order_book_view
+                    orders = order_book_view.orders_per_slot(only_changed=True)
+                    # The time slots that do not get any recommendation in this iteration will
+                    # not get any in the next ones either, until their orders change.
+                    order_book_view.set_time_slots_matched(list(orders.keys()))
+                    if not orders:
+                        break
+                else:
+                    orders = market.orders_per_slot()
 
                 # Format should be: {area_uuid: {time_slot: {"bids": [], "offers": [], ...}}}
                 data = {
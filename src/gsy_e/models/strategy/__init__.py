@@ -37,12 +37,13 @@ from gsy_e.events.event_structures import AreaEvent, MarketEvent
 from gsy_e.gsy_e_core.device_registry import DeviceRegistry
 from gsy_e.gsy_e_core.exceptions import D3ARedisException, MarketException, SimulationException
 from gsy_e.gsy_e_core.redis_connections.area_market import BlockingCommunicator
-from gsy_e.gsy_e_core.util import append_or_create_key
 from gsy_e.models.base import AreaBehaviorBase
 from gsy_e.models.config import SimulationConfig
 from gsy_e.models.market import MarketBase
+from gsy_e.models.market.market_trades import MarketTrades
 from gsy_e.models.strategy.future.strategy import FutureMarketStrategyInterface
 from gsy_e.models.strategy.settlement.strategy import SettlementMarketStrategyInterface
+from gsy_e.models.strategy.strategy_orders import StrategyOrders
 
 log = getLogger(__name__)
 
@@ -88,6 +89,10 @@ class _TradeLookerUpper:
         self.owner_name = owner_name
 
     def __getitem__(self, market: MarketBase) -> Generator[Trade, None, None]:
+        if isinstance(market.trades, MarketTrades):
+            yield from market.trades.of_trader(self.owner_name)
+            return
+        # Markets that keep their trades in a plain list
         for trade in market.trades:
             owner_name = self.owner_name
             if owner_name in (trade.seller.name, trade.buyer.name):
@@ -248,10 +253,33 @@ class Offers:
     def __init__(self, strategy: "BaseStrategy"):
         self.strategy = strategy
         self.bought = {}  # type: Dict[Offer, str]
-        self.posted = {}  # type: Dict[Offer, str]
-        self.sold = {}  # type: Dict[str, List[Offer]]
+        self._posted = {}  # type: Dict[Offer, str]
+        # Index of the posted offers: market id -> time slot -> offer id
+        self._posted_in_markets = StrategyOrders()
+        self._sold = StrategyOrders()
         self.split = {}  # type: Dict[str, Offer]
 
+    @property
+    def posted(self) -> Dict[Offer, str]:
+        """Return all posted offers (offer -> market id). Must not be modified in place."""
+        return self._posted
+
+    @posted.setter
+    def posted(self, posted: Dict[Offer, str]) -> None:
+        self._posted = dict(posted)
+        self._posted_in_markets = StrategyOrders()
+        for offer, market_id in self._posted.items():
+            self._posted_in_markets.add(market_id, offer)
+
+    @property
+    def sold(self) -> StrategyOrders:
+        """Return the sold offers per market id."""
+        return self._sold
+
+    @sold.setter
+    def sold(self, sold: Dict[str, List[Offer]]) -> None:
+        self._sold = StrategyOrders(sold)
+
     def _delete_past_offers(
             self, existing_offers: Dict[Offer, str], current_time_slot: DateTime
     ) -> Dict[Offer, str]:
@@ -270,16 +298,19 @@ class Offers:
         self.bought = self._delete_past_offers(self.bought, current_time_slot)
         self.split = {}
 
+    def _is_open(self, offer: Offer, market_id: str) -> bool:
+        return not self._sold.has_order(market_id, offer.id)
+
     @property
     def open(self) -> Dict[Offer, str]:
         """Return all open offers on all markets"""
-        open_offers = {}
-        for offer, market_id in self.posted.items():
-            if market_id not in self.sold:
-                self.sold[market_id] = []
-            if offer not in self.sold[market_id]:
-                open_offers[offer] = market_id
-        return open_offers
+        return {offer: market_id for offer, market_id in self._posted.items()
+                if self._is_open(offer, market_id)}
+
+    def has_open_offers_in_market(self, market_id: str) -> bool:
+        """Check if any of the posted offers in the market is not sold yet."""
+        return any(self._is_open(offer, market_id)
+                   for offer in self._posted_in_markets.get(market_id, []))
 
     def bought_offer(self, offer: Offer, market_id: str) -> None:
         """Store bought offer"""
@@ -287,29 +318,16 @@ class Offers:
 
     def sold_offer(self, offer: Offer, market_id: str) -> None:
         """Store sold offer"""
-        self.sold = append_or_create_key(self.sold, market_id, offer)
+        self._sold.add(market_id, offer)
 
     def is_offer_posted(self, market_id: str, offer_id: str) -> bool:
         """Check if offer is posted on the market"""
-        return offer_id in [offer.id for offer, _market in self.posted.items()
-                            if market_id == _market]
-
-    def _get_sold_offer_ids_in_market(self, market_id: str) -> List[str]:
-        sold_offer_ids = []
-        for sold_offer in self.sold.get(market_id, []):
-            sold_offer_ids.append(sold_offer.id)
-        return sold_offer_ids
+        return self._posted_in_markets.has_order(market_id, offer_id)
 
     def open_in_market(self, market_id: str, time_slot: DateTime = None) -> List[Offer]:
         """Get all open offers in market"""
-        open_offers = []
-        sold_offer_ids = self._get_sold_offer_ids_in_market(market_id)
-        for offer, _market_id in self.posted.items():
-            if (offer.id not in sold_offer_ids
-                    and market_id == _market_id
-                    and (time_slot is None or offer.time_slot == time_slot)):
-                open_offers.append(offer)
-        return open_offers
+        return [offer for offer in self._posted_in_markets.in_market(market_id, time_slot)
+                if self._is_open(offer, market_id)]
 
     def open_offer_energy(self, market_id: str, time_slot: DateTime = None) -> float:
         """Get sum of open offers' energy in market"""
@@ -317,31 +335,27 @@ class Offers:
 
     def posted_in_market(self, market_id: str, time_slot: DateTime = None) -> List[Offer]:
         """Get list of posted offers in market"""
-        return [offer
-                for offer, _market in self.posted.items()
-                if market_id == _market and (time_slot is None or offer.time_slot == time_slot)]
+        return self._posted_in_markets.in_market(market_id, time_slot)
 
     def posted_offer_energy(self, market_id: str, time_slot: DateTime = None) -> float:
         """Get energy of all posted offers"""
-        return sum(o.energy
-                   for o in self.posted_in_market(market_id, time_slot)
-                   if time_slot is None or o.time_slot == time_slot)
+        return self._posted_in_markets.energy(market_id, time_slot)
 
     def sold_offer_energy(self, market_id: str, time_slot: DateTime = None) -> float:
         """Get energy of all sold offers"""
-        return sum(o.energy
-                   for o in self.sold_in_market(market_id)
-                   if time_slot is None or o.time_slot == time_slot)
+        return self._sold.energy(market_id, time_slot)
 
     def sold_offer_price(self, market_id: str, time_slot: DateTime = None) -> float:
         """Get sum of all sold offers' price"""
-        return sum(o.price
-                   for o in self.sold_in_market(market_id)
-                   if time_slot is None or o.time_slot == time_slot)
+        return self._sold.price(market_id, time_slot)
 
     def sold_in_market(self, market_id: str) -> List[Offer]:
         """Get list of sold offers in a market"""
-        return self.sold[market_id] if market_id in self.sold else []
+        return self._sold.get(market_id, [])
+
+    def get_sold_offer(self, market_id: str, offer_id: str) -> Optional[Offer]:
+        """Get the sold offer of the market with the given id."""
+        return self._sold.get_order(market_id, offer_id)
 
     # pylint: disable=too-many-arguments
     def can_offer_be_posted(
@@ -378,7 +392,11 @@ class Offers:
         """Add offer to the posted dict"""
         # If offer was split already, don't post one with the same uuid again
         if offer.id not in self.split:
-            self.posted[offer] = market_id
+            previous_market_id = self._posted.get(offer)
+            if previous_market_id is not None:
+                self._posted_in_markets.remove(previous_market_id, [offer.id])
+            self._posted[offer] = market_id
+            self._posted_in_markets.add(market_id, offer)
 
     def remove_offer_from_cache_and_market(self, market: "OneSidedMarket",
                                            offer_id: str = None) -> List[str]:
@@ -386,7 +404,7 @@ class Offers:
         if offer_id is None:
             to_delete_offers = self.open_in_market(market.id)
         else:
-            to_delete_offers = [o for o, m in self.posted.items() if o.id == offer_id]
+            to_delete_offers = [o for o in self.posted_in_market(market.id) if o.id == offer_id]
         deleted_offer_ids = []
         for offer in to_delete_offers:
             market.delete_offer(offer.id)
@@ -395,14 +413,15 @@ class Offers:
         return deleted_offer_ids
 
     def _remove(self, offer: Offer) -> bool:
-        market_id = self.posted.pop(offer)
+        market_id = self._posted[offer]
         if not market_id:
             return False
         assert isinstance(market_id, str)
-        if market_id in self.sold and offer in self.sold[market_id]:
+        if not self._is_open(offer, market_id):
             self.strategy.log.warning("Offer already sold, cannot remove it.")
-            self.posted[offer] = market_id
             return False
+        del self._posted[offer]
+        self._posted_in_markets.remove(market_id, [offer.id])
         return True
 
     def replace(self, old_offer: Offer, new_offer: Offer, market_id: str):
@@ -410,6 +429,12 @@ class Offers:
         if self._remove(old_offer):
             self.post(new_offer, market_id)
 
+    def amend(self, amended_offer: Offer, market_id: str) -> None:
+        """Replace the posted offer with the same id by its amended version."""
+        old_offer = self._posted_in_markets.get_order(market_id, amended_offer.id)
+        if old_offer is not None:
+            self.replace(old_offer, amended_offer, market_id)
+
     def on_trade(self, market_id: str, trade: Trade) -> None:
         """Update contents of posted and sold dicts on the event of an offer being traded"""
         try:
@@ -625,8 +650,7 @@ class BaseStrategy(EventMixin, AreaBehaviorBase, ABC):
 
     def _assert_if_trade_offer_price_is_too_low(self, market_id: str, trade: Trade) -> None:
         if trade.is_offer_trade and trade.seller.name == self.owner.name:
-            offer = [o for o in self.offers.sold[market_id]
-                     if o.id == trade.match_details["offer"].id][0]
+            offer = self.offers.get_sold_offer(market_id, trade.match_details["offer"].id)
             assert (trade.trade_rate >=
                     offer.energy_rate - FLOATING_POINT_TOLERANCE)
 
@@ -673,7 +697,7 @@ class BaseStrategy(EventMixin, AreaBehaviorBase, ABC):
     def update_offer_rates(self, market: "OneSidedMarket", updated_rate: float,
                            time_slot: Optional[DateTime] = None) -> None:
         """Update the total price of all offers in the specified market based on their new rate."""
-        if market.id not in self.offers.open.values():
+        if not self.offers.has_open_offers_in_market(market.id):
             return
 
         for offer in self.get_posted_offers(market, time_slot):
@@ -681,6 +705,11 @@ class BaseStrategy(EventMixin, AreaBehaviorBase, ABC):
             if abs(offer.price - updated_price) <= FLOATING_POINT_TOLERANCE:
                 continue
             try:
+                if constants.AMEND_ORDERS_ON_PRICE_UPDATE:
+                    # Update the price of the offer in place, keeping its id
+                    self.offers.replace(offer, market.amend_order(offer.id, updated_price),
+                                        market.id)
+                    continue
                 # Delete the old offer and create a new equivalent one with an updated price
                 market.delete_offer(offer.id)
                 new_offer = market.offer(
@@ -708,8 +737,8 @@ class BidEnabledStrategy(BaseStrategy):
     """
     def __init__(self):
         super().__init__()
-        self._bids = {}
-        self._traded_bids = {}
+        self._bids = StrategyOrders()
+        self._traded_bids = StrategyOrders()
 
     def energy_traded(self, market_id: str, time_slot: Optional[DateTime] = None) -> float:
         # pylint: disable=fixme
@@ -773,11 +802,19 @@ class BidEnabledStrategy(BaseStrategy):
                 continue
             assert bid.buyer.name == self.owner.name
 
+            if constants.AMEND_ORDERS_ON_PRICE_UPDATE and bid.id in market.bids:
+                self._amend_bid(market, bid, bid.energy * updated_rate)
+                continue
+
             self.remove_bid_from_pending(market.id, bid.id)
             self.post_bid(market, bid.energy * updated_rate,
                           bid.energy, replace_existing=False,
                           time_slot=bid.time_slot)
 
+    def _amend_bid(self, market: "TwoSidedMarket", bid: Bid, updated_price: float) -> None:
+        """Update the price of a posted bid in place, keeping its id."""
+        self._bids.replace(market.id, market.amend_order(bid.id, updated_price))
+
     # pylint: disable=too-many-arguments
     def can_bid_be_posted(self, bid_energy: float, bid_price: float, required_energy_kWh: float,
                           market: "TwoSidedMarket", replace_existing: bool = False,
@@ -814,7 +851,7 @@ class BidEnabledStrategy(BaseStrategy):
 
     def is_bid_posted(self, market: "TwoSidedMarket", bid_id: str) -> bool:
         """Check if bid is posted to the market"""
-        return bid_id in [bid.id for bid in self.get_posted_bids(market)]
+        return self._bids.has_order(market.id, bid_id)
 
     def posted_bid_energy(self, market_id: str, time_slot: Optional[DateTime] = None) -> float:
         """
@@ -827,21 +864,13 @@ class BidEnabledStrategy(BaseStrategy):
         Returns: Total energy of all posted bids
 
         """
-        if market_id not in self._bids:
-            return 0.0
-        return sum(b.energy
-                   for b in self._bids[market_id]
-                   if time_slot is None or b.time_slot == time_slot)
+        return self._bids.energy(market_id, time_slot)
 
     def _traded_bid_energy(self, market_id: str, time_slot: Optional[DateTime] = None) -> float:
-        return sum(b.energy
-                   for b in self._get_traded_bids_from_market(market_id)
-                   if time_slot is None or b.time_slot == time_slot)
+        return self._traded_bids.energy(market_id, time_slot)
 
     def _traded_bid_costs(self, market_id: str, time_slot: Optional[DateTime] = None) -> float:
-        return sum(b.price
-                   for b in self._get_traded_bids_from_market(market_id)
-                   if time_slot is None or b.time_slot == time_slot)
+        return self._traded_bids.price(market_id, time_slot)
 
     def remove_bid_from_pending(self, market_id: str, bid_id: str = None) -> List[str]:
         """Remove bid from pending bids dict"""
@@ -856,38 +885,28 @@ class BidEnabledStrategy(BaseStrategy):
         for b_id in deleted_bid_ids:
             if b_id in market.bids.keys():
                 market.delete_bid(b_id)
-        self._bids[market.id] = [bid for bid in self.get_posted_bids(market)
-                                 if bid.id not in deleted_bid_ids]
+        self._bids.remove(market.id, deleted_bid_ids)
         return deleted_bid_ids
 
     def add_bid_to_posted(self, market_id: str, bid: Bid) -> None:
         """Add bid to posted bids dict"""
-        if market_id not in self._bids.keys():
-            self._bids[market_id] = []
-        self._bids[market_id].append(bid)
+        self._bids.add(market_id, bid)
 
     def add_bid_to_bought(self, bid: Bid, market_id: str, remove_bid: bool = True) -> None:
         """Add bid to traded bids dict"""
-        if market_id not in self._traded_bids:
-            self._traded_bids[market_id] = []
-        self._traded_bids[market_id].append(bid)
+        self._traded_bids.add(market_id, bid)
         if remove_bid:
             self.remove_bid_from_pending(market_id, bid.id)
 
     def _get_traded_bids_from_market(self, market_id: str) -> List[Bid]:
-        if market_id not in self._traded_bids:
-            return []
-        return self._traded_bids[market_id]
+        return self._traded_bids.get(market_id, [])
 
     def are_bids_posted(self, market_id: str, time_slot: DateTime = None) -> bool:
         """Checks if any bids have been posted in the market slot with the given ID."""
-        if market_id not in self._bids:
-            return False
         # time_slot is empty when called for spot markets, where we can retrieve the bids for a
         # time_slot only by the market_id. For the future markets, the time_slot needs to be
         # defined for the correct bid selection.
-        return len([bid for bid in self._bids[market_id]
-                    if time_slot is None or bid.time_slot == time_slot]) > 0
+        return len(self._bids.in_market(market_id, time_slot)) > 0
 
     def post_first_bid(self, market: "MarketBase", energy_Wh: float,
                        initial_energy_rate: float) -> Optional[Bid]:
@@ -910,9 +929,7 @@ class BidEnabledStrategy(BaseStrategy):
     def get_posted_bids(
             self, market: "MarketBase", time_slot: Optional[DateTime] = None) -> List[Bid]:
         """Get list of posted bids from a market"""
-        if market.id not in self._bids:
-            return []
-        return [b for b in self._bids[market.id] if time_slot is None or b.time_slot == time_slot]
+        return self._bids.in_market(market.id, time_slot)
 
     def _assert_bid_can_be_posted_on_market(self, market_id):
         assert (ConstSettings.MASettings.MARKET_TYPE == SpotMarketTypeEnum.TWO_SIDED.value or
@@ -955,12 +972,11 @@ class BidEnabledStrategy(BaseStrategy):
                 update_bids_list.append(bid)
         return update_bids_list
 
-    def _delete_past_bids(self, existing_bids: Dict) -> Dict:
-        updated_bids_dict = {}
+    def _delete_past_bids(self, existing_bids: StrategyOrders) -> StrategyOrders:
+        updated_bids_dict = StrategyOrders()
         for market_id, bids in existing_bids.items():
             if market_id == self.area.future_markets.id:
-                updated_bids_dict.update(
-                    {market_id: self._get_future_bids_from_list(bids)})
+                updated_bids_dict[market_id] = self._get_future_bids_from_list(bids)
         return updated_bids_dict
 
     def event_market_cycle(self) -> None:
@@ -977,8 +993,7 @@ class BidEnabledStrategy(BaseStrategy):
         the bid.
         """
         if trade.is_bid_trade and trade.buyer.name == self.owner.name:
-            bid = [bid for bid in self.get_posted_bids(market)
-                   if bid.id == trade.match_details["bid"].id]
+            bid = self._bids.get_order(market.id, trade.match_details["bid"].id)
             if not bid:
                 return
-            assert trade.trade_rate <= bid[0].energy_rate + FLOATING_POINT_TOLERANCE
+            assert trade.trade_rate <= bid.energy_rate + FLOATING_POINT_TOLERANCE
@@ -60,6 +60,9 @@ class HeatPumpEnergyParametersBase(ABC):
         """Runs on activate event."""
         self._rotate_profiles()
 
+    def event_deactivate(self):
+        """Runs on deactivate event."""
+
     def event_market_cycle(self, current_time_slot):
         """To be called at the start of the market slot. """
         self._rotate_profiles(current_time_slot)
@@ -20,7 +20,7 @@ import math
 import pathlib
 
 import pendulum
-from gsy_framework.read_user_profile import InputProfileTypes, read_arbitrary_profile
+from gsy_framework.read_user_profile import InputProfileTypes
 from gsy_framework.utils import (convert_kW_to_kWh, find_object_of_same_weekday_and_time,
                                  key_in_dict_and_not_none)
 from gsy_framework.validators import PVValidator
@@ -28,6 +28,7 @@ from pendulum.datetime import DateTime
 
 import gsy_e.constants
 from gsy_e.gsy_e_core.exceptions import GSyException
+from gsy_e.gsy_e_core.global_objects_singleton import global_objects
 from gsy_e.gsy_e_core.util import gsye_root_path
 from gsy_e.models.strategy import utils
 from gsy_e.models.strategy.profile import EnergyProfile
@@ -139,7 +140,7 @@ class PVPredefinedEnergyParameters(PVEnergyParameters):
         else:
             raise ValueError("Energy_profile has to be in [0,1,2,4]")
 
-        power_weight_profile = read_arbitrary_profile(
+        power_weight_profile = global_objects.profiles_handler.read_profile(
             InputProfileTypes.IDENTITY, profile_path)
 
         self.energy_profile = {
@@ -1,15 +1,19 @@
 import logging
-from typing import Optional, Union, Dict
+from functools import lru_cache
+from math import copysign, isclose, sqrt
+from typing import Optional, Union, Dict, List, Tuple
+from weakref import WeakSet
 
-import sympy as sp
+import numpy as np
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.read_user_profile import InputProfileTypes
 from gsy_framework.utils import convert_W_to_kWh, convert_kWh_to_W
 from pendulum import DateTime
 
+import gsy_e.constants
 from gsy_e.constants import FLOATING_POINT_TOLERANCE
 from gsy_e.models.strategy.energy_parameters.heat_pump import (
-    HeatPumpEnergyParametersBase, WATER_DENSITY)
+    HeatPumpEnergyParametersBase, HeatPumpEnergyParametersException, WATER_DENSITY)
 from gsy_e.models.strategy.profile import EnergyProfile
 
 logger = logging.getLogger(__name__)
@@ -18,6 +22,11 @@ CALIBRATION_COEFFICIENT = 0.85
 WATER_SPECIFIC_HEAT_CAPACITY = 4182  # [J/kg°C]
 GROUND_WATER_TEMPERATURE_C = 12
 
+# The solutions of the storage temperature calculation are cached, keyed by the solver inputs
+# rounded to SOLVER_CACHE_KEY_DECIMALS decimals.
+SOLVER_CACHE_SIZE = 4096
+SOLVER_CACHE_KEY_DECIMALS = 6
+
 
 class HeatpumpStorageEnergySolver:
     # pylint: disable=too-many-instance-attributes,too-many-arguments
@@ -93,6 +102,38 @@ class HeatpumpStorageEnergySolver:
         self._calculate_q_out()
         self.p_el_W = convert_kWh_to_W(self.energy_kWh, GlobalConfig.slot_length)
 
+        (self.q_in_J, self.cop, self.target_storage_temp_C, self.temp_differential_per_sec,
+         self.condenser_temp_C) = _solve_storage_temp_from_energy(
+            round(self._tank_volume_l, SOLVER_CACHE_KEY_DECIMALS),
+            round(self.current_storage_temp_C, SOLVER_CACHE_KEY_DECIMALS),
+            round(self.q_out_J, SOLVER_CACHE_KEY_DECIMALS),
+            round(self.dh_flow_kg_per_sec, SOLVER_CACHE_KEY_DECIMALS),
+            round(self.p_el_W, SOLVER_CACHE_KEY_DECIMALS),
+            GlobalConfig.slot_length.total_seconds())
+
+        if gsy_e.constants.VALIDATE_HEATPUMP_SOLVER_WITH_SYMPY:
+            self._validate_storage_temp_with_sympy()
+
+    def _validate_storage_temp_with_sympy(self):
+        """Compare the analytic solution with the solution of the sympy equation system."""
+        sympy_solution = self.calculate_storage_temp_from_energy_sympy()
+        if not isclose(sympy_solution, self.target_storage_temp_C,
+                       abs_tol=FLOATING_POINT_TOLERANCE):
+            logger.warning(
+                "Heatpump storage temperature calculation deviates from the sympy solution "
+                "(%s != %s). %s", self.target_storage_temp_C, sympy_solution, self)
+
+    def calculate_storage_temp_from_energy_sympy(self) -> float:
+        """Calculate target storage temp by solving the equation system with sympy.
+
+        Considerably slower than the analytic solution, only used for validation purposes.
+        """
+        # pylint: disable=import-outside-toplevel
+        import sympy as sp
+
+        p_el_W = convert_kWh_to_W(self.energy_kWh, GlobalConfig.slot_length)
+        q_out_J = self.dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY * (
+                self.dh_supply_temp_C - self.dh_return_temp_C)
         (q_in_sym, cop_sym, storage_temp_sym,
          temp_differential_sym, condenser_temp_sym) = sp.symbols(
             "q_in, cop, storage_temp, temp_differential, condenser_temp")
@@ -102,7 +143,7 @@ class HeatpumpStorageEnergySolver:
                   GlobalConfig.slot_length.total_seconds(),
                   temp_differential_sym),
             sp.Eq(WATER_DENSITY * WATER_SPECIFIC_HEAT_CAPACITY *
-                  self._tank_volume_l * temp_differential_sym + self.q_out_J,
+                  self._tank_volume_l * temp_differential_sym + q_out_J,
                   q_in_sym),
             sp.Eq((q_in_sym / (
                     self.dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY)) + storage_temp_sym,
@@ -111,14 +152,145 @@ class HeatpumpStorageEnergySolver:
                                              (condenser_temp_sym - GROUND_WATER_TEMPERATURE_C)),
                   cop_sym),
             sp.Eq(q_in_sym / cop_sym,
-                  self.p_el_W)
+                  p_el_W)
         ])
         solution = max(ans, key=lambda result: result.get(temp_differential_sym))
-        self.q_in_J = float(solution.get(q_in_sym))
-        self.cop = float(solution.get(cop_sym))
-        self.target_storage_temp_C = float(solution.get(storage_temp_sym))
-        self.temp_differential_per_sec = float(solution.get(temp_differential_sym))
-        self.condenser_temp_C = float(solution.get(condenser_temp_sym))
+        return float(solution.get(storage_temp_sym))
+
+
+@lru_cache(maxsize=SOLVER_CACHE_SIZE)
+def _solve_storage_temp_from_energy(
+        tank_volume_l: float, current_storage_temp_C: float, q_out_J: float,
+        dh_flow_kg_per_sec: float, p_el_W: float, slot_length_sec: float
+) -> Tuple[float, float, float, float, float]:
+    """
+    Analytic solution of the heatpump storage equation system, for a given electrical power.
+
+    Substituting the storage temperature T in the equations of the system
+    (q_in = A * (T - T_current) + q_out, T_condenser = q_in / (m * c) + T,
+    COP = k * T_condenser / (T_condenser - T_ground), q_in / COP = P_el)
+    results in a quadratic equation for T, whose greater root is the physical solution.
+
+    Returns: (q_in_J, cop, storage_temp_C, temp_differential_per_sec, condenser_temp_C)
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    heat_capacity_per_sec = (
+            WATER_DENSITY * WATER_SPECIFIC_HEAT_CAPACITY * tank_volume_l / slot_length_sec)
+    if dh_flow_kg_per_sec < FLOATING_POINT_TOLERANCE:
+        # Without water flow the heatpump does not produce any heat, similar to the
+        # calculate_energy_from_storage_temp behaviour.
+        temp_differential_per_sec = -q_out_J / (heat_capacity_per_sec * slot_length_sec)
+        return (0., 0., current_storage_temp_C + temp_differential_per_sec * slot_length_sec,
+                temp_differential_per_sec, 0.)
+
+    flow_heat_capacity = dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY
+    # q_in = A * T + B, T_condenser = alpha * T + beta
+    q_in_offset = q_out_J - heat_capacity_per_sec * current_storage_temp_C
+    condenser_temp_slope = 1 + heat_capacity_per_sec / flow_heat_capacity
+    condenser_temp_offset = q_in_offset / flow_heat_capacity
+    cop_numerator = CALIBRATION_COEFFICIENT * p_el_W
+
+    a = heat_capacity_per_sec * condenser_temp_slope
+    b = (heat_capacity_per_sec * (condenser_temp_offset - GROUND_WATER_TEMPERATURE_C) +
+         q_in_offset * condenser_temp_slope - cop_numerator * condenser_temp_slope)
+    c = (q_in_offset * (condenser_temp_offset - GROUND_WATER_TEMPERATURE_C) -
+         cop_numerator * condenser_temp_offset)
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        raise HeatPumpEnergyParametersException(
+            f"The heatpump storage temperature equation has no real solution "
+            f"(energy {p_el_W} W, storage temperature {current_storage_temp_C} C).")
+    # Numerically stable variant of the quadratic formula
+    q = -0.5 * (b + copysign(sqrt(discriminant), b))
+    storage_temp_C = max(q / a, c / q) if q != 0 else -b / (2 * a)
+
+    temp_differential_per_sec = (storage_temp_C - current_storage_temp_C) / slot_length_sec
+    q_in_J = heat_capacity_per_sec * slot_length_sec * temp_differential_per_sec + q_out_J
+    condenser_temp_C = q_in_J / flow_heat_capacity + storage_temp_C
+    cop = CALIBRATION_COEFFICIENT * (
+            condenser_temp_C / (condenser_temp_C - GROUND_WATER_TEMPERATURE_C))
+    return q_in_J, cop, storage_temp_C, temp_differential_per_sec, condenser_temp_C
+
+
+def calculate_energy_from_storage_temp_array(
+        tank_volume_l: np.ndarray, current_storage_temp_C: np.ndarray,
+        dh_supply_temp_C: np.ndarray, dh_return_temp_C: np.ndarray,
+        dh_flow_m3_per_hour: np.ndarray, target_storage_temp_C: np.ndarray,
+        slot_length_sec: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorised version of HeatpumpStorageEnergySolver.calculate_energy_from_storage_temp, that
+    evaluates the energy of multiple heatpumps at once.
+
+    Returns: (energy_kWh, cop, condenser_temp_C, q_out_J) arrays
+    """
+    # pylint: disable=too-many-arguments
+    dh_flow_kg_per_sec = dh_flow_m3_per_hour * 1000 / 3600
+    no_flow = dh_flow_kg_per_sec < FLOATING_POINT_TOLERANCE
+    dh_flow_kg_per_sec = np.where(no_flow, 0., dh_flow_kg_per_sec)
+    q_out_J = dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY * (
+            dh_supply_temp_C - dh_return_temp_C)
+    temp_differential_per_sec = (target_storage_temp_C - current_storage_temp_C) / slot_length_sec
+    q_in_J = (WATER_DENSITY * WATER_SPECIFIC_HEAT_CAPACITY *
+              tank_volume_l * temp_differential_per_sec + q_out_J)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        condenser_temp_C = np.where(
+            no_flow, 0.,
+            q_in_J / (dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY) + target_storage_temp_C)
+        cop = np.where(
+            no_flow, 0.,
+            CALIBRATION_COEFFICIENT * (
+                    condenser_temp_C / (condenser_temp_C - GROUND_WATER_TEMPERATURE_C)))
+        p_el_W = np.where(no_flow, 0., q_in_J / cop)
+    energy_kWh = p_el_W * slot_length_sec / 3600 / 1000
+    return energy_kWh, cop, condenser_temp_C, q_out_J
+
+
+def calculate_storage_temp_from_energy_array(
+        tank_volume_l: np.ndarray, current_storage_temp_C: np.ndarray,
+        dh_supply_temp_C: np.ndarray, dh_return_temp_C: np.ndarray,
+        dh_flow_m3_per_hour: np.ndarray, energy_kWh: np.ndarray,
+        slot_length_sec: float
+) -> np.ndarray:
+    """
+    Vectorised version of HeatpumpStorageEnergySolver.calculate_storage_temp_from_energy, that
+    evaluates the storage temperature of multiple heatpumps at once. Uses the same analytic
+    solution as _solve_storage_temp_from_energy.
+
+    Returns: storage_temp_C array
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    dh_flow_kg_per_sec = dh_flow_m3_per_hour * 1000 / 3600
+    no_flow = dh_flow_kg_per_sec < FLOATING_POINT_TOLERANCE
+    dh_flow_kg_per_sec = np.where(no_flow, 0., dh_flow_kg_per_sec)
+    q_out_J = dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY * (
+            dh_supply_temp_C - dh_return_temp_C)
+    p_el_W = energy_kWh * 1000 * 3600 / slot_length_sec
+    heat_capacity_per_sec = (
+            WATER_DENSITY * WATER_SPECIFIC_HEAT_CAPACITY * tank_volume_l / slot_length_sec)
+    # Avoid divisions by zero for the heatpumps without water flow, their results are replaced
+    flow_heat_capacity = np.where(
+        no_flow, 1., dh_flow_kg_per_sec * WATER_SPECIFIC_HEAT_CAPACITY)
+
+    q_in_offset = q_out_J - heat_capacity_per_sec * current_storage_temp_C
+    condenser_temp_slope = 1 + heat_capacity_per_sec / flow_heat_capacity
+    condenser_temp_offset = q_in_offset / flow_heat_capacity
+    cop_numerator = CALIBRATION_COEFFICIENT * p_el_W
+
+    a = heat_capacity_per_sec * condenser_temp_slope
+    b = (heat_capacity_per_sec * (condenser_temp_offset - GROUND_WATER_TEMPERATURE_C) +
+         q_in_offset * condenser_temp_slope - cop_numerator * condenser_temp_slope)
+    c = (q_in_offset * (condenser_temp_offset - GROUND_WATER_TEMPERATURE_C) -
+         cop_numerator * condenser_temp_offset)
+    discriminant = b * b - 4 * a * c
+    if np.any(discriminant[~no_flow] < 0):
+        raise HeatPumpEnergyParametersException(
+            "The heatpump storage temperature equation has no real solution.")
+    q = -0.5 * (b + np.copysign(np.sqrt(np.maximum(discriminant, 0.)), b))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        storage_temp_C = np.where(q != 0, np.maximum(q / a, c / q), -b / (2 * a))
+    return np.where(
+        no_flow, current_storage_temp_C - q_out_J / heat_capacity_per_sec, storage_temp_C)
 
 
 class VirtualHeatpumpEnergyParameters(HeatPumpEnergyParametersBase):
@@ -171,16 +343,35 @@ class VirtualHeatpumpEnergyParameters(HeatPumpEnergyParametersBase):
         self._dh_water_flow_m3.read_or_rotate_profiles()
         self.state.delete_past_state_values(current_time_slot)
 
+    def event_activate(self):
+        super().event_activate()
+        if gsy_e.constants.VECTORISED_VIRTUAL_HEATPUMP_FLEET:
+            virtual_heatpump_fleet.register(self)
+
+    def event_deactivate(self):
+        virtual_heatpump_fleet.unregister(self)
+
+    def _limit_energy_demand(self, energy_kWh: float) -> float:
+        assert energy_kWh > -FLOATING_POINT_TOLERANCE
+        return min(self._max_energy_consumption_kWh, energy_kWh)
+
     def _calc_energy_to_buy_maximum(self, time_slot: DateTime) -> float:
-        max_energy_consumption = self._target_storage_temp_to_energy(self._max_temp_C, time_slot)
-        assert max_energy_consumption > -FLOATING_POINT_TOLERANCE
-        return min(self._max_energy_consumption_kWh, max_energy_consumption)
+        return self._limit_energy_demand(
+            self._target_storage_temp_to_energy(self._max_temp_C, time_slot))
 
     def _calc_energy_to_buy_minimum(self, time_slot: DateTime) -> float:
-        min_energy_consumption = self._target_storage_temp_to_energy(
-            self.state.get_storage_temp_C(time_slot), time_slot)
-        assert min_energy_consumption > -FLOATING_POINT_TOLERANCE
-        return min(self._max_energy_consumption_kWh, min_energy_consumption)
+        return self._limit_energy_demand(self._target_storage_temp_to_energy(
+            self.state.get_storage_temp_C(time_slot), time_slot))
+
+    def _solver_input_parameters(self, time_slot: DateTime) -> Dict:
+        """Return the heatpump parameters that are needed by the solver for the time slot."""
+        return {
+            "tank_volume_l": self._tank_volume_l,
+            "current_storage_temp_C": self.state.get_storage_temp_C(time_slot),
+            "dh_supply_temp_C": self._water_supply_temp_C.profile[time_slot],
+            "dh_return_temp_C": self._water_return_temp_C.profile[time_slot],
+            "dh_flow_m3_per_hour": self._dh_water_flow_m3.profile[time_slot],
+        }
 
     def _calc_temp_decrease_K(self, time_slot: DateTime) -> float:
         dh_supply_temp = self._water_supply_temp_C.profile[time_slot]
@@ -201,40 +392,38 @@ class VirtualHeatpumpEnergyParameters(HeatPumpEnergyParametersBase):
 
     def _calculate_and_set_unmatched_demand(self, time_slot: DateTime):
         solver = HeatpumpStorageEnergySolver(
-            tank_volume_l=self._tank_volume_l,
-            current_storage_temp_C=self.state.get_storage_temp_C(time_slot),
-            dh_supply_temp_C=self._water_supply_temp_C.profile[time_slot],
-            dh_return_temp_C=self._water_return_temp_C.profile[time_slot],
-            dh_flow_m3_per_hour=self._dh_water_flow_m3.profile[time_slot],
+            **self._solver_input_parameters(time_slot),
             target_storage_temp_C=self.state.get_storage_temp_C(time_slot))
         solver.calculate_energy_from_storage_temp()
         self.state.update_unmatched_demand_kWh(time_slot, solver.energy_kWh)
 
     def _calc_temp_increase_K(self, time_slot: DateTime, traded_energy_kWh: float) -> float:
         storage_temp = self._energy_to_target_storage_temp(traded_energy_kWh, time_slot)
+        return self._storage_temp_to_temp_increase_K(time_slot, storage_temp)
+
+    def _storage_temp_to_temp_increase_K(
+            self, time_slot: DateTime, storage_temp_C: float) -> float:
         current_storage_temp = self.state.get_storage_temp_C(time_slot)
-        return storage_temp - current_storage_temp + self.state.get_temp_decrease_K(time_slot)
+        return storage_temp_C - current_storage_temp + self.state.get_temp_decrease_K(time_slot)
 
-    def _target_storage_temp_to_energy(
-            self, target_storage_temp_C: float, time_slot: DateTime) -> float:
-        """
-        Return the energy needed to be consumed by the heatpump in order to generate enough heat
-        to warm the water tank to storage_temp degrees C.
-         """
+    def _clamp_target_storage_temp(self, target_storage_temp_C: float) -> float:
         if not self._min_temp_C < target_storage_temp_C < self._max_temp_C:
             logger.info(
                 "Storage temp %s cannot exceed min (%s) / max (%s) tank temperatures.",
                 target_storage_temp_C, self._min_temp_C, self._max_temp_C)
             target_storage_temp_C = max(
                 min(target_storage_temp_C, self._max_temp_C), self._min_temp_C)
+        return target_storage_temp_C
 
+    def _target_storage_temp_to_energy(
+            self, target_storage_temp_C: float, time_slot: DateTime) -> float:
+        """
+        Return the energy needed to be consumed by the heatpump in order to generate enough heat
+        to warm the water tank to storage_temp degrees C.
+         """
         solver = HeatpumpStorageEnergySolver(
-            tank_volume_l=self._tank_volume_l,
-            current_storage_temp_C=self.state.get_storage_temp_C(time_slot),
-            dh_supply_temp_C=self._water_supply_temp_C.profile[time_slot],
-            dh_return_temp_C=self._water_return_temp_C.profile[time_slot],
-            dh_flow_m3_per_hour=self._dh_water_flow_m3.profile[time_slot],
-            target_storage_temp_C=target_storage_temp_C)
+            **self._solver_input_parameters(time_slot),
+            target_storage_temp_C=self._clamp_target_storage_temp(target_storage_temp_C))
         solver.calculate_energy_from_storage_temp()
 
         logger.debug(solver)
@@ -246,14 +435,8 @@ class VirtualHeatpumpEnergyParameters(HeatPumpEnergyParametersBase):
         Return the water storage temperature after the heatpump has consumed energy_kWh energy and
         produced heat with it.
          """
-        # pylint: disable=too-many-locals
         solver = HeatpumpStorageEnergySolver(
-            tank_volume_l=self._tank_volume_l,
-            current_storage_temp_C=self.state.get_storage_temp_C(time_slot),
-            dh_supply_temp_C=self._water_supply_temp_C.profile[time_slot],
-            dh_return_temp_C=self._water_return_temp_C.profile[time_slot],
-            dh_flow_m3_per_hour=self._dh_water_flow_m3.profile[time_slot],
-            energy_kWh=energy_kWh)
+            **self._solver_input_parameters(time_slot), energy_kWh=energy_kWh)
         solver.calculate_storage_temp_from_energy()
         logger.debug(solver)
 
@@ -276,11 +459,7 @@ class VirtualHeatpumpEnergyParameters(HeatPumpEnergyParametersBase):
             # Update last slot statistics (COP, heat demand, condenser temp)
             target_storage_temp_C = self.state.get_storage_temp_C(time_slot)
             solver = HeatpumpStorageEnergySolver(
-                tank_volume_l=self._tank_volume_l,
-                current_storage_temp_C=self.state.get_storage_temp_C(last_time_slot),
-                dh_supply_temp_C=self._water_supply_temp_C.profile[last_time_slot],
-                dh_return_temp_C=self._water_return_temp_C.profile[last_time_slot],
-                dh_flow_m3_per_hour=self._dh_water_flow_m3.profile[last_time_slot],
+                **self._solver_input_parameters(last_time_slot),
                 target_storage_temp_C=target_storage_temp_C)
             solver.calculate_energy_from_storage_temp()
             self.state.set_cop(last_time_slot, solver.cop)
@@ -296,9 +475,127 @@ class VirtualHeatpumpEnergyParameters(HeatPumpEnergyParametersBase):
 
     def event_market_cycle(self, current_time_slot):
         """To be called at the start of the market slot. """
-        self._rotate_profiles(current_time_slot)
-        self._populate_state(current_time_slot)
+        if not virtual_heatpump_fleet.populate_state(self, current_time_slot):
+            self._rotate_profiles(current_time_slot)
+            self._populate_state(current_time_slot)
         supply_temp = self._water_supply_temp_C.profile[current_time_slot]
         return_temp = self._water_return_temp_C.profile[current_time_slot]
         assert supply_temp >= return_temp, f"Supply temperature {supply_temp} has to be greater " \
                                            f"than {return_temp}, timeslot {current_time_slot}"
+
+
+class VirtualHeatpumpFleet:
+    """
+    Registry of the virtual heatpumps of the simulation. Populates the state of all registered
+    heatpumps for a market slot in one vectorised pass, on the first market cycle event of a
+    registered heatpump for this market slot. Follows the same steps as
+    VirtualHeatpumpEnergyParameters._populate_state, but each solver step is evaluated with
+    NumPy for the whole fleet.
+    """
+    # pylint: disable=protected-access
+
+    def __init__(self):
+        self._heatpumps: "WeakSet[VirtualHeatpumpEnergyParameters]" = WeakSet()
+        self._populated_time_slot: Optional[DateTime] = None
+        self._populated_heatpumps: "WeakSet[VirtualHeatpumpEnergyParameters]" = WeakSet()
+
+    def __len__(self):
+        return len(self._heatpumps)
+
+    def register(self, heatpump: VirtualHeatpumpEnergyParameters) -> None:
+        """Add a heatpump to the fleet."""
+        self._heatpumps.add(heatpump)
+
+    def unregister(self, heatpump: VirtualHeatpumpEnergyParameters) -> None:
+        """Remove a heatpump from the fleet."""
+        self._heatpumps.discard(heatpump)
+        self._populated_heatpumps.discard(heatpump)
+
+    def populate_state(self, heatpump: VirtualHeatpumpEnergyParameters,
+                       time_slot: DateTime) -> bool:
+        """
+        Make sure that the state of the heatpump is populated for the time slot, by populating
+        the state of the whole fleet if needed. Returns False if the heatpump is not part of the
+        fleet, therefore its state needs to be populated by the heatpump itself.
+        """
+        if heatpump not in self._heatpumps:
+            return False
+        if time_slot != self._populated_time_slot:
+            self._populated_time_slot = time_slot
+            self._populated_heatpumps = WeakSet()
+        if heatpump not in self._populated_heatpumps:
+            heatpumps = [hp for hp in self._heatpumps if hp not in self._populated_heatpumps]
+            self._populate_fleet_state(heatpumps, time_slot)
+            self._populated_heatpumps.update(heatpumps)
+        return True
+
+    @staticmethod
+    def _solver_input_arrays(
+            heatpumps: List[VirtualHeatpumpEnergyParameters],
+            time_slots: List[DateTime]) -> Dict[str, np.ndarray]:
+        parameters = [hp._solver_input_parameters(time_slot)
+                      for hp, time_slot in zip(heatpumps, time_slots)]
+        return {key: np.array([hp_parameters[key] for hp_parameters in parameters], dtype=float)
+                for key in parameters[0]}
+
+    def _populate_fleet_state(
+            self, heatpumps: List[VirtualHeatpumpEnergyParameters], time_slot: DateTime) -> None:
+        slot_length_sec = GlobalConfig.slot_length.total_seconds()
+        for hp in heatpumps:
+            hp._rotate_profiles(time_slot)
+        last_time_slots = {hp: hp.last_time_slot(time_slot) for hp in heatpumps}
+        with_last_slot = [hp for hp in heatpumps
+                          if last_time_slots[hp] in hp._water_supply_temp_C.profile]
+
+        # Update temp increase of the last market slot
+        traded = [hp for hp in with_last_slot
+                  if hp.state.get_energy_consumption_kWh(last_time_slots[hp]) >
+                  FLOATING_POINT_TOLERANCE]
+        if traded:
+            storage_temps_C = calculate_storage_temp_from_energy_array(
+                **self._solver_input_arrays(traded, [last_time_slots[hp] for hp in traded]),
+                energy_kWh=np.array([hp.state.get_energy_consumption_kWh(last_time_slots[hp])
+                                     for hp in traded]),
+                slot_length_sec=slot_length_sec)
+            for hp, storage_temp_C in zip(traded, storage_temps_C):
+                hp.state.update_temp_increase_K(
+                    last_time_slots[hp], hp._storage_temp_to_temp_increase_K(
+                        last_time_slots[hp], float(storage_temp_C)))
+
+        # Update last slot statistics (COP, heat demand, condenser temp)
+        if with_last_slot:
+            _, cops, condenser_temps_C, q_outs_J = calculate_energy_from_storage_temp_array(
+                **self._solver_input_arrays(
+                    with_last_slot, [last_time_slots[hp] for hp in with_last_slot]),
+                target_storage_temp_C=np.array(
+                    [hp.state.get_storage_temp_C(time_slot) for hp in with_last_slot]),
+                slot_length_sec=slot_length_sec)
+            for hp, cop, condenser_temp_C, q_out_J in zip(
+                    with_last_slot, cops, condenser_temps_C, q_outs_J):
+                hp.state.set_cop(last_time_slots[hp], float(cop))
+                hp.state.set_condenser_temp(last_time_slots[hp], float(condenser_temp_C))
+                hp.state.set_heat_demand(last_time_slots[hp], float(q_out_J))
+
+        for hp in heatpumps:
+            hp.state.update_storage_temp(time_slot)
+            hp.state.set_temp_decrease_K(time_slot, hp._calc_temp_decrease_K(time_slot))
+
+        # Calculate the minimum and maximum energy demand in the same pass
+        if heatpumps:
+            input_arrays = self._solver_input_arrays(heatpumps, [time_slot] * len(heatpumps))
+            energies_kWh, _, _, _ = calculate_energy_from_storage_temp_array(
+                **{key: np.tile(values, 2) for key, values in input_arrays.items()},
+                target_storage_temp_C=np.array(
+                    [hp._clamp_target_storage_temp(hp.state.get_storage_temp_C(time_slot))
+                     for hp in heatpumps] +
+                    [hp._clamp_target_storage_temp(hp._max_temp_C) for hp in heatpumps]),
+                slot_length_sec=slot_length_sec)
+            for hp, min_energy_kWh, max_energy_kWh in zip(
+                    heatpumps, energies_kWh[:len(heatpumps)], energies_kWh[len(heatpumps):]):
+                hp.state.set_min_energy_demand_kWh(
+                    time_slot, hp._limit_energy_demand(float(min_energy_kWh)))
+                hp.state.set_max_energy_demand_kWh(
+                    time_slot, hp._limit_energy_demand(float(max_energy_kWh)))
+
+
+virtual_heatpump_fleet = VirtualHeatpumpFleet()
@@ -243,7 +243,7 @@ class ExternalMixin:
         Change assets' connection status including the connection to the aggregator.
         """
         if self.connected and not self._is_registered:
-            self.redis.aggregator.device_aggregator_mapping.pop(self.device.uuid, None)
+            self.redis.aggregator.remove_device(self.device.uuid)
         self.connected = self._is_registered
 
     def _device_info(self, payload: Dict) -> None:
@@ -476,7 +476,7 @@ class ExternalMixin:
                     "area_uuid": self.device.uuid,
                     "device_info": self._device_info_dict
                 }
-                self.redis.publish_json(self.channel_names.tick, current_tick_info)
+                self.redis.publish_event_json(self.channel_names.tick, current_tick_info)
 
     def event_market_cycle(self) -> None:
         """Handler for the market cycle event."""
@@ -532,7 +532,7 @@ class ExternalMixin:
                                    if trade.residual is not None and trade.is_offer_trade
                                    else "None"}
 
-            global_objects.external_global_stats.update()
+            global_objects.external_global_stats.mark_area_dirty(self.device)
             self.redis.aggregator.add_batch_trade_event(self.device.uuid, event_response_dict)
         elif self.connected:
             event_response_dict = {"device_info": self._device_info_dict,
@@ -556,7 +556,7 @@ class ExternalMixin:
             event_response_dict[bid_offer_key] = (
                 trade.match_details["bid"].id if is_bid_trade else trade.match_details["offer"].id)
 
-            self.redis.publish_json(self.channel_names.trade, event_response_dict)
+            self.redis.publish_event_json(self.channel_names.trade, event_response_dict)
 
     def event_bid_traded(self, market_id: str, bid_trade: Trade):
         """Handler for the event when a bid is accepted for trading."""
@@ -582,7 +582,7 @@ class ExternalMixin:
                 "event": "finish",
                 "area_uuid": self.device.uuid
             }
-            self.redis.publish_json(self.channel_names.finish, deactivate_msg)
+            self.redis.publish_event_json(self.channel_names.finish, deactivate_msg)
 
     def _bid_aggregator(self, arguments: Dict):
         """Callback for the bid endpoint when sent by aggregator."""
@@ -690,7 +690,7 @@ class ExternalMixin:
             get_market_maker_rate_from_config(self.area.current_market))
         market_info["last_market_stats"] = (
             self.area.stats.get_price_stats_current_market())
-        self.redis.publish_json(self.channel_names.market, market_info)
+        self.redis.publish_event_json(self.channel_names.market, market_info)
 
     def filter_degrees_of_freedom_arguments(self, order_arguments: Dict) -> Tuple[Dict, List[str]]:
         """Filter the arguments of an incoming order to remove Degrees of Freedom if necessary."""
@@ -48,12 +48,12 @@ class FutureTemplateStrategyBidUpdater(TemplateStrategyBidUpdater):
             return []
         return area.future_markets.market_time_slots
 
-    def time_for_price_update(self, strategy: "BaseStrategy", time_slot: DateTime) -> bool:
-        """Check if the prices of bids/offers should be updated."""
+    def _seconds_until_price_update(self, area: "Area", time_slot: DateTime) -> float:
+        """Return the seconds until the next price update of the time slot (<= 0 if it is due)."""
         return (
-                self._elapsed_seconds(strategy.area)
-                - self.market_slot_added_time_mapping[time_slot] >= (
-                        self.update_interval.seconds * self.update_counter[time_slot]))
+                self.market_slot_added_time_mapping[time_slot]
+                + self.update_interval.seconds * self.update_counter[time_slot]
+                - self._elapsed_seconds(area))
 
     def update(self, market: "FutureMarkets", strategy: "BaseStrategy") -> None:
         """Update the price of existing bids to reflect the new rates."""
@@ -86,12 +86,12 @@ class FutureTemplateStrategyOfferUpdater(TemplateStrategyOfferUpdater):
             return []
         return area.future_markets.market_time_slots
 
-    def time_for_price_update(self, strategy: "BaseStrategy", time_slot: DateTime) -> bool:
-        """Check if the prices of bids/offers should be updated."""
+    def _seconds_until_price_update(self, area: "Area", time_slot: DateTime) -> float:
+        """Return the seconds until the next price update of the time slot (<= 0 if it is due)."""
         return (
-                self._elapsed_seconds(strategy.area)
-                - self.market_slot_added_time_mapping[time_slot] >= (
-                        self.update_interval.seconds * self.update_counter[time_slot]))
+                self.market_slot_added_time_mapping[time_slot]
+                + self.update_interval.seconds * self.update_counter[time_slot]
+                - self._elapsed_seconds(area))
 
     def update(self, market: "FutureMarkets", strategy: "BaseStrategy") -> None:
         """Update the price of existing offers to reflect the new rates."""
@@ -159,6 +159,9 @@ class HeatPumpStrategy(TradingStrategyBase):
     def event_activate(self, **kwargs):
         self._energy_params.event_activate()
 
+    def deactivate(self):
+        self._energy_params.event_deactivate()
+
     def event_market_cycle(self) -> None:
         super().event_market_cycle()
         spot_market = self.area.spot_market
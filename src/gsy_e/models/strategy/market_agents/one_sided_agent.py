@@ -15,7 +15,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Union
 
 from numpy.random import random
 
@@ -24,7 +24,7 @@ from gsy_e.models.strategy.market_agents.market_agent import MarketAgent
 from gsy_e.models.strategy.market_agents.one_sided_engine import MAEngine
 
 if TYPE_CHECKING:
-    from gsy_framework.data_classes import Offer, Trade
+    from gsy_framework.data_classes import Bid, Offer, Trade
 
 
 class OneSidedAgent(MarketAgent):
@@ -83,6 +83,11 @@ class OneSidedAgent(MarketAgent):
                                      accepted_offer=accepted_offer,
                                      residual_offer=residual_offer)
 
+    # pylint: disable=unused-argument
+    def event_order_amended(self, *, market_id: str, order: Union["Offer", "Bid"]):
+        for engine in sorted(self.engines, key=lambda _: random()):
+            engine.event_order_amended(order=order)
+
     def delete_engines(self) -> None:
         """Deletes all engine buffers, theirs contents and the engines themselves."""
         for engine in self.engines:
@@ -298,6 +298,32 @@ class MAEngine:
                              f"{short_offer_bid_log_str(local_split_offer)} and "
                              f"{short_offer_bid_log_str(local_residual_offer)}")
 
+    def event_order_amended(self, *, order):
+        """Perform actions that need to be done when ORDER_AMENDED event is triggered."""
+        if not isinstance(order, Offer):
+            return
+        offer_info = self.forwarded_offers.get(order.id)
+        if not offer_info or offer_info.source_offer.id != order.id:
+            # Amendment doesn't concern us (or it is the amendment of our own forwarded offer)
+            return
+
+        try:
+            updated_price = limit_float_precision(
+                self.markets.target.fee_class.update_forwarded_offer_with_fee(
+                    order.energy_rate, order.original_energy_rate) * order.energy)
+            amended_offer = self.markets.target.amend_order(
+                offer_info.target_offer.id, updated_price, original_price=order.original_price)
+        except MarketException:
+            # The forwarded offer cannot be amended (e.g. the grid fees of the target market lead
+            # to a negative price), delete it instead, it will be forwarded again if possible.
+            self.event_offer_deleted(offer=order)
+            return
+
+        self.owner.offers.amend(amended_offer, self.markets.target.id)
+        self._add_to_forward_offers(order, amended_offer)
+        self.owner.log.trace(f"Amending forwarded offer {offer_info.target_offer} "
+                             f"to {amended_offer}")
+
     def _add_to_forward_offers(self, source_offer, target_offer):
         offer_info = OfferInfo(Offer.copy(source_offer), Offer.copy(target_offer))
         self.forwarded_offers[source_offer.id] = offer_info
@@ -347,3 +373,12 @@ class BalancingEngine(MAEngine):
         self._add_to_forward_offers(offer, forwarded_balancing_offer)
         self.owner.log.trace(f"Forwarding balancing offer {offer} to {forwarded_balancing_offer}")
         return forwarded_balancing_offer
+
+    def event_order_amended(self, *, order):
+        """Delete the forwarded balancing offer of the amended offer.
+
+        Balancing markets do not support amending their offers, therefore the offer is forwarded
+        again with the updated price on the next tick.
+        """
+        if isinstance(order, Offer):
+            self.event_offer_deleted(offer=order)
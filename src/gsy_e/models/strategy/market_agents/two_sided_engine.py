@@ -272,6 +272,31 @@ class TwoSidedEngine(MAEngine):
                              f"{short_offer_bid_log_str(local_split_bid)} and "
                              f"{short_offer_bid_log_str(local_residual_bid)}")
 
+    def event_order_amended(self, *, order):
+        """Perform actions that need to be done when ORDER_AMENDED event is triggered."""
+        if not isinstance(order, Bid):
+            super().event_order_amended(order=order)
+            return
+        bid_info = self.forwarded_bids.get(order.id)
+        if not bid_info or bid_info.source_bid.id != order.id:
+            # Amendment doesn't concern us (or it is the amendment of our own forwarded bid)
+            return
+
+        try:
+            updated_price = limit_float_precision((
+                self.markets.source.fee_class.update_forwarded_bid_with_fee(
+                    order.energy_rate, order.original_energy_rate)) * order.energy)
+            amended_bid = self.markets.target.amend_order(
+                bid_info.target_bid.id, updated_price, original_price=order.original_price)
+        except MarketException:
+            # The forwarded bid cannot be amended, delete it instead, it will be forwarded again
+            # if possible.
+            self.event_bid_deleted(bid=order)
+            return
+
+        self._add_to_forward_bids(order, amended_bid)
+        self.owner.log.trace(f"Amending forwarded bid {bid_info.target_bid} to {amended_bid}")
+
     def _add_to_forward_bids(self, source_bid, target_bid):
         bid_info = BidInfo(source_bid, target_bid)
         self.forwarded_bids[source_bid.id] = bid_info
@@ -0,0 +1,85 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from typing import Any, Dict, Optional
+
+from gsy_framework.constants_limits import GlobalConfig
+from gsy_framework.utils import find_object_of_same_weekday_and_time
+from pendulum import DateTime
+
+MINUTES_PER_WEEK = 7 * 24 * 60
+
+
+def _get_minute_of_week(time_slot: DateTime) -> int:
+    return (time_slot.weekday() * 24 + time_slot.hour) * 60 + time_slot.minute
+
+
+class ProfileSlotIndex:
+    """Lookup table of a profile, that returns the same values as
+    find_object_of_same_weekday_and_time(profile, time_slot).
+
+    For the canary network, find_object_of_same_weekday_and_time maps the time slot to the
+    timestamp of the same weekday and time in the first week of the profile, which constructs a
+    new DateTime on every call. The index folds the timestamps of the profile to their minute of
+    the week once, so that the lookup of a time slot is a read of a table of at most
+    MINUTES_PER_WEEK values. Otherwise, the profile itself is the table of the time slots.
+    Time slots that are not found in the table are looked up in the profile, in order to keep
+    the behaviour (e.g. logging) of find_object_of_same_weekday_and_time.
+    """
+
+    __slots__ = ("profile", "_is_canary_network", "_values_per_minute_of_week")
+
+    def __init__(self, profile: Dict[DateTime, Any]):
+        self.profile = profile
+        self._is_canary_network = GlobalConfig.IS_CANARY_NETWORK
+        self._values_per_minute_of_week: Optional[Dict[int, Any]] = (
+            self._fold_to_week(profile) if self._is_canary_network else None)
+
+    @staticmethod
+    def _fold_to_week(profile: Dict[DateTime, Any]) -> Dict[int, Any]:
+        # find_object_of_same_weekday_and_time maps the time slots to the same weekday and time
+        # in the 7 days that start on the day of the first timestamp of the profile. The values
+        # of these timestamps are read directly, in order not to log an error for every
+        # timestamp of the profile whose weekday and time are not found in these days.
+        if not profile:
+            return {}
+        start_date = next(iter(profile)).date()
+        values_per_minute_of_week = {}
+        for timestamp, value in profile.items():
+            if value is not None and 0 <= (timestamp.date() - start_date).days < 7:
+                values_per_minute_of_week[_get_minute_of_week(timestamp)] = value
+        return values_per_minute_of_week
+
+    def get(self, time_slot: DateTime) -> Any:
+        """Return the value of the profile for the time slot, None if it does not exist."""
+        if self._is_canary_network != GlobalConfig.IS_CANARY_NETWORK:
+            return find_object_of_same_weekday_and_time(self.profile, time_slot)
+        if self._values_per_minute_of_week is None:
+            return self.profile.get(time_slot)
+        value = self._values_per_minute_of_week.get(_get_minute_of_week(time_slot))
+        if value is None:
+            return find_object_of_same_weekday_and_time(self.profile, time_slot)
+        return value
+
+
+def get_profile_slot_index(profile: Dict[DateTime, Any]) -> ProfileSlotIndex:
+    """Return the index of the profile. The index of a shared (read-only) profile is created
+    once and shared between the strategies."""
+    get_index = getattr(profile, "get_index", None)
+    if get_index is not None:
+        return get_index(ProfileSlotIndex)
+    return ProfileSlotIndex(profile)
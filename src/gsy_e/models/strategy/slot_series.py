@@ -0,0 +1,273 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from array import array
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from gsy_framework.constants_limits import GlobalConfig
+from pendulum import DateTime
+
+# Minimal number of cells of the buffer of a series
+MIN_CAPACITY = 8
+# The buffer is not extended to more than SPARSE_CAPACITY_FACTOR times the number of values
+# (e.g. for time slots that are far apart), these values are kept in the dict of the series.
+SPARSE_CAPACITY_FACTOR = 4
+
+_MISSING = object()
+
+
+class _SlotSeriesItems(ItemsView):
+    def __iter__(self):
+        yield from self._mapping.iter_items()
+
+
+class _SlotSeriesValues(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping.iter_items():
+            yield value
+
+
+class SlotSeries(MutableMapping):
+    """Values of a strategy per market slot (time slot -> value), stored in an array.
+
+    The values are stored at the offset of their time slot (in market slots) from the first
+    stored time slot, in a ring buffer that covers the window of the stored time slots. Thus
+    reading and writing the value of a time slot does not hash the DateTime, and
+    delete_before() removes the values of the past market slots by moving the start of the
+    window. Time slots that are not aligned to the market slots (or naive datetimes) are kept
+    in a dict, so the series behaves like a dict for all keys.
+
+    The values are stored in an array of the given typecode (e.g. "d" for floats), or in a list
+    if the typecode is None. If a default value is given, reading the value of a missing time
+    slot stores and returns the default value (like a defaultdict).
+    Iteration follows the order of the time slots, followed by the keys of the dict.
+    """
+
+    def __init__(self, values=(), *, typecode: Optional[str] = "d",
+                 slot_length: timedelta = None, default: Any = None, has_default: bool = False):
+        # pylint: disable=too-many-arguments
+        self._typecode = typecode
+        self._slot_length = timedelta(seconds=(
+            slot_length or GlobalConfig.slot_length).total_seconds())
+        self._default = default
+        self._has_default = has_default or default is not None
+        # First stored time slot, that is used as the origin of the slot offsets
+        self._origin: Optional[datetime] = None
+        # Slot offset of the first cell of the window and its position in the buffer
+        self._start = 0
+        self._head = 0
+        self._keys: List[Optional[DateTime]] = []
+        self._values = self._create_buffer(0)
+        self._number_of_slots = 0
+        self._other: Dict[Any, Any] = {}
+        self.update(values)
+
+    def _create_buffer(self, capacity: int):
+        if self._typecode is None:
+            return [None] * capacity
+        return array(self._typecode, bytes(array(self._typecode).itemsize * capacity))
+
+    def _get_offset(self, time_slot, set_origin: bool = False) -> Optional[int]:
+        """Return the slot offset of the time slot, None if it is not stored in the buffer."""
+        if not isinstance(time_slot, datetime) or time_slot.tzinfo is None:
+            return None
+        if self._origin is None:
+            if not set_origin:
+                return None
+            self._origin = time_slot
+        # The datetime subtraction is used, because the one of pendulum returns a Period.
+        offset, remainder = divmod(datetime.__sub__(time_slot, self._origin), self._slot_length)
+        return None if remainder else offset
+
+    def _get_position(self, offset: int) -> Optional[int]:
+        capacity = len(self._keys)
+        if not 0 <= offset - self._start < capacity:
+            return None
+        return (self._head + offset - self._start) % capacity
+
+    def _lookup(self, time_slot) -> Tuple[bool, Any]:
+        offset = self._get_offset(time_slot)
+        if offset is not None:
+            position = self._get_position(offset)
+            if position is not None and self._keys[position] is not None:
+                return True, self._values[position]
+        if self._other and time_slot in self._other:
+            return True, self._other[time_slot]
+        return False, None
+
+    def _iter_cells(self) -> Iterator[Tuple[int, int]]:
+        """Yield the slot offset and the buffer position of all occupied cells."""
+        capacity = len(self._keys)
+        for index in range(capacity):
+            position = (self._head + index) % capacity
+            if self._keys[position] is not None:
+                yield self._start + index, position
+
+    def _extend_window(self, offset: int) -> bool:
+        """Extend the buffer to contain the offset. Return False if it would be too sparse."""
+        cells = [(cell_offset, self._keys[position], self._values[position])
+                 for cell_offset, position in self._iter_cells()]
+        first = min(offset, cells[0][0]) if cells else offset
+        last = max(offset, cells[-1][0]) if cells else offset
+        if last - first + 1 > max(MIN_CAPACITY, SPARSE_CAPACITY_FACTOR * (len(cells) + 1)):
+            return False
+        capacity = max(MIN_CAPACITY, len(self._keys))
+        while capacity < last - first + 1:
+            capacity *= 2
+        if cells and first == offset:
+            # Values are added before the window, leave space for more of them.
+            first = max(first - (capacity - (last - first + 1)), first - len(cells))
+        self._start = first
+        self._head = 0
+        self._keys = [None] * capacity
+        self._values = self._create_buffer(capacity)
+        for cell_offset, key, value in cells:
+            self._keys[cell_offset - first] = key
+            self._values[cell_offset - first] = value
+        return True
+
+    def __getitem__(self, time_slot):
+        found, value = self._lookup(time_slot)
+        if found:
+            return value
+        if not self._has_default:
+            raise KeyError(time_slot)
+        self[time_slot] = self._default
+        return self._lookup(time_slot)[1]
+
+    def __setitem__(self, time_slot, value) -> None:
+        offset = self._get_offset(time_slot, set_origin=True)
+        if offset is not None and not (self._other and time_slot in self._other):
+            position = self._get_position(offset)
+            if position is None and self._extend_window(offset):
+                position = self._get_position(offset)
+            if position is not None:
+                self._values[position] = value
+                if self._keys[position] is None:
+                    self._keys[position] = time_slot
+                    self._number_of_slots += 1
+                return
+        self._other[time_slot] = value
+
+    def __delitem__(self, time_slot) -> None:
+        offset = self._get_offset(time_slot)
+        position = None if offset is None else self._get_position(offset)
+        if position is not None and self._keys[position] is not None:
+            self._clear_cell(position)
+            return
+        del self._other[time_slot]
+
+    def _clear_cell(self, position: int) -> None:
+        self._keys[position] = None
+        if self._typecode is None:
+            self._values[position] = None
+        self._number_of_slots -= 1
+
+    def __contains__(self, time_slot) -> bool:
+        return self._lookup(time_slot)[0]
+
+    def __iter__(self) -> Iterator:
+        for _, position in self._iter_cells():
+            yield self._keys[position]
+        yield from list(self._other)
+
+    def iter_items(self) -> Iterator[Tuple[Any, Any]]:
+        """Yield the (time slot, value) pairs of the series."""
+        for _, position in self._iter_cells():
+            yield self._keys[position], self._values[position]
+        yield from list(self._other.items())
+
+    def __len__(self) -> int:
+        return self._number_of_slots + len(self._other)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.iter_items())})"
+
+    def __copy__(self) -> "SlotSeries":
+        return self.copy()
+
+    def copy(self) -> "SlotSeries":
+        """Return a shallow copy of the series."""
+        return self.__class__(
+            self.iter_items(), typecode=self._typecode, slot_length=self._slot_length,
+            default=self._default, has_default=self._has_default)
+
+    def items(self) -> ItemsView:
+        return _SlotSeriesItems(self)
+
+    def values(self) -> ValuesView:
+        return _SlotSeriesValues(self)
+
+    def get(self, time_slot, default=None):
+        found, value = self._lookup(time_slot)
+        return value if found else default
+
+    def pop(self, time_slot, default=_MISSING):
+        found, value = self._lookup(time_slot)
+        if not found:
+            if default is _MISSING:
+                raise KeyError(time_slot)
+            return default
+        del self[time_slot]
+        return value
+
+    def setdefault(self, time_slot, default=None):
+        found, value = self._lookup(time_slot)
+        if found:
+            return value
+        self[time_slot] = default
+        return self._lookup(time_slot)[1]
+
+    def clear(self) -> None:
+        self._origin = None
+        self._start = 0
+        self._head = 0
+        self._keys = []
+        self._values = self._create_buffer(0)
+        self._number_of_slots = 0
+        self._other.clear()
+
+    def delete_before(self, time_slot: DateTime) -> None:
+        """Delete the values of all time slots before the given time slot."""
+        if self._number_of_slots and self._origin is not None:
+            offset, remainder = divmod(
+                datetime.__sub__(time_slot, self._origin), self._slot_length)
+            if remainder:
+                offset += 1
+            capacity = len(self._keys)
+            number_of_cells = min(offset - self._start, capacity)
+            for index in range(number_of_cells):
+                position = (self._head + index) % capacity
+                if self._keys[position] is not None:
+                    self._clear_cell(position)
+            if number_of_cells > 0:
+                self._head = (self._head + number_of_cells) % capacity
+                self._start = offset
+        if self._other:
+            for key in [key for key in self._other if key < time_slot]:
+                del self._other[key]
+
+
+def delete_time_slots_before(series: Dict[DateTime, Any], time_slot: DateTime) -> None:
+    """Delete the values of all time slots before the given time slot from a series or dict."""
+    if isinstance(series, SlotSeries):
+        series.delete_before(time_slot)
+        return
+    for key in [key for key in series if key < time_slot]:
+        del series[key]
@@ -24,7 +24,8 @@ from gsy_framework.utils import (
 from pendulum import DateTime
 
 from gsy_e.constants import FLOATING_POINT_TOLERANCE
-from gsy_e.gsy_e_core.util import is_time_slot_in_past_markets
+from gsy_e.gsy_e_core.util import get_earliest_present_market_time_slot
+from gsy_e.models.strategy.slot_series import SlotSeries, delete_time_slots_before
 
 
 class UnexpectedStateException(Exception):
@@ -227,9 +228,9 @@ class ConsumptionState(ProsumptionInterface):
     def __init__(self):
         super().__init__()
         # Energy that the load wants to consume (given by the profile or live energy requirements)
-        self._desired_energy_Wh: Dict = {}
+        self._desired_energy_Wh: Dict[DateTime, float] = SlotSeries()
         # Energy that the load needs to consume. It's reduced when new energy is bought
-        self._energy_requirement_Wh: Dict = {}
+        self._energy_requirement_Wh: Dict[DateTime, float] = SlotSeries()
         self._total_energy_demanded_Wh: int = 0
 
     def get_state(self) -> Dict:
@@ -291,14 +292,9 @@ class ConsumptionState(ProsumptionInterface):
 
     def delete_past_state_values(self, current_time_slot: DateTime):
         """Delete data regarding energy consumption for past market slots."""
-        to_delete = []
-        for market_slot in self._energy_requirement_Wh:
-            if is_time_slot_in_past_markets(market_slot, current_time_slot):
-                to_delete.append(market_slot)
-
-        for market_slot in to_delete:
-            self._energy_requirement_Wh.pop(market_slot, None)
-            self._desired_energy_Wh.pop(market_slot, None)
+        earliest_time_slot = get_earliest_present_market_time_slot(current_time_slot)
+        delete_time_slots_before(self._energy_requirement_Wh, earliest_time_slot)
+        delete_time_slots_before(self._desired_energy_Wh, earliest_time_slot)
 
     def get_desired_energy_Wh(self, time_slot, default_value=0.0):
         """Return the expected consumed energy at a specific market slot."""
@@ -310,8 +306,8 @@ class ProductionState(ProsumptionInterface):
 
     def __init__(self):
         super().__init__()
-        self._available_energy_kWh = {}
-        self._energy_production_forecast_kWh = {}
+        self._available_energy_kWh: Dict[DateTime, float] = SlotSeries()
+        self._energy_production_forecast_kWh: Dict[DateTime, float] = SlotSeries()
 
     def get_state(self) -> Dict:
         """Return the current state of the device. Extends super implementation."""
@@ -366,14 +362,9 @@ class ProductionState(ProsumptionInterface):
 
     def delete_past_state_values(self, current_time_slot: DateTime):
         """Delete data regarding energy production for past market slots."""
-        to_delete = []
-        for market_slot in self._available_energy_kWh:
-            if is_time_slot_in_past_markets(market_slot, current_time_slot):
-                to_delete.append(market_slot)
-
-        for market_slot in to_delete:
-            self._available_energy_kWh.pop(market_slot, None)
-            self._energy_production_forecast_kWh.pop(market_slot, None)
+        earliest_time_slot = get_earliest_present_market_time_slot(current_time_slot)
+        delete_time_slots_before(self._available_energy_kWh, earliest_time_slot)
+        delete_time_slots_before(self._energy_production_forecast_kWh, earliest_time_slot)
 
     def get_energy_production_forecast_kWh(self, time_slot: DateTime, default_value: float = 0.0):
         """Return the expected produced energy at a specific market slot."""
@@ -15,7 +15,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from collections import defaultdict
 from logging import getLogger
 from typing import Dict
 
@@ -24,6 +23,7 @@ from gsy_framework.utils import (
 from pendulum import DateTime, duration
 
 from gsy_e import constants
+from gsy_e.models.strategy.slot_series import SlotSeries, delete_time_slots_before
 from gsy_e.models.strategy.state.base_states import StateInterface
 
 log = getLogger(__name__)
@@ -35,18 +35,25 @@ class HeatPumpState(StateInterface):
 
     def __init__(
             self, initial_temp_C: float, slot_length: duration, min_storage_temp_C: float):
-        # the defaultdict was only selected for the initial slot
-        self._storage_temp_C: Dict[DateTime, float] = defaultdict(lambda: initial_temp_C)
-        self._min_energy_demand_kWh: Dict[DateTime, float] = {}
-        self._max_energy_demand_kWh: Dict[DateTime, float] = {}
+        # the default value was only selected for the initial slot
+        self._storage_temp_C: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=initial_temp_C)
+        self._min_energy_demand_kWh: Dict[DateTime, float] = SlotSeries(slot_length=slot_length)
+        self._max_energy_demand_kWh: Dict[DateTime, float] = SlotSeries(slot_length=slot_length)
         # buffers for increase and  decrease of storage
-        self._temp_decrease_K: Dict[DateTime, float] = defaultdict(lambda: 0)
-        self._temp_increase_K: Dict[DateTime, float] = defaultdict(lambda: 0)
-        self._energy_consumption_kWh: Dict[DateTime, float] = defaultdict(lambda: 0)
-        self._unmatched_demand_kWh: Dict[DateTime, float] = defaultdict(lambda: 0)
-        self._cop: Dict[DateTime, float] = defaultdict(lambda: 0)
-        self._condenser_temp_C: Dict[DateTime, float] = defaultdict(lambda: 0)
-        self._heat_demand_J: Dict[DateTime, float] = defaultdict(lambda: 0)
+        self._temp_decrease_K: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=0)
+        self._temp_increase_K: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=0)
+        self._energy_consumption_kWh: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=0)
+        self._unmatched_demand_kWh: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=0)
+        self._cop: Dict[DateTime, float] = SlotSeries(slot_length=slot_length, default=0)
+        self._condenser_temp_C: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=0)
+        self._heat_demand_J: Dict[DateTime, float] = SlotSeries(
+            slot_length=slot_length, default=0)
         self._total_traded_energy_kWh: float = 0
         self._slot_length = slot_length
         self._min_storage_temp_C = min_storage_temp_C
@@ -169,20 +176,18 @@ class HeatPumpState(StateInterface):
         }
 
     def restore_state(self, state_dict: Dict):
-        self._storage_temp_C = convert_str_to_pendulum_in_dict(state_dict["storage_temp_C"])
-        self._temp_decrease_K = convert_str_to_pendulum_in_dict(state_dict["temp_decrease_K"])
-        self._temp_increase_K = convert_str_to_pendulum_in_dict(state_dict["temp_increase_K"])
-        self._energy_consumption_kWh = convert_str_to_pendulum_in_dict(
-            state_dict["energy_consumption_kWh"])
-        self._min_energy_demand_kWh = convert_str_to_pendulum_in_dict(
-            state_dict["min_energy_demand_kWh"])
-        self._max_energy_demand_kWh = convert_str_to_pendulum_in_dict(
-            state_dict["max_energy_demand_kWh"])
-        self._unmatched_demand_kWh = convert_str_to_pendulum_in_dict(
-            state_dict["unmatched_demand_kWh"])
-        self._cop = convert_str_to_pendulum_in_dict(state_dict["cop"])
-        self._condenser_temp_C = convert_str_to_pendulum_in_dict(state_dict["condenser_temp_C"])
-        self._heat_demand_J = convert_str_to_pendulum_in_dict(state_dict["heat_demand_J"])
+        for time_series, key in ((self._storage_temp_C, "storage_temp_C"),
+                                 (self._temp_decrease_K, "temp_decrease_K"),
+                                 (self._temp_increase_K, "temp_increase_K"),
+                                 (self._energy_consumption_kWh, "energy_consumption_kWh"),
+                                 (self._min_energy_demand_kWh, "min_energy_demand_kWh"),
+                                 (self._max_energy_demand_kWh, "max_energy_demand_kWh"),
+                                 (self._unmatched_demand_kWh, "unmatched_demand_kWh"),
+                                 (self._cop, "cop"),
+                                 (self._condenser_temp_C, "condenser_temp_C"),
+                                 (self._heat_demand_J, "heat_demand_J")):
+            time_series.clear()
+            time_series.update(convert_str_to_pendulum_in_dict(state_dict[key]))
         self._total_traded_energy_kWh = state_dict["total_traded_energy_kWh"]
         self._slot_length = duration(seconds=state_dict["slot_length"])
         self._min_storage_temp_C = state_dict["min_storage_temp_C"]
@@ -191,16 +196,12 @@ class HeatPumpState(StateInterface):
         if not current_time_slot or constants.RETAIN_PAST_MARKET_STRATEGIES_STATE:
             return
         last_time_slot = self._last_time_slot(current_time_slot)
-        self._delete_time_slots(self._min_energy_demand_kWh, last_time_slot)
-        self._delete_time_slots(self._max_energy_demand_kWh, last_time_slot)
-        self._delete_time_slots(self._energy_consumption_kWh, last_time_slot)
-        self._delete_time_slots(self._storage_temp_C, last_time_slot)
-        self._delete_time_slots(self._temp_increase_K, last_time_slot)
-        self._delete_time_slots(self._temp_decrease_K, last_time_slot)
-        self._delete_time_slots(self._unmatched_demand_kWh, last_time_slot)
-        self._delete_time_slots(self._cop, last_time_slot)
-        self._delete_time_slots(self._condenser_temp_C, last_time_slot)
-        self._delete_time_slots(self._heat_demand_J, last_time_slot)
+        for time_series in (self._min_energy_demand_kWh, self._max_energy_demand_kWh,
+                            self._energy_consumption_kWh, self._storage_temp_C,
+                            self._temp_increase_K, self._temp_decrease_K,
+                            self._unmatched_demand_kWh, self._cop, self._condenser_temp_C,
+                            self._heat_demand_J):
+            delete_time_slots_before(time_series, last_time_slot)
 
     def get_results_dict(self, current_time_slot: DateTime) -> Dict:
         retval = {
@@ -221,14 +222,5 @@ class HeatPumpState(StateInterface):
     def _last_time_slot(self, current_market_slot: DateTime) -> DateTime:
         return current_market_slot - self._slot_length
 
-    @staticmethod
-    def _delete_time_slots(profile: Dict, current_time_stamp: DateTime):
-        stamps_to_delete = []
-        for time_slot in profile:
-            if time_slot < current_time_stamp:
-                stamps_to_delete.append(time_slot)
-        for stamp in stamps_to_delete:
-            profile.pop(stamp, None)
-
     def __str__(self):
         return self.__class__.__name__
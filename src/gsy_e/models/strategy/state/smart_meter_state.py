@@ -19,7 +19,8 @@ from typing import Dict
 
 from pendulum import DateTime
 
-from gsy_e.gsy_e_core.util import is_time_slot_in_past_markets
+from gsy_e.gsy_e_core.util import get_earliest_present_market_time_slot
+from gsy_e.models.strategy.slot_series import delete_time_slots_before
 from gsy_e.models.strategy.state.base_states import (
     ConsumptionState, ProductionState, UnexpectedStateException)
 
@@ -34,16 +35,11 @@ class SmartMeterState(ConsumptionState, ProductionState):
 
     def delete_past_state_values(self, current_time_slot: DateTime):
         """Delete data regarding energy requirements and availability for past market slots."""
-        to_delete = []
-        for market_slot in self.market_slots:
-            if is_time_slot_in_past_markets(market_slot, current_time_slot):
-                to_delete.append(market_slot)
-
-        for market_slot in to_delete:
-            self._available_energy_kWh.pop(market_slot, None)
-            self._energy_production_forecast_kWh.pop(market_slot, None)
-            self._energy_requirement_Wh.pop(market_slot, None)
-            self._desired_energy_Wh.pop(market_slot, None)
+        earliest_time_slot = get_earliest_present_market_time_slot(current_time_slot)
+        delete_time_slots_before(self._available_energy_kWh, earliest_time_slot)
+        delete_time_slots_before(self._energy_production_forecast_kWh, earliest_time_slot)
+        delete_time_slots_before(self._energy_requirement_Wh, earliest_time_slot)
+        delete_time_slots_before(self._desired_energy_Wh, earliest_time_slot)
 
     def get_energy_at_market_slot(self, time_slot: DateTime) -> float:
         """Return the energy produced/consumed by the device at a specific market slot (in kWh).
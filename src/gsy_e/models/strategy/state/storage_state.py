@@ -27,7 +27,8 @@ from gsy_framework.utils import (
 from pendulum import DateTime
 
 from gsy_e.constants import FLOATING_POINT_TOLERANCE
-from gsy_e.gsy_e_core.util import is_time_slot_in_past_markets, write_default_to_dict
+from gsy_e.gsy_e_core.util import get_earliest_present_market_time_slot, write_default_to_dict
+from gsy_e.models.strategy.slot_series import SlotSeries, delete_time_slots_before
 from gsy_e.models.strategy.state.base_states import StateInterface
 
 StorageSettings = ConstSettings.StorageSettings
@@ -63,20 +64,21 @@ class StorageState(StateInterface):
         self.max_abs_battery_power_kW = max_abs_battery_power_kW
 
         # storage capacity, that is already sold:
-        self.pledged_sell_kWh = {}
+        self.pledged_sell_kWh: Dict[DateTime, float] = SlotSeries()
         # storage capacity, that has been offered (but not traded yet):
-        self.offered_sell_kWh = {}
+        self.offered_sell_kWh: Dict[DateTime, float] = SlotSeries()
         # energy, that has been bought:
-        self.pledged_buy_kWh = {}
+        self.pledged_buy_kWh: Dict[DateTime, float] = SlotSeries()
         # energy, that the storage wants to buy (but not traded yet):
-        self.offered_buy_kWh = {}
+        self.offered_buy_kWh: Dict[DateTime, float] = SlotSeries()
         self.time_series_ess_share = {}
 
+        # The charge and offered history can contain "-" (unknown), thus are not float series
         self.charge_history = {}
-        self.charge_history_kWh = {}
+        self.charge_history_kWh: Dict[DateTime, float] = SlotSeries()
         self.offered_history = {}
-        self.energy_to_buy_dict = {}
-        self.energy_to_sell_dict = {}
+        self.energy_to_buy_dict: Dict[DateTime, float] = SlotSeries()
+        self.energy_to_sell_dict: Dict[DateTime, float] = SlotSeries()
 
         self._used_storage = self.initial_capacity_kWh
         self._battery_energy_per_slot = 0.0
@@ -309,20 +311,12 @@ class StorageState(StateInterface):
         Clean up values from past market slots that are not used anymore. Useful for
         deallocating memory that is not used anymore.
         """
-        to_delete = []
-        for market_slot in self.pledged_sell_kWh:
-            if is_time_slot_in_past_markets(market_slot, current_time_slot):
-                to_delete.append(market_slot)
-        for market_slot in to_delete:
-            self.pledged_sell_kWh.pop(market_slot, None)
-            self.offered_sell_kWh.pop(market_slot, None)
-            self.pledged_buy_kWh.pop(market_slot, None)
-            self.offered_buy_kWh.pop(market_slot, None)
-            self.charge_history.pop(market_slot, None)
-            self.charge_history_kWh.pop(market_slot, None)
-            self.offered_history.pop(market_slot, None)
-            self.energy_to_buy_dict.pop(market_slot, None)
-            self.energy_to_sell_dict.pop(market_slot, None)
+        earliest_time_slot = get_earliest_present_market_time_slot(current_time_slot)
+        for time_series in (self.pledged_sell_kWh, self.offered_sell_kWh, self.pledged_buy_kWh,
+                            self.offered_buy_kWh, self.charge_history, self.charge_history_kWh,
+                            self.offered_history, self.energy_to_buy_dict,
+                            self.energy_to_sell_dict):
+            delete_time_slots_before(time_series, earliest_time_slot)
 
     def register_energy_from_posted_bid(self, energy: float, time_slot: DateTime):
         """Register the energy from a posted bid on the market."""
@@ -0,0 +1,147 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from gsy_framework.data_classes import Bid, Offer
+from pendulum import DateTime
+
+Order = Union[Offer, Bid]
+
+
+class StrategyOrders(dict):
+    """Orders of a strategy per market (market id -> list of orders, in the order of posting).
+
+    Besides the lists, the orders are indexed by market id -> time slot -> orders and by
+    market id -> order id -> order, and the total energy / price of the orders of a market slot
+    is cached until the orders of the market change. Therefore, looking up an order by id and
+    reading the orders or the energy of a market slot do not iterate over all orders of the
+    strategy.
+
+    The lists must not be modified in place: use add() / remove() or assign a new list of orders
+    to the market id, so that the indexes are kept up to date.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        # market id -> time slot -> orders
+        self._slots: Dict[str, Dict[Optional[DateTime], List[Order]]] = {}
+        # market id -> order id -> order
+        self._ids: Dict[str, Dict[str, Order]] = {}
+        # market id -> (attribute, time slot) -> total of the attribute of the orders
+        self._totals: Dict[str, Dict[Tuple[str, Optional[DateTime]], float]] = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # The indexes are rebuilt from the orders when the object is copied / unpickled.
+        return self.__class__, (dict(self),)
+
+    def __setitem__(self, market_id: str, orders: Iterable[Order]) -> None:
+        orders = list(orders)
+        super().__setitem__(market_id, orders)
+        slots = {}
+        ids = {}
+        for order in orders:
+            slots.setdefault(order.time_slot, []).append(order)
+            ids.setdefault(order.id, order)
+        self._slots[market_id] = slots
+        self._ids[market_id] = ids
+        self._totals.pop(market_id, None)
+
+    def __delitem__(self, market_id: str) -> None:
+        super().__delitem__(market_id)
+        self._drop_index(market_id)
+
+    def _drop_index(self, market_id: str) -> None:
+        self._slots.pop(market_id, None)
+        self._ids.pop(market_id, None)
+        self._totals.pop(market_id, None)
+
+    def pop(self, market_id: str, *args):
+        self._drop_index(market_id)
+        return super().pop(market_id, *args)
+
+    def clear(self) -> None:
+        super().clear()
+        self._slots.clear()
+        self._ids.clear()
+        self._totals.clear()
+
+    def update(self, *args, **kwargs) -> None:
+        for market_id, orders in dict(*args, **kwargs).items():
+            self[market_id] = orders
+
+    def setdefault(self, market_id: str, default: Iterable[Order] = ()) -> List[Order]:
+        if market_id not in self:
+            self[market_id] = default
+        return self[market_id]
+
+    def add(self, market_id: str, order: Order) -> None:
+        """Append an order to the orders of the market."""
+        if market_id not in self:
+            self[market_id] = [order]
+            return
+        super().__getitem__(market_id).append(order)
+        self._slots[market_id].setdefault(order.time_slot, []).append(order)
+        self._ids[market_id].setdefault(order.id, order)
+        self._totals.pop(market_id, None)
+
+    def remove(self, market_id: str, order_ids: Iterable[str]) -> None:
+        """Remove the orders with the given ids from the orders of the market."""
+        order_ids = set(order_ids)
+        self[market_id] = [order for order in self.get(market_id, [])
+                           if order.id not in order_ids]
+
+    def replace(self, market_id: str, order: Order) -> None:
+        """Replace the order of the market that has the same id as the given order."""
+        if order.id not in self._ids.get(market_id, {}):
+            return
+        self[market_id] = [order if market_order.id == order.id else market_order
+                           for market_order in self[market_id]]
+
+    def get_order(self, market_id: str, order_id: str) -> Optional[Order]:
+        """Return the order of the market with the given id, None if it does not exist."""
+        return self._ids.get(market_id, {}).get(order_id)
+
+    def has_order(self, market_id: str, order_id: str) -> bool:
+        """Check whether the market contains an order with the given id."""
+        return order_id in self._ids.get(market_id, {})
+
+    def in_market(self, market_id: str, time_slot: Optional[DateTime] = None) -> List[Order]:
+        """Return the orders of the market (of the time slot, if it is not None)."""
+        if time_slot is None:
+            return list(self.get(market_id, []))
+        return list(self._slots.get(market_id, {}).get(time_slot, []))
+
+    def _total(self, market_id: str, attribute: str, time_slot: Optional[DateTime]) -> float:
+        if market_id not in self:
+            return 0.0
+        totals = self._totals.setdefault(market_id, {})
+        key = (attribute, time_slot)
+        if key not in totals:
+            orders = (self[market_id] if time_slot is None
+                      else self._slots[market_id].get(time_slot, []))
+            totals[key] = sum(getattr(order, attribute) for order in orders)
+        return totals[key]
+
+    def energy(self, market_id: str, time_slot: Optional[DateTime] = None) -> float:
+        """Return the total energy of the orders of the market (of the time slot, if not None)."""
+        return self._total(market_id, "energy", time_slot)
+
+    def price(self, market_id: str, time_slot: Optional[DateTime] = None) -> float:
+        """Return the total price of the orders of the market (of the time slot, if not None)."""
+        return self._total(market_id, "price", time_slot)
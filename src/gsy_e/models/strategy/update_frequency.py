@@ -16,17 +16,20 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
-from typing import TYPE_CHECKING, Callable, List, Dict
+from math import floor
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
 
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
 from gsy_framework.read_user_profile import InputProfileTypes
-from gsy_framework.utils import (find_object_of_same_weekday_and_time,
-                                 is_time_slot_in_simulation_duration)
+from gsy_framework.utils import is_time_slot_in_simulation_duration
 from pendulum import duration, DateTime, Duration
 
 import gsy_e.constants
 from gsy_e.gsy_e_core.global_objects_singleton import global_objects
-from gsy_e.gsy_e_core.util import write_default_to_dict, is_time_slot_in_past_markets
+from gsy_e.gsy_e_core.util import (
+    write_default_to_dict, get_earliest_present_market_time_slot)
+from gsy_e.models.strategy.profile_index import ProfileSlotIndex, get_profile_slot_index
+from gsy_e.models.strategy.slot_series import SlotSeries, delete_time_slots_before
 
 if TYPE_CHECKING:
     from gsy_e.models.area import Area
@@ -84,22 +87,29 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
 
         # dicts that are used for price calculations, contain only
         # all_markets Dict[DateTime, float]
-        self.initial_rate = {}
-        self.final_rate = {}
-        self.energy_rate_change_per_update = {}
+        self.initial_rate: Dict[DateTime, float] = SlotSeries(typecode=None)
+        self.final_rate: Dict[DateTime, float] = SlotSeries(typecode=None)
+        self.energy_rate_change_per_update: Dict[DateTime, float] = SlotSeries(typecode=None)
 
+        # Lookup tables of the rate profile buffers (id of the buffer -> index of the buffer)
+        self._profile_indexes: Dict[int, ProfileSlotIndex] = {}
         self._read_or_rotate_rate_profiles()
 
         self.update_interval = update_interval
-        self.update_counter = {}
+        self.update_counter: Dict[DateTime, int] = SlotSeries(typecode="q")
 
         # Keeps track of the elapsed seconds at the time of insertion of
         # the slot (relevant to future markets)
-        self.market_slot_added_time_mapping: Dict[DateTime: int] = {}
+        self.market_slot_added_time_mapping: Dict[DateTime, int] = SlotSeries(typecode=None)
 
         self.number_of_available_updates = 0
         self.rate_limit_object = rate_limit_object
 
+        # Schedule of the price updates, as (tick of calculation, first tick on which an update
+        # can be due). Ticks before the scheduled tick skip the price update checks.
+        self._next_update_tick: Dict[DateTime, Tuple[int, int]] = {}
+        self._earliest_update_tick: Optional[Tuple[int, int]] = None
+
     def serialize(self):
         """Return dict with configuration parameters."""
         return {
@@ -110,6 +120,7 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
     def _read_or_rotate_rate_profiles(self) -> None:
         """ Creates a new chunk of profiles if the current_timestamp is not in the profile buffers
         """
+        self._profile_indexes.clear()
         self.initial_rate_profile_buffer = global_objects.profiles_handler.rotate_profile(
             InputProfileTypes.IDENTITY, self.initial_rate_input)
         self.final_rate_profile_buffer = global_objects.profiles_handler.rotate_profile(
@@ -126,15 +137,15 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
         self.energy_rate_change_per_update.pop(market_time_slot, None)
         self.update_counter.pop(market_time_slot, None)
         self.market_slot_added_time_mapping.pop(market_time_slot, None)
+        self._next_update_tick.pop(market_time_slot, None)
 
     def delete_past_state_values(self, current_market_time_slot: DateTime) -> None:
         """Delete values from buffers before the current_market_time_slot"""
-        to_delete = []
-        for market_slot in self.initial_rate:
-            if is_time_slot_in_past_markets(market_slot, current_market_time_slot):
-                to_delete.append(market_slot)
-        for market_slot in to_delete:
-            self._delete_market_slot_data(market_slot)
+        earliest_time_slot = get_earliest_present_market_time_slot(current_market_time_slot)
+        for time_series in (self.initial_rate, self.final_rate,
+                            self.energy_rate_change_per_update, self.update_counter,
+                            self.market_slot_added_time_mapping, self._next_update_tick):
+            delete_time_slots_before(time_series, earliest_time_slot)
 
     @staticmethod
     def get_all_markets(area: "Area") -> List["OneSidedMarket"]:
@@ -148,18 +159,26 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
             return []
         return [area.spot_market.time_slot]
 
+    def _get_rate_from_profile(self, profile: Dict[DateTime, float], time_slot: DateTime):
+        """Return the rate of the time slot (same weekday and time) from the profile buffer."""
+        index = self._profile_indexes.get(id(profile))
+        if index is None or index.profile is not profile:
+            index = get_profile_slot_index(profile)
+            self._profile_indexes[id(profile)] = index
+        return index.get(time_slot)
+
     def _populate_profiles(self, area: "Area") -> None:
         for time_slot in self._get_all_time_slots(area):
             if not is_time_slot_in_simulation_duration(time_slot, area.config):
                 continue
             if self.fit_to_limit is False:
                 self.energy_rate_change_per_update[time_slot] = (
-                    find_object_of_same_weekday_and_time(
+                    self._get_rate_from_profile(
                         self.energy_rate_change_per_update_profile_buffer, time_slot)
                 )
-            initial_rate = find_object_of_same_weekday_and_time(
+            initial_rate = self._get_rate_from_profile(
                 self.initial_rate_profile_buffer, time_slot)
-            final_rate = find_object_of_same_weekday_and_time(
+            final_rate = self._get_rate_from_profile(
                 self.final_rate_profile_buffer, time_slot)
 
             if initial_rate is None or final_rate is None:
@@ -168,9 +187,9 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
                     "Reloading profiles from the database.",
                     gsy_e.constants.CONFIGURATION_ID, area.uuid)
                 self._read_or_rotate_rate_profiles()
-                initial_rate = find_object_of_same_weekday_and_time(
+                initial_rate = self._get_rate_from_profile(
                     self.initial_rate_profile_buffer, time_slot)
-                final_rate = find_object_of_same_weekday_and_time(
+                final_rate = self._get_rate_from_profile(
                     self.final_rate_profile_buffer, time_slot)
 
             # Hackathon TODO: get rid of self.initial_rate, self.final_rate, self.update_counter
@@ -184,6 +203,8 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
 
             # todo: homogenize the calculation of elapsed seconds for spot and future markets
             self._add_slot_to_mapping(area, time_slot)
+        # The schedule of the newly added time slots is calculated on the next tick.
+        self._earliest_update_tick = None
 
     def _add_slot_to_mapping(self, area, time_slot):
         """keep track of the elapsed time of simulation at the addition of a new slot."""
@@ -194,9 +215,9 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
     def _set_or_update_energy_rate_change_per_update(self, time_slot: DateTime) -> None:
         energy_rate_change_per_update = {}
         if self.fit_to_limit:
-            initial_rate = find_object_of_same_weekday_and_time(
+            initial_rate = self._get_rate_from_profile(
                 self.initial_rate_profile_buffer, time_slot)
-            final_rate = find_object_of_same_weekday_and_time(
+            final_rate = self._get_rate_from_profile(
                 self.final_rate_profile_buffer, time_slot)
             energy_rate_change_per_update[time_slot] = (
                     (initial_rate - final_rate) / self.number_of_available_updates
@@ -204,11 +225,11 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
         else:
             if self.rate_limit_object is min:
                 energy_rate_change_per_update[time_slot] = \
-                    -1 * find_object_of_same_weekday_and_time(
+                    -1 * self._get_rate_from_profile(
                         self.energy_rate_change_per_update_profile_buffer, time_slot)
             elif self.rate_limit_object is max:
                 energy_rate_change_per_update[time_slot] = \
-                    find_object_of_same_weekday_and_time(
+                    self._get_rate_from_profile(
                         self.energy_rate_change_per_update_profile_buffer, time_slot)
         self.energy_rate_change_per_update.update(energy_rate_change_per_update)
 
@@ -256,22 +277,70 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
                 self._time_slot_duration_in_seconds / area.config.tick_length.seconds)
         return current_tick_number * area.config.tick_length.seconds
 
+    def _seconds_until_price_update(self, area: "Area", time_slot: DateTime) -> float:
+        """Return the seconds until the next price update of the time slot (<= 0 if it is due).
+
+        If no update is left in the current market slot, the seconds until the beginning of the
+        next market slot are returned.
+        """
+        update_seconds = self.update_interval.seconds * self.update_counter[time_slot]
+        if update_seconds >= self._time_slot_duration_in_seconds:
+            update_seconds = self._time_slot_duration_in_seconds
+        return update_seconds - self._elapsed_seconds_per_slot(area)
+
+    def _schedule_price_update(self, area: "Area", time_slot: DateTime) -> int:
+        """Calculate and store the first tick on which the time slot can be due for an update."""
+        seconds_until_update = self._seconds_until_price_update(area, time_slot)
+        next_update_tick = area.current_tick
+        if seconds_until_update > 0:
+            # Rounded down, so that the update tick is never skipped.
+            next_update_tick += floor(seconds_until_update / area.config.tick_length.seconds)
+        self._next_update_tick[time_slot] = (area.current_tick, next_update_tick)
+        return next_update_tick
+
+    @staticmethod
+    def _is_before_scheduled_update(area: "Area", schedule: Optional[Tuple[int, int]]) -> bool:
+        # The schedule is ignored if the tick went back (e.g. on the restart of the simulation).
+        return schedule is not None and schedule[0] <= area.current_tick < schedule[1]
+
+    def _reset_update_schedule(self, time_slot: DateTime = None) -> None:
+        if time_slot is None:
+            self._next_update_tick.clear()
+        else:
+            self._next_update_tick.pop(time_slot, None)
+        self._earliest_update_tick = None
+
     def increment_update_counter_all_markets(self, strategy: "BaseStrategy") -> None:
         """Update method of the class. Should be called on each tick and increments the
         update counter in order to validate whether an update in the posted energy rates
         is required."""
-        for time_slot in self._get_all_time_slots(strategy.area):
+        area = strategy.area
+        if self._is_before_scheduled_update(area, self._earliest_update_tick):
+            return
+        earliest_update_tick = None
+        for time_slot in self._get_all_time_slots(area):
             self.increment_update_counter(strategy, time_slot)
+            next_update_tick = self._next_update_tick[time_slot][1]
+            if earliest_update_tick is None or next_update_tick < earliest_update_tick:
+                earliest_update_tick = next_update_tick
+        self._earliest_update_tick = (
+            None if earliest_update_tick is None
+            else (area.current_tick, earliest_update_tick))
 
     def increment_update_counter(self, strategy: "BaseStrategy", time_slot) -> None:
         """Increment the counter of the number of times in which prices have been updated."""
         if self.time_for_price_update(strategy, time_slot):
             self.update_counter[time_slot] += 1
+            self._earliest_update_tick = None
+        if not self._is_before_scheduled_update(
+                strategy.area, self._next_update_tick.get(time_slot)):
+            self._schedule_price_update(strategy.area, time_slot)
 
     def time_for_price_update(self, strategy: "BaseStrategy", time_slot: DateTime) -> bool:
         """Check if the prices of bids/offers should be updated."""
-        return self._elapsed_seconds_per_slot(strategy.area) >= (
-            self.update_interval.seconds * self.update_counter[time_slot])
+        if self._is_before_scheduled_update(strategy.area, self._next_update_tick.get(time_slot)):
+            return False
+        return self._seconds_until_price_update(strategy.area, time_slot) <= 0
 
     def set_parameters(self, *, initial_rate: float = None, final_rate: float = None,
                        energy_rate_change_per_update: float = None, fit_to_limit: bool = None,
@@ -288,6 +357,7 @@ class TemplateStrategyUpdaterBase(TemplateStrategyUpdaterInterface):
             self.fit_to_limit = fit_to_limit
         if update_interval is not None:
             self.update_interval = update_interval
+            self._reset_update_schedule()
         self._read_or_rotate_rate_profiles()
 
     def reset(self, strategy: "BaseStrategy") -> None:
@@ -305,6 +375,7 @@ class TemplateStrategyBidUpdater(TemplateStrategyUpdaterBase):
         # decrease energy rate for each market again, except for the newly created one
         for market in self.get_all_markets(strategy.area):
             self.update_counter[market.time_slot] = 0
+            self._reset_update_schedule(market.time_slot)
             strategy.update_bid_rates(market, self.get_updated_rate(market.time_slot))
 
     def update(self, market: "TwoSidedMarket", strategy: "BidEnabledStrategy") -> None:
@@ -329,6 +400,7 @@ class TemplateStrategyOfferUpdater(TemplateStrategyUpdaterBase):
         """Reset the price of all offers based to use their initial rate."""
         for market in self.get_all_markets(strategy.area):
             self.update_counter[market.time_slot] = 0
+            self._reset_update_schedule(market.time_slot)
             strategy.update_offer_rates(market, self.get_updated_rate(market.time_slot))
 
     def update(self, market: "OneSidedMarket", strategy: "BaseStrategy") -> None:
@@ -27,6 +27,7 @@ from gsy_e import constants
 from gsy_e.events.event_structures import AreaEvent, MarketEvent
 from gsy_e.gsy_e_core.device_registry import DeviceRegistry
 from gsy_e.models.area import Area, Asset, Market, check_area_name_exists_in_parent_area
+from gsy_e.models.area.area import area_property_cache_counters
 from gsy_e.models.area.events import Events
 from gsy_e.models.config import SimulationConfig
 from gsy_e.models.strategy.storage import StorageStrategy
@@ -214,6 +215,55 @@ class TestArea:
         area.tick()
         assert manager.mock_calls == [call.match(), call.update_matcher()]
 
+    @staticmethod
+    @patch("gsy_e.models.area.Area._consume_commands_from_aggregator", Mock())
+    @patch("gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES", True)
+    def test_now_is_cached_until_the_tick_changes(config):
+        area = Area(name="House", config=config)
+        area_property_cache_counters.reset()
+        assert area.now == config.start_date
+        assert area.now == config.start_date
+        assert area_property_cache_counters.to_dict()["now"] == {"hits": 1, "misses": 1}
+
+        area.execute_actions_after_tick_event()
+        assert area.now == config.start_date.add(seconds=config.tick_length.seconds)
+        area.current_tick = 10
+        assert area.now == config.start_date.add(seconds=10 * config.tick_length.seconds)
+        assert area_property_cache_counters.misses["now"] == 3
+
+    @staticmethod
+    @patch("gsy_e.constants.COUNT_AREA_PROPERTY_CACHE_ACCESSES", True)
+    def test_spot_and_past_markets_are_cached_until_the_markets_change(config):
+        area = Area(name="Street", children=[Area(name="House")], config=config)
+        area.activate()
+        area_property_cache_counters.reset()
+        spot_market = area.spot_market
+        assert spot_market.time_slot == config.start_date
+        assert area.spot_market is spot_market
+        assert area.last_past_market is None
+        assert area.current_market is None
+        assert area_property_cache_counters.to_dict() == {
+            "last_past_market": {"hits": 1, "misses": 1},
+            "spot_market": {"hits": 1, "misses": 1}}
+
+        area.current_tick = config.ticks_per_slot
+        area.cycle_markets()
+        assert area.last_past_market is spot_market
+        assert area.spot_market.time_slot == config.start_date.add(
+            minutes=config.slot_length.total_minutes())
+
+        # Markets that are replaced outside of the market cycle are also picked up.
+        area._markets.markets = {}
+        assert area.spot_market is None
+
+    @staticmethod
+    def test_cached_properties_are_not_counted_by_default(config):
+        area = Area(name="Street", children=[Area(name="House")], config=config)
+        area.activate()
+        area_property_cache_counters.reset()
+        assert area.spot_market is area.spot_market
+        assert area_property_cache_counters.to_dict() == {}
+
 
 class TestEventDispatcher:
     """Test the dispatching of area events."""
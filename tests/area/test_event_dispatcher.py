@@ -17,15 +17,17 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from typing import Dict, Union
-from unittest.mock import MagicMock, Mock, call
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
+from gsy_framework.data_classes import TraderDetails
 from gsy_framework.enums import AvailableMarketTypes, SpotMarketTypeEnum
 from pendulum import DateTime, datetime, duration
 
 from gsy_e.events.event_structures import AreaEvent, MarketEvent
 from gsy_e.models.area import Area
+from gsy_e.models.area.area_base import AreaChildrenList
 from gsy_e.models.area.event_dispatcher import AreaDispatcher
 from gsy_e.models.market import MarketBase
 from gsy_e.models.market.balancing import BalancingMarket
@@ -252,3 +254,76 @@ class TestAreaDispatcher:
         else:
             (area_dispatcher._broadcast_notification_to_area_and_child_agents.
                 assert_called_once_with(expected_market_type, event_type, **kwargs))
+
+    @staticmethod
+    @pytest.mark.parametrize("route_trade_events", [True, False])
+    def test_broadcast_notification_delivers_trade_events_to_the_traders(
+            route_trade_events, area_dispatcher):
+        """Test that trade events only reach the strategies of the traders and the strategies
+        that observe all trades, unless the routing of the trade events is disabled."""
+        area = area_dispatcher.area
+        area.children = AreaChildrenList(
+            area, [Area("seller"), Area("buyer"), Area("other"), Area("observer")])
+        for child in area.children:
+            child.strategy = Mock(observes_all_trades=child.name == "observer")
+            child.dispatcher.event_listener = Mock()
+        area_dispatcher._broadcast_notification_to_area_and_child_agents = Mock()
+        seller, buyer = area.children[:2]
+        trade = Mock(seller=TraderDetails(seller.name, seller.uuid, seller.name, seller.uuid),
+                     buyer=TraderDetails(buyer.name, buyer.uuid, buyer.name, buyer.uuid),
+                     match_details={})
+
+        with patch("gsy_e.constants.ROUTE_TRADE_EVENTS_TO_TRADERS", route_trade_events):
+            area_dispatcher.broadcast_notification(
+                MarketEvent.OFFER_TRADED, market_id=area.spot_market.id, trade=trade)
+
+        called_children = {child.name for child in area.children
+                           if child.dispatcher.event_listener.called}
+        assert called_children == (
+            {"seller", "buyer", "observer"} if route_trade_events
+            else {"seller", "buyer", "other", "observer"})
+
+        # The index of the children is rebuilt when the children change
+        area.children.append(Area("new_buyer"))
+        new_buyer = area.children[-1]
+        new_buyer.strategy = Mock(observes_all_trades=False)
+        new_buyer.dispatcher.event_listener = Mock()
+        trade.buyer = TraderDetails(new_buyer.name, new_buyer.uuid, new_buyer.name,
+                                    new_buyer.uuid)
+        area_dispatcher.broadcast_notification(
+            MarketEvent.OFFER_TRADED, market_id=area.spot_market.id, trade=trade)
+        new_buyer.dispatcher.event_listener.assert_called_once()
+
+    @staticmethod
+    @patch("gsy_e.constants.ROUTE_TRADE_EVENTS_TO_TRADERS", True)
+    def test_broadcast_notification_delivers_trade_events_to_the_agents_of_forwarded_orders(
+            area_dispatcher):
+        """Test that the market agents of the child market areas still receive the trade events
+        of the orders that they forwarded when the trade events are routed to the traders."""
+        area = area_dispatcher.area
+        house = Area("house", children=[Area("device")])
+        area.children = AreaChildrenList(area, [house, Area("buyer"), Area("other")])
+        for child in area.children:
+            if child is not house:
+                child.strategy = Mock(observes_all_trades=False)
+            child.dispatcher.event_listener = Mock()
+        time_slot = area.spot_market.time_slot
+        house_agent = Mock()
+        house.dispatcher._spot_agents = {time_slot: house_agent}
+        house.get_market_instances_from_class_type = Mock(
+            return_value={time_slot: area.spot_market})
+        buyer = area.children[1]
+        # The offer of the device was forwarded to the market by the agent of the house
+        trade = Mock(seller=TraderDetails(house.name, house.uuid, "device",
+                                          house.children[0].uuid),
+                     buyer=TraderDetails(buyer.name, buyer.uuid, buyer.name, buyer.uuid),
+                     match_details={})
+
+        area_dispatcher.broadcast_notification(
+            MarketEvent.OFFER_TRADED, market_id=area.spot_market.id, trade=trade)
+
+        house_agent.event_listener.assert_called_once_with(
+            MarketEvent.OFFER_TRADED, market_id=area.spot_market.id, trade=trade)
+        called_children = {child.name for child in area.children
+                           if child.dispatcher.event_listener.called}
+        assert called_children == {"house", "buyer"}
@@ -17,6 +17,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import pytest
 
+import gsy_e.constants
+
 
 class Called:
     def __init__(self):
@@ -34,3 +36,12 @@ class Called:
 @pytest.fixture
 def called():
     yield Called()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def full_results_validation():
+    """Always validate all simulation results in the tests, regardless of the environment."""
+    original_validation_mode = gsy_e.constants.RESULTS_VALIDATION_MODE
+    gsy_e.constants.RESULTS_VALIDATION_MODE = "full"
+    yield
+    gsy_e.constants.RESULTS_VALIDATION_MODE = original_validation_mode
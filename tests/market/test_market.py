@@ -346,6 +346,26 @@ def test_market_acct_multiple(market=OneSidedMarket(bc=NonBlockchainInterface(st
     assert market.bought_energy("C") == offer2.energy == 10
 
 
+def test_market_trades_are_indexed_per_trader(market=OneSidedMarket(
+        bc=NonBlockchainInterface(str(uuid4())), time_slot=now())):
+    offer1 = market.offer(10, 20, TraderDetails("A", "", "A", ""))
+    offer2 = market.offer(5, 10, TraderDetails("B", "", "B", ""))
+    trade1 = market.accept_offer(offer1, TraderDetails("B", "", "B", ""))
+    trade2 = market.accept_offer(offer2, TraderDetails("C", "", "C", ""))
+
+    assert market.trades.of_trader("A") == [trade1]
+    assert market.trades.of_trader("B") == [trade1, trade2]
+    assert market.trades.of_trader("D") == []
+    assert market.total_earned("B") == trade2.trade_price == 5
+    assert market.total_spent("B") == trade1.trade_price == 10
+
+    # Assigning the trades (e.g. when removing the trades of past slots) rebuilds the index
+    market.trades = [trade2]
+    assert market.trades.of_trader("A") == []
+    assert market.sold_energy("A") == 0
+    assert market.bought_energy("C") == 10
+
+
 @pytest.mark.parametrize("market, offer", [
     (OneSidedMarket(bc=NonBlockchainInterface(str(uuid4())), time_slot=now()), "offer"),
     (BalancingMarket(bc=NonBlockchainInterface(str(uuid4())), time_slot=now()), "balancing_offer"),
@@ -470,6 +490,70 @@ def test_market_listeners_offer_deleted(market, offer, delete_offer, add_listene
     assert called.calls[1][1] == {"offer": repr(e_offer), "market_id": repr(market.id)}
 
 
+@pytest.mark.parametrize("market", [
+    OneSidedMarket(bc=MagicMock(), time_slot=now()),
+    SettlementMarket(bc=MagicMock(), time_slot=now()),
+])
+def test_market_amend_offer(market, called):
+    e_offer = market.offer(10, 20, seller_details)
+    market.add_listener(called)
+
+    amended_offer = market.amend_order(e_offer.id, 15)
+
+    assert amended_offer.id == e_offer.id
+    assert amended_offer.price == 15
+    assert amended_offer.energy == e_offer.energy
+    assert market.offers == {e_offer.id: amended_offer}
+    assert e_offer.price == 10
+    assert len(called.calls) == 1
+    assert called.calls[0][0] == (repr(MarketEvent.ORDER_AMENDED),)
+    assert called.calls[0][1] == {"order": repr(amended_offer), "market_id": repr(market.id)}
+
+
+def test_market_amend_bid(market, called):
+    bid = market.bid(10, 20, buyer_details)
+    market.add_listener(called)
+
+    amended_bid = market.amend_order(bid.id, 5)
+
+    assert amended_bid.id == bid.id
+    assert amended_bid.price == 5
+    assert market.bids == {bid.id: amended_bid}
+    assert len(called.calls) == 1
+    assert called.calls[0][0] == (repr(MarketEvent.ORDER_AMENDED),)
+
+
+def test_market_amend_order_replaces_the_order_in_the_history(market):
+    offer = market.offer(10, 20, seller_details)
+    other_offer = market.offer(20, 20, seller_details)
+    bid = market.bid(10, 20, buyer_details)
+
+    market.amend_order(offer.id, 15)
+    amended_offer = market.amend_order(offer.id, 12)
+    amended_bid = market.amend_order(bid.id, 5)
+
+    assert market.offer_history == [amended_offer, other_offer]
+    assert market.offer_history[0] is amended_offer
+    assert market.bid_history == [amended_bid]
+    assert market.bid_history[0] is amended_bid
+
+    # The orders of the history are found also after the history was modified.
+    market.offer_history = [other_offer]
+    amended_other_offer = market.amend_order(other_offer.id, 18)
+    assert market.offer_history == [amended_other_offer]
+    assert market.offer_history[0] is amended_other_offer
+
+
+def test_market_amend_order_not_found_or_readonly(market):
+    with pytest.raises(OfferNotFoundException):
+        market.amend_order("nonexistent", 10)
+
+    e_offer = market.offer(10, 20, seller_details)
+    market.readonly = True
+    with pytest.raises(MarketReadOnlyException):
+        market.amend_order(e_offer.id, 15)
+
+
 @pytest.mark.parametrize(
     ("last_offer_size", "traded_energy"),
     (
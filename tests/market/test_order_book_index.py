@@ -0,0 +1,114 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+# pylint: disable=protected-access
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from gsy_framework.data_classes import TraderDetails
+from pendulum import datetime
+
+from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
+from gsy_e.models.market.two_sided import TwoSidedMarket
+from gsy_e.models.matching_engine_matcher.matching_engine_matcher_interface import (
+    MatchingEngineMatcherInterface)
+
+TIME_SLOT = datetime(2021, 10, 19, 0, 0)
+
+
+@pytest.fixture(name="market")
+def fixture_market():
+    return TwoSidedMarket(time_slot=TIME_SLOT, bc=NonBlockchainInterface(str(uuid4())))
+
+
+class TestOrderBookView:
+
+    @staticmethod
+    def test_orders_per_slot_matches_market_orders_per_slot(market):
+        market.offer(5, 1, TraderDetails("seller", "seller_id"))
+        market.offer(2, 1, TraderDetails("seller2", "seller2_id"))
+        market.bid(3, 1, TraderDetails("buyer", "buyer_id"))
+        market.bid(6, 1, TraderDetails("buyer2", "buyer2_id"))
+
+        view_orders = market.order_book_view.orders_per_slot()
+        market_orders = market.orders_per_slot()
+        assert view_orders.keys() == market_orders.keys()
+        for time_slot, orders in market_orders.items():
+            assert sorted(orders["bids"], key=lambda o: o["id"]) == sorted(
+                view_orders[time_slot]["bids"], key=lambda o: o["id"])
+            assert sorted(orders["offers"], key=lambda o: o["id"]) == sorted(
+                view_orders[time_slot]["offers"], key=lambda o: o["id"])
+            assert [bid["energy_rate"] for bid in view_orders[time_slot]["bids"]] == [6, 3]
+            assert [offer["energy_rate"] for offer in view_orders[time_slot]["offers"]] == [2, 5]
+
+    @staticmethod
+    def test_orders_are_serialised_only_once(market):
+        offer = market.offer(5, 1, TraderDetails("seller", "seller_id"))
+        # The first access of the view serialises the offer.
+        market.order_book_view.orders_per_slot()
+        with patch.object(offer, "serializable_dict",
+                          wraps=offer.serializable_dict) as serializable_dict_mock:
+            market.bid(3, 1, TraderDetails("buyer", "buyer_id"))
+            market.order_book_view.orders_per_slot()
+            market.order_book_view.orders_per_slot()
+            serializable_dict_mock.assert_not_called()
+        assert [serialised_offer["id"] for serialised_offer in
+                market.order_book_view.orders_per_slot()[market.time_slot_str]["offers"]] == [
+            offer.id]
+
+    @staticmethod
+    def test_view_tracks_deleted_and_split_orders(market):
+        offer = market.offer(4, 2, TraderDetails("seller", "seller_id"))
+        bid = market.bid(3, 1, TraderDetails("buyer", "buyer_id"))
+        view = market.order_book_view
+        view.set_time_slots_matched(view.changed_time_slots.copy())
+        assert market.order_book_view.orders_per_slot(only_changed=True) == {}
+
+        market.delete_bid(bid)
+        accepted_offer, residual_offer = market.split_offer(offer, 1, 4)
+        orders = market.order_book_view.orders_per_slot(only_changed=True)
+        assert list(orders.keys()) == [market.time_slot_str]
+        assert orders[market.time_slot_str]["bids"] == []
+        assert {o["id"] for o in orders[market.time_slot_str]["offers"]} == {
+            accepted_offer.id, residual_offer.id}
+
+
+class TestMatchingEngineIncrementalOrderBook:
+
+    @staticmethod
+    @patch("gsy_e.constants.MATCHING_ENGINE_INCREMENTAL_ORDER_BOOK", True)
+    def test_unchanged_time_slots_are_not_matched_again(market):
+        market.offer(5, 1, TraderDetails("seller", "seller_id"))
+        market.bid(3, 1, TraderDetails("buyer", "buyer_id"))
+        get_matches_recommendations = MagicMock(return_value=[])
+
+        MatchingEngineMatcherInterface._match_recommendations(
+            "area_uuid", {"current_time": TIME_SLOT}, [market], get_matches_recommendations)
+        assert get_matches_recommendations.call_count == 1
+
+        market.no_new_order = False
+        MatchingEngineMatcherInterface._match_recommendations(
+            "area_uuid", {"current_time": TIME_SLOT}, [market], get_matches_recommendations)
+        assert get_matches_recommendations.call_count == 1
+
+        market.bid(4, 1, TraderDetails("buyer2", "buyer2_id"))
+        MatchingEngineMatcherInterface._match_recommendations(
+            "area_uuid", {"current_time": TIME_SLOT}, [market], get_matches_recommendations)
+        assert get_matches_recommendations.call_count == 2
+        data = get_matches_recommendations.call_args[0][0]
+        assert len(data["area_uuid"][market.time_slot_str]["bids"]) == 2
@@ -0,0 +1,118 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from copy import deepcopy
+from uuid import uuid4
+
+import pytest
+
+from gsy_e.models.market.versioned_orders import VersionedOrders, get_orders_snapshot
+
+
+class TestVersionedOrders:
+
+    @staticmethod
+    @pytest.mark.parametrize("modification", [
+        lambda orders: orders.__setitem__("c", 3),
+        lambda orders: orders.__delitem__("a"),
+        lambda orders: orders.pop("a"),
+        lambda orders: orders.pop("missing", None),
+        lambda orders: orders.popitem(),
+        lambda orders: orders.setdefault("c", 3),
+        lambda orders: orders.update({"c": 3}),
+        lambda orders: orders.__ior__({"c": 3}),
+        lambda orders: orders.clear(),
+    ])
+    def test_modifications_create_new_snapshot(modification):
+        orders = VersionedOrders({"a": 1, "b": 2})
+        snapshot = orders.snapshot()
+        assert orders.snapshot() == snapshot
+        version = orders.version
+
+        modification(orders)
+
+        assert orders.version > version
+        assert snapshot == {"a": 1, "b": 2}
+        assert orders.snapshot() == dict(orders)
+
+    @staticmethod
+    def test_snapshot_is_reused_and_read_only():
+        orders = VersionedOrders({"a": 1})
+        snapshot = orders.snapshot()
+        # The underlying copy is shared by all snapshots of the same version.
+        cached_copy = orders._snapshot[1]  # pylint: disable=protected-access
+        orders.snapshot()
+        assert orders._snapshot[1] is cached_copy  # pylint: disable=protected-access
+        with pytest.raises(TypeError):
+            snapshot["b"] = 2  # pylint: disable=unsupported-assignment-operation
+
+        copied_orders = deepcopy(orders)
+        assert isinstance(copied_orders, VersionedOrders)
+        assert copied_orders == orders
+
+    @staticmethod
+    def test_get_orders_snapshot_copies_plain_dicts():
+        orders = {"a": 1}
+        snapshot = get_orders_snapshot(orders)
+        orders["b"] = 2
+        assert snapshot == {"a": 1}
+
+
+class TestMarketOrderSnapshots:
+
+    @staticmethod
+    def test_get_bids_returns_snapshot_until_bids_change():
+        # pylint: disable=import-outside-toplevel
+        from gsy_framework.data_classes import TraderDetails
+        from pendulum import datetime
+
+        from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
+        from gsy_e.models.market.two_sided import TwoSidedMarket
+
+        time_slot = datetime(2021, 10, 19, 0, 0)
+        market = TwoSidedMarket(time_slot=time_slot, bc=NonBlockchainInterface(str(uuid4())))
+        bid = market.bid(10, 1, TraderDetails("buyer", ""), time_slot=time_slot)
+        bids = market.get_bids()
+        assert bids == {bid.id: bid}
+        assert market.get_bids() == bids
+
+        for bid_in_snapshot in bids.values():
+            market.delete_bid(bid_in_snapshot.id)
+        assert bids == {bid.id: bid}
+        assert market.get_bids() == {}
+
+    @staticmethod
+    def test_snapshot_orders_are_not_updated_by_trades():
+        # pylint: disable=import-outside-toplevel
+        from gsy_framework.data_classes import TradeBidOfferInfo, TraderDetails
+        from pendulum import datetime
+
+        from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
+        from gsy_e.models.market.two_sided import TwoSidedMarket
+
+        time_slot = datetime(2021, 10, 19, 0, 0)
+        market = TwoSidedMarket(time_slot=time_slot, bc=NonBlockchainInterface(str(uuid4())))
+        bid = market.bid(20, 10, TraderDetails("buyer", ""), original_price=20,
+                         time_slot=time_slot)
+        bids = market.get_bids()
+        assert bids[bid.id] is not bid
+
+        trade = market.accept_bid(bids[bid.id], energy=10, seller=TraderDetails("seller", ""),
+                                  trade_offer_info=TradeBidOfferInfo(2, 2, 1.5, 1.5, 1.5))
+        assert trade.trade_price == 15
+        assert trade.match_details["bid"].price == 15
+        assert bids[bid.id].price == 20
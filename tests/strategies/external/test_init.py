@@ -194,15 +194,15 @@ class TestExternalMixin:
             external_tick_counter._dispatch_tick_frequency == 18
         self.area.current_tick = 1
         strategy._dispatch_event_tick_to_external_agent()
-        strategy.redis.publish_json.assert_not_called()
+        strategy.redis.publish_event_json.assert_not_called()
         self.area.current_tick = 17
         strategy._dispatch_event_tick_to_external_agent()
-        strategy.redis.publish_json.assert_not_called()
+        strategy.redis.publish_event_json.assert_not_called()
         self.area.current_tick = 18
         strategy._dispatch_event_tick_to_external_agent()
-        strategy.redis.publish_json.assert_called_once()
-        assert strategy.redis.publish_json.call_args_list[0][0][0] == "test_area/events/tick"
-        result = strategy.redis.publish_json.call_args_list[0][0][1]
+        strategy.redis.publish_event_json.assert_called_once()
+        assert strategy.redis.publish_event_json.call_args_list[0][0][0] == "test_area/events/tick"
+        result = strategy.redis.publish_event_json.call_args_list[0][0][1]
         result.pop("area_uuid")
         assert result == \
             {"slot_completion": "20%",
@@ -211,15 +211,15 @@ class TestExternalMixin:
              "device_info": strategy._device_info_dict}
 
         strategy.redis.reset_mock()
-        strategy.redis.publish_json.reset_mock()
+        strategy.redis.publish_event_json.reset_mock()
         self.area.current_tick = 35
         strategy._dispatch_event_tick_to_external_agent()
-        strategy.redis.publish_json.assert_not_called()
+        strategy.redis.publish_event_json.assert_not_called()
         self.area.current_tick = 36
         strategy._dispatch_event_tick_to_external_agent()
-        strategy.redis.publish_json.assert_called_once()
-        assert strategy.redis.publish_json.call_args_list[0][0][0] == "test_area/events/tick"
-        result = strategy.redis.publish_json.call_args_list[0][0][1]
+        strategy.redis.publish_event_json.assert_called_once()
+        assert strategy.redis.publish_event_json.call_args_list[0][0][0] == "test_area/events/tick"
+        result = strategy.redis.publish_event_json.call_args_list[0][0][1]
         result.pop("area_uuid")
         assert result == \
             {"slot_completion": "40%",
@@ -315,8 +315,9 @@ class TestExternalMixin:
                                   TraderDetails("test_area", str(self.area.uuid))),
                       traded_energy=1, trade_price=20)
         strategy.event_offer_traded(market_id="test_market", trade=trade)
-        assert strategy.redis.publish_json.call_args_list[0][0][0] == "test_area/events/trade"
-        call_args = strategy.redis.publish_json.call_args_list[0][0][1]
+        assert (strategy.redis.publish_event_json.call_args_list[0][0][0] ==
+                "test_area/events/trade")
+        call_args = strategy.redis.publish_event_json.call_args_list[0][0][1]
         assert call_args["trade_id"] == trade.id
         assert call_args["event"] == "trade"
         assert call_args["trade_price"] == 20
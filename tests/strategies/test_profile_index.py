@@ -0,0 +1,83 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from unittest.mock import patch
+
+import pytest
+from gsy_framework.constants_limits import GlobalConfig
+from gsy_framework.utils import find_object_of_same_weekday_and_time
+from pendulum import datetime, duration
+
+from gsy_e.gsy_e_core.user_profile_handler import ReadOnlyProfile
+from gsy_e.models.strategy.profile_index import ProfileSlotIndex, get_profile_slot_index
+
+START = datetime(2022, 1, 3)
+
+
+@pytest.fixture(name="weekly_profile")
+def weekly_profile_fixture():
+    return {START + duration(hours=hour): float(hour) for hour in range(7 * 24)}
+
+
+class TestProfileSlotIndex:
+    """Test the ProfileSlotIndex class."""
+
+    @staticmethod
+    @pytest.mark.parametrize("is_canary_network", [True, False])
+    def test_get_returns_the_same_values_as_find_object_of_same_weekday_and_time(
+            weekly_profile, is_canary_network):
+        with patch.object(GlobalConfig, "IS_CANARY_NETWORK", is_canary_network):
+            index = ProfileSlotIndex(weekly_profile)
+            for hour in range(-24, 3 * 7 * 24, 5):
+                time_slot = START + duration(hours=hour)
+                assert index.get(time_slot) == find_object_of_same_weekday_and_time(
+                    weekly_profile, time_slot)
+
+    @staticmethod
+    def test_get_folds_the_time_slots_to_the_week_of_the_profile_for_canary_network(
+            weekly_profile):
+        with patch.object(GlobalConfig, "IS_CANARY_NETWORK", True):
+            index = ProfileSlotIndex(weekly_profile)
+        with patch.object(GlobalConfig, "IS_CANARY_NETWORK", True), patch(
+                "gsy_e.models.strategy.profile_index.find_object_of_same_weekday_and_time"
+        ) as find_object_mock:
+            assert index.get(START + duration(weeks=2, hours=5)) == 5.0
+            find_object_mock.assert_not_called()
+
+    @staticmethod
+    def test_profile_is_folded_without_looking_up_its_timestamps():
+        # Two weeks of 15 minute slots that start in the middle of a day.
+        profile = {START + duration(hours=10, minutes=15 * slot): float(slot)
+                   for slot in range(2 * 7 * 24 * 4)}
+        with patch.object(GlobalConfig, "IS_CANARY_NETWORK", True), patch(
+                "gsy_e.models.strategy.profile_index.find_object_of_same_weekday_and_time"
+        ) as find_object_mock:
+            index = ProfileSlotIndex(profile)
+            find_object_mock.assert_not_called()
+
+        with patch.object(GlobalConfig, "IS_CANARY_NETWORK", True):
+            for slot in range(-100, 4 * 7 * 24 * 4, 7):
+                time_slot = START + duration(minutes=15 * slot)
+                assert index.get(time_slot) == find_object_of_same_weekday_and_time(
+                    profile, time_slot)
+
+    @staticmethod
+    def test_index_of_read_only_profile_is_shared(weekly_profile):
+        profile = ReadOnlyProfile(weekly_profile)
+        assert get_profile_slot_index(profile) is get_profile_slot_index(profile)
+        assert get_profile_slot_index(weekly_profile) is not get_profile_slot_index(
+            weekly_profile)
@@ -0,0 +1,104 @@
+"""
+Copyright 2018 Grid Singularity
+This file is part of Grid Singularity Exchange.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import pickle
+from copy import copy, deepcopy
+
+import pytest
+from pendulum import datetime, duration
+
+from gsy_e.models.strategy.slot_series import SlotSeries, delete_time_slots_before
+
+SLOT_LENGTH = duration(minutes=15)
+START = datetime(2022, 1, 1, 12)
+
+
+def _time_slot(index: int):
+    return START + SLOT_LENGTH * index
+
+
+class TestSlotSeries:
+    """Test the SlotSeries class."""
+
+    @staticmethod
+    def test_behaves_like_a_dict_for_aligned_and_non_aligned_time_slots():
+        series = SlotSeries(slot_length=SLOT_LENGTH)
+        expected = {}
+        for index in (3, 0, 5, 1, 200, -2):
+            series[_time_slot(index)] = index * 1.5
+            expected[_time_slot(index)] = index * 1.5
+        non_aligned = _time_slot(2).add(minutes=1)
+        series[non_aligned] = 7.0
+        expected[non_aligned] = 7.0
+
+        assert dict(series.items()) == expected
+        assert len(series) == len(expected)
+        assert _time_slot(4) not in series
+        assert series.get(_time_slot(4), 1.0) == 1.0
+        assert series.pop(_time_slot(5)) == 7.5
+        assert _time_slot(5) not in series
+        del series[non_aligned]
+        assert non_aligned not in series
+        with pytest.raises(KeyError):
+            series[_time_slot(4)]  # pylint: disable=pointless-statement
+
+    @staticmethod
+    def test_iterates_in_the_order_of_the_time_slots():
+        series = SlotSeries(slot_length=SLOT_LENGTH)
+        for index in (2, 0, 3, 1):
+            series[_time_slot(index)] = index
+        assert list(series) == [_time_slot(index) for index in range(4)]
+        assert list(series.values()) == [0, 1, 2, 3]
+
+    @staticmethod
+    def test_default_value_is_stored_on_read():
+        series = SlotSeries(slot_length=SLOT_LENGTH, default=20)
+        assert series[_time_slot(1)] == 20
+        assert _time_slot(1) in series
+        series[_time_slot(1)] += 5
+        assert series[_time_slot(1)] == 25
+        assert series.get(_time_slot(2)) is None
+        assert _time_slot(2) not in series
+
+    @staticmethod
+    def test_delete_before_removes_the_past_time_slots():
+        series = SlotSeries(slot_length=SLOT_LENGTH)
+        for index in range(100):
+            series[_time_slot(index)] = index
+            delete_time_slots_before(series, _time_slot(index - 3))
+        assert list(series) == [_time_slot(index) for index in range(96, 100)]
+        series.delete_before(_time_slot(98).add(minutes=1))
+        assert list(series.values()) == [99]
+
+    @staticmethod
+    def test_delete_time_slots_before_supports_dicts():
+        time_series = {_time_slot(index): index for index in range(4)}
+        delete_time_slots_before(time_series, _time_slot(2))
+        assert time_series == {_time_slot(2): 2, _time_slot(3): 3}
+
+    @staticmethod
+    @pytest.mark.parametrize("copy_function", [
+        copy, deepcopy, lambda series: pickle.loads(pickle.dumps(series))])
+    def test_copies_are_independent(copy_function):
+        series = SlotSeries(((_time_slot(index), index) for index in range(3)),
+                            typecode=None, slot_length=SLOT_LENGTH, default=0)
+        series_copy = copy_function(series)
+        series_copy[_time_slot(0)] = 10
+        assert dict(series_copy.items()) == {
+            _time_slot(0): 10, _time_slot(1): 1, _time_slot(2): 2}
+        assert series[_time_slot(0)] == 0
+        assert series_copy[_time_slot(5)] == 0
@@ -92,6 +92,7 @@ class FakeStrategy:
 class FakeOffer:
     def __init__(self, id):
         self.id = id
+        self.time_slot = None
 
 
 class FakeMarket:
@@ -196,6 +197,38 @@ def test_offers_partial_offer(offer1, offers3):
     assert accepted_offer in offers3.sold_in_market("market")
 
 
+def test_offers_are_indexed_per_time_slot():
+    offers = Offers(FakeStrategy())
+    time_slot_1 = pendulum.datetime(2021, 1, 1, 0, 0)
+    time_slot_2 = pendulum.datetime(2021, 1, 1, 0, 15)
+    seller = TraderDetails("FakeOwner", "")
+    offer1 = Offer("id1", pendulum.now(), 1, 1, seller, time_slot=time_slot_1)
+    offer2 = Offer("id2", pendulum.now(), 2, 2, seller, time_slot=time_slot_2)
+    offer3 = Offer("id3", pendulum.now(), 4, 4, seller, time_slot=time_slot_2)
+    for offer in (offer1, offer2, offer3):
+        offers.post(offer, "market")
+
+    assert offers.posted_in_market("market", time_slot_2) == [offer2, offer3]
+    assert offers.posted_offer_energy("market") == 7
+    assert offers.posted_offer_energy("market", time_slot_2) == 6
+    assert offers.is_offer_posted("market", "id2")
+    assert not offers.is_offer_posted("market2", "id2")
+
+    offers.sold_offer(offer2, "market")
+    assert offers.open_in_market("market", time_slot_2) == [offer3]
+    assert offers.open_offer_energy("market") == 5
+    assert offers.sold_offer_energy("market", time_slot_2) == 2
+    assert offers.sold_offer_price("market", time_slot_1) == 0
+    assert offers.get_sold_offer("market", "id2") == offer2
+
+    offers.remove_offer_from_cache_and_market(MagicMock(id="market"), "id3")
+    assert offers.posted_offer_energy("market", time_slot_2) == 2
+    assert not offers.has_open_offers_in_market("market2")
+    assert offers.has_open_offers_in_market("market")
+    offers.sold_offer(offer1, "market")
+    assert not offers.has_open_offers_in_market("market")
+
+
 @pytest.fixture(name="offer_to_accept")
 def offer_to_accept_fixture():
     return Offer("new", pendulum.now(), 1.0, 0.5, TraderDetails("someone", ""))
@@ -272,6 +305,33 @@ def test_add_bid_to_bought(base):
     assert base._get_traded_bids_from_market(market.id) == [bid]
 
 
+@patch("gsy_framework.constants_limits.ConstSettings.MASettings.MARKET_TYPE",
+       SpotMarketTypeEnum.TWO_SIDED.value)
+def test_posted_bids_are_indexed_per_time_slot(base):
+    market = FakeMarket(raises=True)
+    base.area._market = market
+    time_slot_1 = pendulum.datetime(2021, 1, 1, 0, 0)
+    time_slot_2 = pendulum.datetime(2021, 1, 1, 0, 15)
+    bid1 = Bid("bid1", pendulum.now(), 10, 5, TraderDetails("FakeOwner", ""),
+               time_slot=time_slot_1)
+    bid2 = Bid("bid2", pendulum.now(), 4, 2, TraderDetails("FakeOwner", ""),
+               time_slot=time_slot_2)
+    base.add_bid_to_posted(market.id, bid1)
+    base.add_bid_to_posted(market.id, bid2)
+
+    assert base.get_posted_bids(market, time_slot_2) == [bid2]
+    assert base.posted_bid_energy(market.id) == 7
+    assert base.posted_bid_energy(market.id, time_slot_1) == 5
+    assert base.is_bid_posted(market, "bid2")
+    assert base.are_bids_posted(market.id, time_slot_2)
+
+    base.add_bid_to_bought(bid2, market.id)
+    assert not base.are_bids_posted(market.id, time_slot_2)
+    assert base.posted_bid_energy(market.id) == 5
+    assert base._traded_bid_energy(market.id, time_slot_2) == 2
+    assert base._traded_bid_costs(market.id) == 4
+
+
 def test_bid_events_fail_for_one_sided_market(base):
     ConstSettings.MASettings.MARKET_TYPE = 1
     test_bid = Bid("123", pendulum.now(), 12, 23, TraderDetails("A", ""))
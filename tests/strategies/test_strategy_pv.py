@@ -278,6 +278,31 @@ def test_same_slot_price_drop_does_not_reduce_price_below_threshold(area_test3,
     assert new_offer.energy_rate >= ConstSettings.PVSettings.SELLING_RATE_RANGE.final
 
 
+def test_offer_prices_are_only_checked_on_the_scheduled_update_ticks(area_test3, pv_test3):
+    # pylint: disable=protected-access
+    pv_test3.event_activate()
+    pv_test3.event_market_cycle()
+    offer_update = pv_test3.offer_update
+    tick_seconds = area_test3.config.tick_length.seconds
+    ticks_per_slot = int(area_test3.config.ticks_per_slot)
+    expected_updates = 0
+    for tick in range(ticks_per_slot):
+        if tick * tick_seconds >= offer_update.update_interval.seconds * expected_updates:
+            expected_updates += 1
+
+    with patch.object(offer_update, "_seconds_until_price_update",
+                      wraps=offer_update._seconds_until_price_update) as checks_mock, \
+            patch.object(pv_test3, "update_offer_rates") as update_mock:
+        for tick in range(ticks_per_slot):
+            area_test3.current_tick = tick
+            pv_test3.event_tick()
+
+    assert update_mock.call_count == expected_updates
+    assert offer_update.update_counter[area_test3.spot_market.time_slot] == expected_updates
+    # Only the ticks on which an update is due check the prices of the offers.
+    assert checks_mock.call_count <= 3 * expected_updates < ticks_per_slot
+
+
 @pytest.fixture(name="pv_test4")
 def fixture_pv_test4(area_test3):
     p = PVStrategy()
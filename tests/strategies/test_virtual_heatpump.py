@@ -1,4 +1,5 @@
 from math import isclose
+from unittest.mock import patch
 
 import pytest
 from gsy_framework.constants_limits import ConstSettings, GlobalConfig
@@ -6,6 +7,9 @@ from pendulum import DateTime, UTC
 
 from gsy_e.constants import FLOATING_POINT_TOLERANCE
 from gsy_e.models.area import Area
+from gsy_e.models.strategy.energy_parameters.virtual_heat_pump import (
+    HeatpumpStorageEnergySolver, VirtualHeatpumpEnergyParameters, VirtualHeatpumpFleet,
+    _solve_storage_temp_from_energy, virtual_heatpump_fleet)
 from gsy_e.models.strategy.virtual_heatpump import VirtualHeatpumpStrategy
 
 
@@ -90,3 +94,131 @@ class TestVirtualHeatpumpStrategy:
         calculated_temp_decrease = self._virtual_hp._energy_params._calc_temp_decrease_K(
             self._datetime)
         assert isclose(calculated_temp_decrease, temp_decrease, abs_tol=FLOATING_POINT_TOLERANCE)
+
+
+class TestHeatpumpStorageEnergySolver:
+    # pylint: disable=too-many-arguments,protected-access
+
+    parameterized_arg_list = [
+        (20.0, 60.0, 45.0, 0.1, 6.98603741),
+        (20.0, 50.0, 40.0, 0.1, 6.81625000),
+        (20.0, 60.0, 45.0, 0.5, 21.5665540),
+        (20.0, 60.0, 20.0, 0.1, 21.4863768),
+        (35.5, 55.0, 30.0, 0.3, 0.0),
+        (12.0, 70.0, 35.0, 0.05, 2.5),
+        (58.0, 60.0, 45.0, 0.2, 10.0),
+    ]
+
+    @staticmethod
+    def _create_solver(storage_temp, water_supply_temp, water_return_temp, water_flow, energy):
+        return HeatpumpStorageEnergySolver(
+            tank_volume_l=500, current_storage_temp_C=storage_temp,
+            dh_supply_temp_C=water_supply_temp, dh_return_temp_C=water_return_temp,
+            dh_flow_m3_per_hour=water_flow, energy_kWh=energy)
+
+    @pytest.mark.parametrize(
+        "storage_temp, water_supply_temp, water_return_temp, water_flow, energy",
+        parameterized_arg_list)
+    def test_storage_temp_from_energy_matches_sympy_solution(
+            self, storage_temp, water_supply_temp, water_return_temp, water_flow, energy):
+        solver = self._create_solver(
+            storage_temp, water_supply_temp, water_return_temp, water_flow, energy)
+        solver.calculate_storage_temp_from_energy()
+        sympy_storage_temp = solver.calculate_storage_temp_from_energy_sympy()
+        assert isclose(solver.target_storage_temp_C, sympy_storage_temp,
+                       abs_tol=FLOATING_POINT_TOLERANCE)
+
+    @pytest.mark.parametrize(
+        "storage_temp, water_supply_temp, water_return_temp, water_flow, energy",
+        parameterized_arg_list)
+    def test_storage_temp_from_energy_is_inverse_of_energy_from_storage_temp(
+            self, storage_temp, water_supply_temp, water_return_temp, water_flow, energy):
+        solver = self._create_solver(
+            storage_temp, water_supply_temp, water_return_temp, water_flow, energy)
+        solver.calculate_storage_temp_from_energy()
+
+        inverse_solver = HeatpumpStorageEnergySolver(
+            tank_volume_l=500, current_storage_temp_C=storage_temp,
+            dh_supply_temp_C=water_supply_temp, dh_return_temp_C=water_return_temp,
+            dh_flow_m3_per_hour=water_flow, target_storage_temp_C=solver.target_storage_temp_C)
+        inverse_solver.calculate_energy_from_storage_temp()
+        assert isclose(inverse_solver.energy_kWh, energy, abs_tol=FLOATING_POINT_TOLERANCE)
+        assert isclose(inverse_solver.cop, solver.cop, abs_tol=FLOATING_POINT_TOLERANCE)
+        assert isclose(inverse_solver.condenser_temp_C, solver.condenser_temp_C,
+                       abs_tol=FLOATING_POINT_TOLERANCE)
+
+    def test_storage_temp_from_energy_is_cached(self):
+        _solve_storage_temp_from_energy.cache_clear()
+        for _ in range(3):
+            solver = self._create_solver(20.0, 60.0, 45.0, 0.1, 6.98603741)
+            solver.calculate_storage_temp_from_energy()
+        cache_info = _solve_storage_temp_from_energy.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+
+class TestVirtualHeatpumpFleet:
+    # pylint: disable=protected-access,attribute-defined-outside-init
+
+    def setup_method(self):
+        self._datetime = DateTime(year=2022, month=7, day=1, tzinfo=UTC)
+        self._default_start_date = GlobalConfig.start_date
+        GlobalConfig.start_date = self._datetime
+
+    def teardown_method(self):
+        GlobalConfig.start_date = self._default_start_date
+
+    @staticmethod
+    def _create_heatpump(supply_temp, return_temp, water_flow, initial_temp):
+        heatpump = VirtualHeatpumpEnergyParameters(
+            maximum_power_rating_kW=10, min_temp_C=10, max_temp_C=60,
+            initial_temp_C=initial_temp, tank_volume_l=500,
+            water_supply_temp_C_profile=supply_temp,
+            water_return_temp_C_profile=return_temp,
+            dh_water_flow_m3_profile=water_flow)
+        heatpump.event_activate()
+        return heatpump
+
+    def test_fleet_state_matches_individually_populated_state(self):
+        parameters = [(60, 45, 0.1, 20), (50, 40, 0.3, 35), (70, 30, 0.05, 55), (60, 45, 0., 30)]
+        individual_heatpumps = [self._create_heatpump(*params) for params in parameters]
+        fleet_heatpumps = [self._create_heatpump(*params) for params in parameters]
+        fleet = VirtualHeatpumpFleet()
+        for heatpump in fleet_heatpumps:
+            fleet.register(heatpump)
+
+        for slot in range(4):
+            time_slot = self._datetime + GlobalConfig.slot_length * slot
+            for heatpump in individual_heatpumps:
+                heatpump._rotate_profiles(time_slot)
+                heatpump._populate_state(time_slot)
+            assert fleet.populate_state(fleet_heatpumps[0], time_slot) is True
+            for heatpump in fleet_heatpumps[1:]:
+                assert fleet.populate_state(heatpump, time_slot) is True
+
+            for individual_heatpump, fleet_heatpump in zip(
+                    individual_heatpumps, fleet_heatpumps):
+                for result_slot in (time_slot - GlobalConfig.slot_length, time_slot):
+                    individual_results = individual_heatpump.state.get_results_dict(result_slot)
+                    fleet_results = fleet_heatpump.state.get_results_dict(result_slot)
+                    for key, value in individual_results.items():
+                        assert isclose(value, fleet_results[key],
+                                       abs_tol=FLOATING_POINT_TOLERANCE), key
+
+            for index, (individual_heatpump, fleet_heatpump) in enumerate(
+                    zip(individual_heatpumps, fleet_heatpumps)):
+                traded_energy_kWh = min(
+                    0.5 * (index + 1), individual_heatpump.get_max_energy_demand_kWh(time_slot))
+                individual_heatpump.event_traded_energy(time_slot, traded_energy_kWh)
+                fleet_heatpump.event_traded_energy(time_slot, traded_energy_kWh)
+
+    def test_heatpump_is_removed_from_the_fleet_on_deactivate(self):
+        with patch("gsy_e.constants.VECTORISED_VIRTUAL_HEATPUMP_FLEET", True):
+            heatpump = self._create_heatpump(60, 45, 0.1, 20)
+        assert virtual_heatpump_fleet.populate_state(heatpump, self._datetime) is True
+        heatpump.event_deactivate()
+        assert virtual_heatpump_fleet.populate_state(heatpump, self._datetime) is False
+
+    def test_populate_state_ignores_heatpumps_outside_of_the_fleet(self):
+        heatpump = self._create_heatpump(60, 45, 0.1, 20)
+        assert VirtualHeatpumpFleet().populate_state(heatpump, self._datetime) is False
@@ -252,6 +252,109 @@ class TestSimulationEndpointBuffer:
 
         assert endpoint_buffer.result_area_uuids == {"AREA", "child-uuid-2", "child-uuid-1"}
 
+    @staticmethod
+    @patch("gsy_e.constants.RESULTS_VALIDATION_MODE", "incremental")
+    def test_update_stats_incremental_validation_only_validates_changed_results(general_setup):
+        # pylint: disable=protected-access
+        area, _ = general_setup
+        area.spot_market = MagicMock(
+            time_slot=pendulum.DateTime(2022, 10, 30),
+            time_slot_str="2021-10-30T00:00:00+00:00")
+        area.children = []
+        area.topology_version = 0
+        endpoint_buffer = SimulationEndpointBuffer(
+            job_id="JOB_1", random_seed=41, area=area, should_export_plots=False)
+        endpoint_buffer.results_validator = MagicMock()
+        validator = endpoint_buffer.results_validator
+
+        def _update_stats(area_results):
+            endpoint_buffer._populate_core_stats_and_sim_state = lambda _: [
+                endpoint_buffer._set_area_core_stats_and_state(
+                    MagicMock(uuid=area_uuid), core_stats, {"state": core_stats})
+                for area_uuid, core_stats in area_results.items()]
+            validator.reset_mock()
+            endpoint_buffer.update_stats(
+                area=area, simulation_status="running",
+                progress_info=MagicMock(eta=None, elapsed_time=pendulum.duration(minutes=1),
+                                        percentage_completed=1),
+                sim_state={"general": "state"}, calculate_results=False)
+
+        _update_stats({"AREA": {"value": 1}, "CHILD": {"value": 2}})
+        validator.validate_simulation_raw_data.assert_called_once_with(
+            {"AREA": {"value": 1}, "CHILD": {"value": 2}})
+        validator.validate_configuration_tree.assert_called_once_with(
+            endpoint_buffer.area_result_dict)
+        configuration_tree = endpoint_buffer.area_result_dict
+
+        _update_stats({"AREA": {"value": 1}, "CHILD": {"value": 3}})
+        validator.validate_simulation_raw_data.assert_called_once_with({"CHILD": {"value": 3}})
+        validator.validate_simulation_state.assert_called_once_with({
+            "general": {"general": "state"}, "areas": {"CHILD": {"state": {"value": 3}}}})
+        validator.validate_configuration_tree.assert_not_called()
+        assert endpoint_buffer.area_result_dict is configuration_tree
+
+        # A live event changed the grid topology, the configuration tree is rebuilt.
+        area.topology_version = 1
+        _update_stats({"AREA": {"value": 1}, "CHILD": {"value": 3}})
+        validator.validate_simulation_raw_data.assert_called_once_with({})
+        validator.validate_configuration_tree.assert_called_once_with(
+            endpoint_buffer.area_result_dict)
+        assert endpoint_buffer.area_result_dict is not configuration_tree
+
+    @staticmethod
+    @patch("gsy_e.constants.KAFKA_RESULTS_DELTA_PUBLISHING", True)
+    def test_results_of_removed_areas_are_dropped_and_reported_in_the_delta(general_setup):
+        # pylint: disable=protected-access
+        area, _ = general_setup
+        area.spot_market = MagicMock(
+            time_slot=pendulum.DateTime(2022, 10, 30),
+            time_slot_str="2021-10-30T00:00:00+00:00")
+        area.children = []
+        area.topology_version = 0
+        endpoint_buffer = SimulationEndpointBuffer(
+            job_id="JOB_1", random_seed=41, area=area, should_export_plots=False)
+        endpoint_buffer.results_validator = MagicMock()
+
+        def _update_stats_and_publish(area_results):
+            endpoint_buffer._populate_core_stats_and_sim_state = lambda _: [
+                endpoint_buffer._set_area_core_stats_and_state(
+                    MagicMock(uuid=area_uuid), core_stats, {"state": core_stats})
+                for area_uuid, core_stats in area_results.items()]
+            endpoint_buffer.update_stats(
+                area=area, simulation_status="running",
+                progress_info=MagicMock(eta=None, elapsed_time=pendulum.duration(minutes=1),
+                                        percentage_completed=1),
+                sim_state={"general": "state"}, calculate_results=False)
+            return endpoint_buffer.prepare_results_for_publish()
+
+        keyframe = _update_stats_and_publish({"AREA": {"value": 1}, "CHILD": {"value": 2}})
+        assert keyframe["message_type"] == "keyframe"
+        assert set(keyframe["simulation_raw_data"]) == {"AREA", "CHILD"}
+
+        delta = _update_stats_and_publish({"AREA": {"value": 1}})
+        assert delta["message_type"] == "delta"
+        assert delta["removed_area_uuids"] == ["CHILD"]
+        assert endpoint_buffer.flattened_area_core_stats_dict == {"AREA": {"value": 1}}
+        assert endpoint_buffer.simulation_state["areas"] == {"AREA": {"state": {"value": 1}}}
+
+    @staticmethod
+    @patch("gsy_e.constants.RESULTS_VALIDATION_SAMPLING_INTERVAL", 3)
+    @patch("gsy_e.constants.RESULTS_VALIDATION_MODE", "sampled")
+    def test_sampled_validation_validates_every_sampling_interval(general_setup):
+        # pylint: disable=protected-access
+        area, _ = general_setup
+        endpoint_buffer = SimulationEndpointBuffer(
+            job_id="JOB_1", random_seed=41, area=area, should_export_plots=False)
+        endpoint_buffer.results_validator = MagicMock()
+        for update in range(1, 7):
+            endpoint_buffer._set_area_core_stats_and_state(
+                MagicMock(uuid=f"area-{update}"), {"value": update}, {})
+            endpoint_buffer._validate_updated_results()
+        calls = endpoint_buffer.results_validator.validate_simulation_raw_data.call_args_list
+        assert [call.args[0] for call in calls] == [
+            {f"area-{update}": {"value": update} for update in (1, 2, 3)},
+            {f"area-{update}": {"value": update} for update in (4, 5, 6)}]
+
 
 class TestSimulationEndpointBufferForward:
     """Tests for the SimulationEndpointBuffer class."""
@@ -15,7 +15,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from pendulum import duration, today
 from gsy_framework.constants_limits import ConstSettings
@@ -126,3 +126,28 @@ class TestGlobalObjects:
                                   }}}}}}
 
         assert expected_area_stats_tree_dict == go.area_stats_tree_dict
+
+    def test_update_dirty_areas_only_updates_the_stats_of_the_marked_areas(self):
+        go = ExternalConnectionGlobalStatistics()
+        go(self.grid_area, self.config.ticks_per_slot)
+        self.grid_area.current_tick += 15
+        self.house_area.current_tick += 15
+        self.grid_area.cycle_markets(_trigger_event=True)
+        go.update()
+        house_stats = go.area_stats_tree_dict[self.grid_area.uuid]["children"][
+            self.house_area.uuid]
+        pv_stats = house_stats["children"][self.pv.uuid]
+
+        with patch.object(LoadHoursExternalStrategy, "market_info_dict",
+                          new_callable=PropertyMock, return_value={"asset_info": {}}), \
+                patch.object(PVExternalStrategy, "market_info_dict",
+                             new_callable=PropertyMock) as pv_market_info_mock:
+            go.update_dirty_areas()
+            assert house_stats["children"][self.load.uuid]["asset_info"] != {}
+            go.mark_area_dirty(self.load)
+            go.update_dirty_areas()
+            pv_market_info_mock.assert_not_called()
+
+        assert house_stats["children"][self.load.uuid] == {
+            "asset_info": {}, "area_name": "Load"}
+        assert house_stats["children"][self.pv.uuid] is pv_stats
@@ -351,3 +351,40 @@ class TestLiveEvents:
         except GSyException:
             assert False
         assert self.area_house1.children == [self.area1, self.area2]
+
+    def test_create_and_delete_area_events_keep_the_area_uuid_index_consistent(self):
+        assert self.area_grid.get_area_by_uuid(self.area1.uuid) is self.area1
+        self.live_events.add_event({
+            "eventType": "create_area",
+            "parent_uuid": self.area_house2.uuid,
+            "area_representation": {
+                "name": "House 3", "uuid": "house-3-uuid",
+                "children": [{"type": "LoadHours", "name": "new_load", "uuid": "new-load-uuid",
+                              "avg_power_W": 234}]}
+        })
+        self.live_events.add_event(
+            {"eventType": "delete_area", "area_uuid": self.area_house1.uuid})
+        self.live_events.handle_all_events(self.area_grid)
+
+        new_house = self.area_grid.area_uuid_index.get("house-3-uuid")
+        assert new_house in self.area_house2.children
+        assert self.area_grid.area_uuid_index.get("new-load-uuid").parent is new_house
+        for deleted_area in (self.area_house1, self.area1, self.area2):
+            assert self.area_grid.get_area_by_uuid(deleted_area.uuid) is None
+        # house 2, storage, smart meter, house 3 and its load, plus the grid
+        assert len(self.area_grid.area_uuid_index) == 6
+
+    def test_update_area_event_is_applied_on_area_added_outside_live_events(self):
+        area_load = Area("new load", None, None, LoadHoursStrategy(avg_power_W=100),
+                         self.config, None, grid_fee_percentage=0)
+        # Build the index before the area is attached to the tree.
+        assert self.area_grid.get_area_by_uuid(self.area1.uuid) is self.area1
+        area_load.parent = self.area_house2
+        self.area_house2.children.append(area_load)
+        self.area_grid.activate()
+
+        self.live_events.add_event({
+            "eventType": "update_area", "area_uuid": area_load.uuid,
+            "area_representation": {"avg_power_W": 432}})
+        self.live_events.handle_all_events(self.area_grid)
+        assert area_load.strategy._energy_params.avg_power_W == 432
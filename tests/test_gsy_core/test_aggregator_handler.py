@@ -0,0 +1,67 @@
+# pylint: disable=protected-access
+import json
+from copy import deepcopy
+from unittest.mock import MagicMock
+
+import pytest
+from redis import Redis
+
+from gsy_e.gsy_e_core.redis_connections.aggregator import AggregatorHandler
+
+GRID_TREE = {
+    "grid": {
+        "area_name": "Grid",
+        "last_market_stats": {"min_trade_rate": 10},
+        "children": {
+            "house1": {
+                "area_name": "House 1",
+                "children": {
+                    "load1": {"area_name": "Load 1", "asset_info": {"energy_requirement_kWh": 1}},
+                    "pv1": {"area_name": "PV 1", "asset_info": {"available_energy_kWh": 2}}}},
+            "pv2": {"area_name": "PV 2", "asset_info": {"available_energy_kWh": 3}}}}}
+
+
+@pytest.fixture(name="aggregator_handler")
+def fixture_aggregator_handler():
+    handler = AggregatorHandler(MagicMock(spec=Redis))
+    handler.set_aggregator_device_mapping({"aggr1": ["load1", "pv2"], "aggr2": ["pv1"]})
+    return handler
+
+
+class TestAggregatorHandler:
+
+    @staticmethod
+    def test_delete_not_owned_devices_from_dict_only_keeps_the_devices_of_the_aggregator(
+            aggregator_handler):
+        grid_tree = deepcopy(GRID_TREE)
+        grid_tree_aggr1 = aggregator_handler._delete_not_owned_devices_from_dict(
+            grid_tree, "aggr1")
+
+        house_children = grid_tree_aggr1["grid"]["children"]["house1"]["children"]
+        assert house_children["load1"] == GRID_TREE["grid"]["children"]["house1"]["children"][
+            "load1"]
+        assert house_children["pv1"] == {"area_name": "PV 1"}
+        assert grid_tree_aggr1["grid"]["children"]["pv2"] == GRID_TREE["grid"]["children"]["pv2"]
+        assert grid_tree_aggr1["grid"]["last_market_stats"] == {"min_trade_rate": 10}
+        # the grid tree of the global stats is not modified
+        assert grid_tree == GRID_TREE
+
+    @staticmethod
+    def test_visible_devices_are_updated_when_the_devices_change(aggregator_handler):
+        assert aggregator_handler._get_visible_devices("aggr1") == {"load1", "pv2"}
+
+        aggregator_handler.remove_device("pv2")
+        assert aggregator_handler._get_visible_devices("aggr1") == {"load1"}
+
+        aggregator_handler._unselect_aggregator(
+            {"device_uuid": "load1", "aggregator_uuid": "aggr1", "transaction_id": "1"})
+        assert aggregator_handler._get_visible_devices("aggr1") == frozenset()
+
+        aggregator_handler.aggregator_callback({"data": json.dumps({
+            "type": "SELECT", "device_uuid": "pv2", "aggregator_uuid": "aggr1",
+            "transaction_id": "2", "config_uuid": None})})
+        grid_tree_aggr1 = aggregator_handler._delete_not_owned_devices_from_dict(
+            GRID_TREE, "aggr1")
+        assert grid_tree_aggr1["grid"]["children"]["pv2"] == GRID_TREE["grid"]["children"]["pv2"]
+        assert grid_tree_aggr1["grid"]["children"]["house1"]["children"]["load1"] == {
+            "area_name": "Load 1"}
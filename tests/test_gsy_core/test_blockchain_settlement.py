@@ -0,0 +1,162 @@
+# pylint: disable=protected-access
+import threading
+
+import pytest
+
+from gsy_e.gsy_e_core.blockchain_settlement import BlockchainSettlementQueue
+
+
+class FakeEth:
+    """In-process replacement of the web3 eth module."""
+
+    def __init__(self, node):
+        self._node = node
+
+    def getTransactionCount(self, account):  # noqa: N802 pylint: disable=invalid-name
+        self._node.transaction_count_calls += 1
+        return self._node.nonces.get(account, 0)
+
+
+class FakeWeb3:
+    """In-process replacement of the web3 client, backed by a minimal fake node."""
+
+    def __init__(self):
+        self.nonces = {}
+        self.transactions = []
+        self.transaction_count_calls = 0
+        self.eth = FakeEth(self)
+        self.send_transaction_lock = threading.Event()
+        self.send_transaction_lock.set()
+
+    @staticmethod
+    def toWei(value, unit):  # noqa: N802 pylint: disable=invalid-name
+        assert unit == "gwei"
+        return int(float(value) * 10 ** 9)
+
+
+class FakePersonal:
+    """In-process replacement of the geth personal API."""
+
+    def __init__(self, node: FakeWeb3):
+        self._node = node
+        self.created_accounts = []
+
+    def new_account(self, passphrase):
+        account = f"0x{passphrase}"
+        self.created_accounts.append(passphrase)
+        return account
+
+    def send_transaction(self, tx, passphrase):
+        self._node.send_transaction_lock.wait(timeout=5)
+        assert tx["from"] == f"0x{passphrase}"
+        expected_nonce = self._node.nonces.get(tx["from"], 0)
+        if tx["nonce"] != expected_nonce:
+            raise ValueError("nonce too low")
+        self._node.nonces[tx["from"]] = expected_nonce + 1
+        self._node.transactions.append(tx)
+
+
+@pytest.fixture(name="fake_node")
+def fake_node_fixture():
+    return FakeWeb3()
+
+
+@pytest.fixture(name="settlement_queue")
+def settlement_queue_fixture(fake_node):
+    funded_accounts = []
+    settlement_queue = BlockchainSettlementQueue(
+        fake_node, FakePersonal(fake_node), chain_id=123, faucet=funded_accounts.append,
+        max_pending=5, batch_size=3)
+    settlement_queue.funded_accounts = funded_accounts
+    yield settlement_queue
+    fake_node.send_transaction_lock.set()
+    settlement_queue.close()
+
+
+class TestBlockchainSettlementQueue:
+
+    @staticmethod
+    def test_submit_sends_transactions_in_order_with_local_nonces(settlement_queue, fake_node):
+        for price in range(1, 11):
+            settlement_queue.submit(f"slot{price // 5}", "seller", "buyer", price)
+        settlement_queue.flush()
+
+        assert [tx["nonce"] for tx in fake_node.transactions] == list(range(10))
+        assert [tx["value"] for tx in fake_node.transactions] == [
+            price * 10 ** 9 for price in range(1, 11)]
+        assert all(tx["from"] == "0xseller" and tx["to"] == "0xbuyer" and tx["chainId"] == 123
+                   for tx in fake_node.transactions)
+        # The nonce is only fetched from the node once per account.
+        assert fake_node.transaction_count_calls == 1
+        assert settlement_queue.sent_transactions == 10
+        assert settlement_queue.pending == 0
+
+    @staticmethod
+    def test_create_accounts_caches_and_funds_accounts(settlement_queue):
+        settlement_queue.create_accounts(["seller", "buyer"])
+        settlement_queue.flush()
+        settlement_queue.create_accounts(["seller", "buyer", "other"])
+        settlement_queue.submit("slot", "seller", "other", 1)
+        settlement_queue.flush()
+
+        assert settlement_queue._personal.created_accounts == ["seller", "buyer", "other"]
+        assert settlement_queue.funded_accounts == ["0xseller", "0xbuyer", "0xother"]
+        assert settlement_queue.accounts == {
+            "seller": "0xseller", "buyer": "0xbuyer", "other": "0xother"}
+
+    @staticmethod
+    def test_submit_does_not_wait_for_the_node(settlement_queue, fake_node):
+        fake_node.send_transaction_lock.clear()
+        settlement_queue.submit("slot", "seller", "buyer", 1)
+        settlement_queue.submit("slot", "seller", "buyer", 2)
+        assert fake_node.transactions == []
+
+        fake_node.send_transaction_lock.set()
+        settlement_queue.flush()
+        assert len(fake_node.transactions) == 2
+
+    @staticmethod
+    def test_submit_blocks_while_the_queue_is_full(fake_node):
+        settlement_queue = BlockchainSettlementQueue(
+            fake_node, FakePersonal(fake_node), chain_id=123, max_pending=5, batch_size=1)
+        fake_node.send_transaction_lock.clear()
+        # One settlement is processed by the worker, 5 are waiting in the queue.
+        for price in range(6):
+            settlement_queue.submit("slot", "seller", "buyer", price)
+
+        submitted = threading.Event()
+
+        def _submit():
+            settlement_queue.submit("slot", "seller", "buyer", 6)
+            submitted.set()
+
+        thread = threading.Thread(target=_submit, daemon=True)
+        thread.start()
+        assert not submitted.wait(timeout=0.2)
+
+        fake_node.send_transaction_lock.set()
+        assert submitted.wait(timeout=5)
+        settlement_queue.close()
+        assert len(fake_node.transactions) == 7
+
+    @staticmethod
+    def test_failed_transaction_resyncs_nonce_from_node(settlement_queue, fake_node):
+        settlement_queue.submit("slot", "seller", "buyer", 1)
+        settlement_queue.flush()
+        # Transaction sent from the same account by another client.
+        fake_node.nonces["0xseller"] += 1
+
+        settlement_queue.submit("slot", "seller", "buyer", 2)
+        settlement_queue.submit("slot", "seller", "buyer", 3)
+        settlement_queue.flush()
+
+        assert settlement_queue.failed_transactions == 1
+        assert settlement_queue.sent_transactions == 2
+        assert [tx["nonce"] for tx in fake_node.transactions] == [0, 2]
+
+    @staticmethod
+    def test_close_flushes_and_stops_the_worker(settlement_queue, fake_node):
+        settlement_queue.submit("slot", "seller", "buyer", 1)
+        settlement_queue.close()
+        assert len(fake_node.transactions) == 1
+        assert not settlement_queue.is_running
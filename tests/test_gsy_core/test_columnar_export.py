@@ -0,0 +1,75 @@
+import csv
+import os
+
+import pytest
+
+from gsy_e.gsy_e_core.sim_results.columnar_export import (
+    ColumnarExportWriter, _read_table, convert_columnar_export_to_csv)
+
+pyarrow = pytest.importorskip("pyarrow")
+
+TRADE_LABELS = ("slot", "rate [ct./kWh]", "energy [kWh]", "seller")
+STATS_LABELS = ("slot", "load_profile_kWh", "offered_history", "number_of_trades")
+
+
+def _write_csv(file_path, labels, rows, is_first):
+    # Same as the csv export of ExportAndPlot.
+    with open(file_path, "a", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        if is_first:
+            writer.writerow(labels)
+        writer.writerows(rows)
+
+
+def _read_file(file_path):
+    with open(file_path, encoding="utf-8") as csv_file:
+        return csv_file.read()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_columnar_export_is_converted_to_the_csv_layout(tmp_path, file_format):
+    columnar_directory = tmp_path / "columnar_export"
+    csv_directory = tmp_path / "csv_export"
+    os.makedirs(columnar_directory / "Grid")
+    os.makedirs(csv_directory / "Grid")
+    writer = ColumnarExportWriter(str(columnar_directory), file_format, row_group_slots=2)
+
+    slots = [
+        {"Grid/House-trades.csv": [("2021-01-01T00:00", 20.5, 1, "PV")],
+         "Grid/Load.csv": [("2021-01-01T00:00", 0.5, 1, 1)],
+         "Grid/Other-trades.csv": []},
+        {"Grid/House-trades.csv": [("2021-01-01T00:15", 21, 2.25, "PV"),
+                                   ("2021-01-01T00:15", 22.0, None, "Storage")],
+         "Grid/Load.csv": [("2021-01-01T00:15", 0.25, 2, 2)],
+         "Grid/Other-trades.csv": []},
+        {"Grid/House-trades.csv": [],
+         # The offered history of the last row group is not numeric (e.g. of a storage).
+         "Grid/Load.csv": [("2021-01-01T00:30", 1.5, "-", 0)],
+         "Grid/Other-trades.csv": [("2021-01-01T00:30", 30.0, 3.0, "PV")]},
+    ]
+    for slot_number, files in enumerate(slots):
+        for file_name, rows in files.items():
+            table_name, labels = (
+                ("trades", TRADE_LABELS) if "trades" in file_name
+                else ("area-stats", STATS_LABELS))
+            writer.write_rows(table_name, str(columnar_directory / file_name), labels, rows)
+            _write_csv(csv_directory / file_name, labels, rows, slot_number == 0)
+        writer.end_slot()
+    writer.close()
+
+    assert sorted(os.listdir(columnar_directory / "columnar")) == sorted(
+        ["manifest.json", f"trades.{file_format}", f"area-stats.{file_format}"])
+    created_files = convert_columnar_export_to_csv(str(columnar_directory))
+
+    assert len(created_files) == 3
+    for file_name in slots[0]:
+        assert (_read_file(columnar_directory / file_name) ==
+                _read_file(csv_directory / file_name))
+
+    # Columns with mixed types are stored as strings, also in the rewritten first row group.
+    area_stats = _read_table(
+        str(columnar_directory / "columnar" / f"area-stats.{file_format}"), file_format)
+    assert area_stats.schema.types == [
+        pyarrow.string(), pyarrow.string(), pyarrow.float64(), pyarrow.string(),
+        pyarrow.int64()]
+    assert area_stats.column("offered_history").to_pylist() == ["1", "2", "-"]
@@ -0,0 +1,57 @@
+from gsy_e.gsy_e_core.fairness_scheduler import FairnessScheduler
+
+ITEMS = [f"child{index}" for index in range(10)]
+
+
+def _get_orders_of_ticks(scheduler: FairnessScheduler, number_of_ticks: int):
+    orders = []
+    for _ in range(number_of_ticks):
+        scheduler.next_tick()
+        orders.append(scheduler.shuffled("area", ITEMS))
+    return orders
+
+
+class TestFairnessScheduler:
+
+    @staticmethod
+    def test_order_is_reproducible_with_the_same_seed():
+        orders = _get_orders_of_ticks(FairnessScheduler(seed=42), 20)
+        assert _get_orders_of_ticks(FairnessScheduler(seed=42), 20) == orders
+
+        scheduler = FairnessScheduler(seed=1)
+        scheduler.shuffled("area", ITEMS)
+        scheduler.seed(42)
+        assert _get_orders_of_ticks(scheduler, 20) == orders
+
+        assert _get_orders_of_ticks(FairnessScheduler(seed=43), 20) != orders
+
+    @staticmethod
+    def test_order_is_a_permutation_that_is_reused_during_the_tick():
+        scheduler = FairnessScheduler(seed=42)
+        orders = _get_orders_of_ticks(scheduler, 20)
+        for order in orders:
+            assert sorted(order) == sorted(ITEMS)
+        assert len({tuple(order) for order in orders}) > 1
+
+        assert scheduler.shuffled("area", ITEMS) == orders[-1]
+
+    @staticmethod
+    def test_areas_with_the_same_number_of_children_are_ordered_independently():
+        scheduler = FairnessScheduler(seed=42)
+        other_items = [f"other{index}" for index in range(10)]
+        same_orders = 0
+        for _ in range(20):
+            scheduler.next_tick()
+            order = scheduler.shuffled("area", ITEMS)
+            other_order = scheduler.shuffled("other area", other_items)
+            assert scheduler.shuffled("area", ITEMS) == order
+            assert scheduler.shuffled("other area", other_items) == other_order
+            if other_order == [other_items[ITEMS.index(item)] for item in order]:
+                same_orders += 1
+        assert same_orders == 0
+
+    @staticmethod
+    def test_shuffled_supports_less_than_two_items():
+        scheduler = FairnessScheduler(seed=42)
+        assert scheduler.shuffled("area", []) == []
+        assert scheduler.shuffled("area", ["child"]) == ["child"]
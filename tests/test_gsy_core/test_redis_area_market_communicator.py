@@ -1,8 +1,10 @@
 # pylint: disable=redefined-outer-name
-from unittest.mock import patch, Mock
+import json
+from unittest.mock import call, patch, Mock
 
 import pytest
 from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 from gsy_framework.redis_channels import AggregatorChannels
 
 
@@ -111,3 +113,50 @@ class TestExternalConnectionCommunicator:
         enabled_communicator.publish_aggregator_commands_responses_events()
         enabled_communicator.aggregator.publish_all_commands_responses.assert_called_once()
         enabled_communicator.aggregator.publish_all_events.assert_called_once()
+
+    @staticmethod
+    def test_publish_event_json_publishes_the_events_in_one_pipeline(enabled_communicator):
+        enabled_communicator.publish_event_json("channel1", {"event": "tick"})
+        enabled_communicator.publish_event_json("channel2", {"event": "trade"})
+        enabled_communicator.redis_db.publish.assert_not_called()
+
+        enabled_communicator.publish_aggregator_commands_responses_events()
+        pipeline = enabled_communicator.redis_db.pipeline.return_value
+        enabled_communicator.redis_db.pipeline.assert_called_once_with(transaction=False)
+        assert pipeline.publish.call_args_list == [
+            call("channel1", json.dumps({"event": "tick"})),
+            call("channel2", json.dumps({"event": "trade"}))]
+        pipeline.execute.assert_called_once()
+        assert len(enabled_communicator.event_publisher) == 0
+
+    @staticmethod
+    @patch("gsy_e.gsy_e_core.redis_connections.event_publisher.log")
+    def test_publish_event_json_retries_a_failed_pipeline_once(log_mock, enabled_communicator):
+        pipeline = enabled_communicator.redis_db.pipeline.return_value
+        pipeline.execute.side_effect = [RedisConnectionError("connection lost"), []]
+        enabled_communicator.publish_event_json("channel", {"event": "tick"})
+        enabled_communicator.publish_aggregator_commands_responses_events()
+        assert pipeline.publish.call_args_list == [
+            call("channel", json.dumps({"event": "tick"}))] * 2
+        assert pipeline.execute.call_count == 2
+        log_mock.error.assert_called_once()
+        assert log_mock.error.call_args.args[1] == 1
+
+        pipeline.reset_mock()
+        log_mock.reset_mock()
+        pipeline.execute.side_effect = RedisConnectionError("connection lost")
+        enabled_communicator.publish_event_json("channel1", {"event": "tick"})
+        enabled_communicator.publish_event_json("channel2", {"event": "tick"})
+        enabled_communicator.publish_aggregator_commands_responses_events()
+        assert pipeline.execute.call_count == 2
+        assert [error_call.args[1] for error_call in log_mock.error.call_args_list] == [2, 2]
+        assert len(enabled_communicator.event_publisher) == 0
+
+    @staticmethod
+    def test_publish_event_json_publishes_directly_if_pipelining_is_disabled(
+            enabled_communicator):
+        with patch("gsy_e.constants.PIPELINE_EXTERNAL_EVENTS", False):
+            enabled_communicator.publish_event_json("channel", {"event": "tick"})
+        enabled_communicator.redis_db.publish.assert_called_once_with(
+            "channel", json.dumps({"event": "tick"}))
+        assert len(enabled_communicator.event_publisher) == 0
@@ -0,0 +1,67 @@
+import json
+
+from gsy_e.gsy_e_core.sim_results.results_delta import (
+    ResultsDeltaEncoder, serialize_results, get_results_size_kB)
+
+
+def _create_report(raw_data, area_states, configuration_tree=None, status="running"):
+    return {
+        "job_id": "job",
+        "status": status,
+        "progress_info": {"percentage_completed": 0},
+        "simulation_state": {"general": {"slot": 1}, "areas": area_states},
+        "simulation_raw_data": raw_data,
+        "configuration_tree": configuration_tree or {"name": "Grid", "children": []},
+    }
+
+
+class TestResultsDeltaEncoder:
+
+    @staticmethod
+    def test_encode_sends_keyframe_then_only_changed_areas():
+        encoder = ResultsDeltaEncoder(keyframe_interval=10)
+        keyframe = encoder.encode(_create_report(
+            {"a": {"trades": []}, "b": {"trades": []}}, {"a": {"soc": 1}, "b": {"soc": 2}}))
+        assert keyframe["message_type"] == "keyframe"
+        assert keyframe["sequence_number"] == 0
+        assert set(keyframe["simulation_raw_data"]) == {"a", "b"}
+
+        delta = encoder.encode(_create_report(
+            {"a": {"trades": [1]}, "b": {"trades": []}}, {"a": {"soc": 1}, "b": {"soc": 3}},
+            status="finished"))
+        assert delta["message_type"] == "delta"
+        assert delta["sequence_number"] == 1
+        assert delta["keyframe_sequence_number"] == 0
+        assert delta["status"] == "finished"
+        assert delta["simulation_raw_data"] == {"a": {"trades": [1]}}
+        assert delta["simulation_state"] == {"general": {"slot": 1}, "areas": {"b": {"soc": 3}}}
+        assert delta["removed_area_uuids"] == []
+        assert "configuration_tree" not in delta
+
+    @staticmethod
+    def test_encode_reports_removed_areas():
+        encoder = ResultsDeltaEncoder(keyframe_interval=10)
+        encoder.encode(_create_report({"a": {}, "b": {}}, {"a": {}, "b": {}}))
+        delta = encoder.encode(_create_report({"a": {}}, {"a": {}}))
+        assert delta["simulation_raw_data"] == {}
+        assert delta["removed_area_uuids"] == ["b"]
+
+    @staticmethod
+    def test_encode_sends_keyframe_on_interval_configuration_change_and_reset():
+        encoder = ResultsDeltaEncoder(keyframe_interval=3)
+        message_types = [encoder.encode(_create_report({}, {}))["message_type"]
+                         for _ in range(4)]
+        assert message_types == ["keyframe", "delta", "delta", "keyframe"]
+
+        changed_tree = {"name": "Grid", "children": [{"name": "House"}]}
+        assert encoder.encode(
+            _create_report({}, {}, configuration_tree=changed_tree))["message_type"] == "keyframe"
+
+        encoder.reset()
+        assert encoder.encode(_create_report({}, {}))["message_type"] == "keyframe"
+
+    @staticmethod
+    def test_serialize_results_is_valid_json():
+        results = _create_report({"a": {"trades": [1.5]}}, {"a": {"soc": 2}})
+        assert json.loads(serialize_results(results)) == results
+        assert get_results_size_kB(results) == len(serialize_results(results)) / 1000.0
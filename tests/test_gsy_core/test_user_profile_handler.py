@@ -1,9 +1,13 @@
 import uuid
-from unittest.mock import Mock, MagicMock
+from copy import deepcopy
+from datetime import datetime
+from unittest.mock import Mock, MagicMock, patch
 
 import pytest
-from pendulum import today
-from pony.orm import Database
+from gsy_framework.constants_limits import GlobalConfig
+from gsy_framework.read_user_profile import InputProfileTypes
+from pendulum import duration, today
+from pony.orm import Database, Required, db_session
 
 import gsy_e.constants
 import gsy_e.gsy_e_core.user_profile_handler
@@ -34,6 +38,25 @@ def area_tree_fixture():
     gsy_e.constants.CONFIGURATION_ID = ""
 
 
+def _create_profile_time_series_entity():
+    """Create the profile time series entity on a fresh in-memory SQLite database."""
+    database = Database()
+
+    class Profile_Database_ProfileTimeSeries(database.Entity):
+        # pylint: disable=invalid-name, too-few-public-methods
+        profile_uuid = Required(uuid.UUID)
+        time = Required(datetime)
+        value = Required(float)
+
+    database.bind(provider="sqlite", filename=":memory:")
+    database.generate_mapping(create_tables=True)
+    return Profile_Database_ProfileTimeSeries
+
+
+def _to_naive_utc_datetime(time_stamp):
+    return datetime(*time_stamp.in_timezone("UTC").timetuple()[:6])
+
+
 class TestProfileDBConnectionHandler:
     # pylint: disable=protected-access, attribute-defined-outside-init
 
@@ -66,3 +89,140 @@ class TestProfileDBConnectionHandler:
         self.profiles_handler.update_time_and_buffer_profiles(
             CUSTOM_DATETIME, area_tree)
         assert set(self.profiles_handler.db._profile_uuids) == {LOAD_UUID, PV_UUID}
+
+    def test_buffer_all_profiles_groups_the_datapoints_by_profile(self):
+        profile_db = self.profiles_handler.db
+        profile_db._profile_uuids = [LOAD_UUID, PV_UUID]
+        profile_db._get_start_end_time = Mock(
+            return_value=(CUSTOM_DATETIME, CUSTOM_DATETIME.add(hours=1)))
+        time_stamps = [CUSTOM_DATETIME.in_timezone("UTC").add(minutes=15 * index)
+                       for index in range(4)]
+        # plain (profile_uuid, time, value) rows, as returned by the DB cursor
+        profile_db._get_profiles_from_db = Mock(return_value=[
+            row for index, time_stamp in enumerate(time_stamps)
+            for row in ((LOAD_UUID, datetime(*time_stamp.timetuple()[:6]), index),
+                        (PV_UUID, datetime(*time_stamp.timetuple()[:6]), 10 * index),
+                        (uuid.uuid4(), datetime(*time_stamp.timetuple()[:6]), -1))])
+        profile_db._buffer_all_profiles(CUSTOM_DATETIME)
+        profile_db._buffer_time_slots()
+
+        assert profile_db.get_profile_from_db_buffer(str(LOAD_UUID)) == {
+            time_stamp: index for index, time_stamp in enumerate(time_stamps)}
+        assert profile_db.get_profile_from_db_buffer(str(PV_UUID)) == {
+            time_stamp: 10 * index for index, time_stamp in enumerate(time_stamps)}
+        assert profile_db._buffered_times == set(time_stamps)
+        assert not profile_db._should_buffer_profiles(time_stamps[-1])
+        assert profile_db._should_buffer_profiles(CUSTOM_DATETIME.add(days=1))
+
+    def test_buffer_all_profiles_reads_the_window_of_each_profile_from_the_db(self):
+        time_series = _create_profile_time_series_entity()
+        slot_length = duration(minutes=15)
+        start = CUSTOM_DATETIME.in_timezone("UTC")
+        window = [start + slot_length * index for index in range(4)]
+        with db_session:
+            for index, time_stamp in enumerate(window):
+                time_series(profile_uuid=LOAD_UUID, time=_to_naive_utc_datetime(time_stamp),
+                            value=index)
+                # datapoints of profiles that are not used in the simulation
+                time_series(profile_uuid=uuid.uuid4(), time=_to_naive_utc_datetime(time_stamp),
+                            value=-1)
+            # datapoints outside of the queried window
+            for time_stamp in (window[0] - slot_length, window[-1] + slot_length):
+                time_series(profile_uuid=LOAD_UUID, time=_to_naive_utc_datetime(time_stamp),
+                            value=100)
+            # the PV profile has no datapoints in the queried window, only a week before it
+            for index in range(2):
+                time_series(profile_uuid=PV_UUID,
+                            time=_to_naive_utc_datetime(
+                                start - duration(days=7) + slot_length * index),
+                            value=10 * index)
+
+        # SQLite compares datetimes as strings, so the query parameters have to be stored
+        # in the same (TZ unaware) format as the datapoints
+        with patch.object(ProfileDBConnectionHandler, "Profile_Database_ProfileTimeSeries",
+                          time_series), \
+                patch.object(ProfileDBConnectionHandler, "_convert_pendulum_to_datetime",
+                             staticmethod(_to_naive_utc_datetime)):
+            profile_db = ProfileDBConnectionHandler()
+            profile_db._profile_uuids = [LOAD_UUID, PV_UUID]
+            profile_db._get_start_end_time = Mock(return_value=(window[0], window[-1]))
+            profile_db._buffer_all_profiles(start)
+            assert profile_db._user_profiles == {
+                LOAD_UUID: {time_stamp: index for index, time_stamp in enumerate(window)},
+                # profiles without datapoints in the window fall back to their first week
+                PV_UUID: {window[index]: 10 * index for index in range(2)}}
+
+            profile_db._profile_uuids = [uuid.uuid4()]
+            with pytest.raises(ProfileDBConnectionException):
+                profile_db._buffer_all_profiles(start)
+
+    @patch("gsy_e.constants.PREFETCH_PROFILES_FROM_DB", True)
+    @patch.object(ProfileDBConnectionHandler, "buffer_profile_types", Mock())
+    @patch.object(ProfileDBConnectionHandler, "_get_profile_uuids_from_db",
+                  Mock(return_value=[LOAD_UUID]))
+    def test_buffer_profiles_from_db_swaps_to_the_prefetched_window(self):
+        slot_length = GlobalConfig.slot_length
+        start = CUSTOM_DATETIME.in_timezone("UTC")
+
+        def read_window(handler, current_timestamp):
+            handler._user_profiles = {LOAD_UUID: {
+                current_timestamp + slot_length * index: 1.0 for index in range(4)}}
+
+        with patch.object(ProfileDBConnectionHandler, "_buffer_all_profiles",
+                          autospec=True, side_effect=read_window) as buffer_all_profiles_mock, \
+                patch.object(GlobalConfig, "sim_duration", duration(days=1)), \
+                patch.object(GlobalConfig, "start_date", start):
+            profile_db = ProfileDBConnectionHandler()
+            profile_db.buffer_profiles_from_db(start, [LOAD_UUID])
+            next_window_start = start + slot_length * 4
+            assert profile_db._prefetch[0] == next_window_start
+            profile_db._prefetch[2].result()
+            assert buffer_all_profiles_mock.call_count == 2
+
+            profile_db.buffer_profiles_from_db(next_window_start, [LOAD_UUID])
+            # The prefetched window is used, and the window after it is prefetched.
+            assert profile_db._prefetch[2].result()
+            assert buffer_all_profiles_mock.call_count == 3
+            assert profile_db.get_profile_from_db_buffer(str(LOAD_UUID)) == {
+                next_window_start + slot_length * index: 1.0 for index in range(4)}
+
+            # The prefetching thread is shut down at the end of the simulation.
+            executor = profile_db._prefetch_executor
+            profile_db.stop_prefetching()
+            assert executor._shutdown
+            assert profile_db._prefetch_executor is None
+            assert profile_db._prefetch is None
+
+
+class TestProfilesHandler:
+    # pylint: disable=protected-access
+
+    @staticmethod
+    def test_rotate_profile_shares_read_only_profiles_of_identical_inputs():
+        profiles_handler = ProfilesHandler()
+        first_profile = profiles_handler.rotate_profile(InputProfileTypes.IDENTITY, 30)
+        second_profile = profiles_handler.rotate_profile(InputProfileTypes.IDENTITY, 30)
+        other_profile = profiles_handler.rotate_profile(InputProfileTypes.IDENTITY, 25)
+
+        assert first_profile is second_profile
+        assert first_profile is not other_profile
+        assert set(first_profile.values()) == {30}
+        assert set(other_profile.values()) == {25}
+        with pytest.raises(TypeError):
+            first_profile[CUSTOM_DATETIME] = 10
+        assert isinstance(deepcopy(first_profile), dict)
+
+        profiles_handler._update_current_time(CUSTOM_DATETIME.add(days=1))
+        assert profiles_handler._profile_cache == {}
+
+    @staticmethod
+    def test_rotate_profile_does_not_share_profiles_if_disabled():
+        gsy_e.constants.DEDUPLICATE_PROFILES = False
+        try:
+            profiles_handler = ProfilesHandler()
+            first_profile = profiles_handler.rotate_profile(InputProfileTypes.IDENTITY, 30)
+            second_profile = profiles_handler.rotate_profile(InputProfileTypes.IDENTITY, 30)
+            assert first_profile == second_profile
+            assert first_profile is not second_profile
+        finally:
+            gsy_e.constants.DEDUPLICATE_PROFILES = True
@@ -170,6 +170,17 @@ class FakeMarket:
 
         return offer
 
+    def amend_order(self, order_id, new_price, original_price=None):
+        if original_price is None:
+            original_price = new_price
+        offer = self.offers[order_id]
+        amended_offer = Offer(
+            offer.id, pendulum.now(),
+            self._update_new_offer_price_with_fee(new_price, original_price, offer.energy),
+            offer.energy, offer.seller, original_price)
+        self.offers[offer.id] = amended_offer
+        return amended_offer
+
     def dispatch_market_offer_event(self, offer):
         pass
 
@@ -622,6 +633,23 @@ class TestMAOffer:
             market_id=market_agent_2.higher_market.id)
         assert len(market_agent_2.lower_market.calls_energy) == 1
 
+    @staticmethod
+    def test_ma_event_order_amended_amends_forwarded_offer(market_agent_2):
+        source_offer = market_agent_2.lower_market.offers["id"]
+        amended_offer = Offer(source_offer.id, pendulum.now(), 3, source_offer.energy,
+                              source_offer.seller, 3)
+        market_agent_2.lower_market.offers[amended_offer.id] = amended_offer
+
+        market_agent_2.event_order_amended(
+            market_id=market_agent_2.lower_market.id, order=amended_offer)
+
+        forwarded_offer = market_agent_2.higher_market.offers["uuid"]
+        assert forwarded_offer.price == 3
+        engine = next(e for e in market_agent_2.engines if "id" in e.forwarded_offers)
+        assert engine.forwarded_offers["id"].source_offer.price == 3
+        assert engine.forwarded_offers["uuid"].target_offer.price == 3
+        assert [offer.price for offer in market_agent_2.offers.posted] == [3]
+
     @staticmethod
     def test_ma_event_trade_buys_partial_accepted_offer(market_agent_2):
         total_offer = market_agent_2.higher_market.forwarded_offer
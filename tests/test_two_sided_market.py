@@ -560,6 +560,83 @@ class TestTwoSidedMarketMatchRecommendations:
         market.match_recommendations(recommendations)
         assert len(market.trades) == 0
 
+    @staticmethod
+    def test_match_recommendations_replaces_partially_traded_bid_with_residual(market):
+        bid = Bid("bid_id1", pendulum.now(),
+                  price=4, energy=2, buyer=TraderDetails("Buyer", "buyer_id"),
+                  time_slot="2021-10-06T12:00")
+        offer1 = Offer("offer_id1", pendulum.now(),
+                       price=2, energy=1, seller=TraderDetails("Seller1", "seller_id1"),
+                       time_slot="2021-10-06T12:00")
+        offer2 = Offer("offer_id2", pendulum.now(),
+                       price=2, energy=1, seller=TraderDetails("Seller2", "seller_id2"),
+                       time_slot="2021-10-06T12:00")
+
+        market.bids = {"bid_id1": bid}
+        market.offers = {"offer_id1": offer1, "offer_id2": offer2}
+
+        recommendations = [
+            BidOfferMatch(
+                bid=bid.serializable_dict(), offer=offer.serializable_dict(),
+                trade_rate=2, selected_energy=1, market_id=market.id,
+                time_slot="2021-10-06T12:00").serializable_dict()
+            for offer in (offer1, offer2)
+        ]
+        assert market.match_recommendations(recommendations) is True
+        assert len(market.trades) == 2
+        assert len(market.bids) == 0
+        assert len(market.offers) == 0
+
+    @staticmethod
+    def test_match_recommendations_finds_orders_by_origin_uuid(market):
+        bid = Bid("bid_id1", pendulum.now(),
+                  price=2, energy=1,
+                  buyer=TraderDetails("Buyer", "buyer_id", "Buyer", "buyer_origin_id"),
+                  time_slot="2021-10-06T12:00")
+        offer = Offer("offer_id1", pendulum.now(),
+                      price=2, energy=1,
+                      seller=TraderDetails("Seller", "seller_id", "Seller", "seller_origin_id"),
+                      time_slot="2021-10-06T12:00")
+
+        market.bids = {"bid_id1": bid}
+        market.offers = {"offer_id1": offer}
+
+        recommended_bid = bid.serializable_dict()
+        recommended_bid["id"] = "forwarded_bid_id"
+        recommended_offer = offer.serializable_dict()
+        recommended_offer["id"] = "forwarded_offer_id"
+        recommendations = [
+            BidOfferMatch(
+                bid=recommended_bid, offer=recommended_offer,
+                trade_rate=2, selected_energy=1, market_id=market.id,
+                time_slot="2021-10-06T12:00").serializable_dict()
+        ]
+        market.match_recommendations(recommendations)
+        assert len(market.trades) == 1
+        assert {trade.match_details["offer"].id for trade in market.trades} == {"offer_id1"}
+
+    @staticmethod
+    def test_match_recommendations_raises_if_order_origin_is_unknown(market):
+        bid = Bid("bid_id1", pendulum.now(),
+                  price=2, energy=1,
+                  buyer=TraderDetails("Buyer", "buyer_id", "Buyer", "buyer_origin_id"),
+                  time_slot="2021-10-06T12:00")
+        offer = Offer("offer_id1", pendulum.now(),
+                      price=2, energy=1,
+                      seller=TraderDetails("Seller", "seller_id", "Seller", "seller_origin_id"),
+                      time_slot="2021-10-06T12:00")
+        market.bids = {"bid_id1": bid}
+        market.offers = {}
+
+        recommendations = [
+            BidOfferMatch(
+                bid=bid.serializable_dict(), offer=offer.serializable_dict(),
+                trade_rate=2, selected_energy=1, market_id=market.id,
+                time_slot="2021-10-06T12:00").serializable_dict()
+        ]
+        with pytest.raises(InvalidBidOfferPairException):
+            market.match_recommendations(recommendations)
+
     @staticmethod
     @pytest.mark.skip("Attributes / requirements feature disabled.")
     def test_recommendation_with_valid_match_requirements_gets_accepted(market):
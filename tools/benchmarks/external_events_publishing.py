@@ -0,0 +1,92 @@
+"""
+Micro-benchmark of the publishing of the tick events of the external clients.
+
+On every dispatched tick, each of N connected assets publishes a tick event on its own Redis
+channel (ExternalMixin._dispatch_event_tick_to_external_agent). The benchmark measures the
+duration of publishing the events of one tick with one Redis round-trip per event (as before)
+and with the PipelinedEventPublisher, with the json and the orjson encoder.
+
+The events are published to the Redis server of REDIS_URL (e.g. a local redis-server). If the
+server is not reachable, fakeredis is used if it is installed (pip install fakeredis).
+
+Usage: python tools/benchmarks/external_events_publishing.py
+"""
+import json
+from time import perf_counter
+from uuid import uuid4
+
+from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from gsy_e.gsy_e_core.redis_connections.event_publisher import (
+    PipelinedEventPublisher, get_json_encoder)
+from gsy_e.gsy_e_core.redis_connections.simulation import REDIS_URL
+
+NUMBER_OF_DEVICES = 1000
+TICKS = 10
+
+
+def _connect_to_redis() -> Redis:
+    redis_db = Redis.from_url(REDIS_URL)
+    try:
+        redis_db.ping()
+        return redis_db
+    except RedisConnectionError:
+        import fakeredis  # pylint: disable=import-outside-toplevel
+        print(f"Redis server {REDIS_URL} is not reachable, using fakeredis.")
+        return fakeredis.FakeRedis()
+
+
+def _create_tick_events():
+    events = []
+    for index in range(NUMBER_OF_DEVICES):
+        device_uuid = str(uuid4())
+        events.append((f"{device_uuid}/events/tick", {
+            "slot_completion": "20%",
+            "market_slot": "2021-10-06T12:00",
+            "event": "tick",
+            "area_uuid": device_uuid,
+            "device_info": {
+                "energy_requirement_kWh": 0.1 * index,
+                "energy_active_in_bids": 0.0,
+                "energy_traded": 0.05 * index,
+                "total_cost": 1.5 * index}}))
+    return events
+
+
+def _publish_one_by_one(redis_db: Redis, events) -> None:
+    for channel, event in events:
+        redis_db.publish(channel, json.dumps(event))
+
+
+def _publish_pipelined(publisher: PipelinedEventPublisher, events) -> None:
+    for channel, event in events:
+        publisher.publish_json(channel, event)
+    publisher.flush()
+
+
+def _measure(publish) -> float:
+    start = perf_counter()
+    for _ in range(TICKS):
+        publish()
+    return (perf_counter() - start) / TICKS
+
+
+def main():
+    """Print the duration of publishing the tick events of all devices."""
+    redis_db = _connect_to_redis()
+    events = _create_tick_events()
+    print(f"{NUMBER_OF_DEVICES} connected devices, {REDIS_URL}")
+    print(f"{'publishing':>20} {'per tick [ms]':>14}")
+    measurements = [("one by one", lambda: _publish_one_by_one(redis_db, events))]
+    for encoder in ("json", "orjson"):
+        publisher = PipelinedEventPublisher(redis_db, get_json_encoder(encoder))
+        measurements.append((
+            f"pipelined ({encoder})",
+            lambda publisher=publisher: _publish_pipelined(publisher, events)))
+    for name, publish in measurements:
+        print(f"{name:>20} {_measure(publish) * 1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Micro-benchmark of the ordering of the children of an area for the dispatching of the events.
+
+An area with N children dispatches several events per tick (tick, offers, bids, trades), and
+every dispatch visits the children in random order for fairness. The benchmark measures the
+overhead of ordering the children for all events of one tick with the FairnessScheduler
+(one Fisher-Yates shuffle per tick) and with the sort by a random key per child that was used
+before.
+
+Usage: python tools/benchmarks/fairness_scheduler.py
+"""
+from time import perf_counter
+
+from numpy.random import random
+
+from gsy_e.gsy_e_core.fairness_scheduler import FairnessScheduler
+from gsy_e.models.area import Area
+
+NUMBER_OF_CHILDREN = 1000
+EVENTS_PER_TICK = 10
+TICKS = 100
+
+
+def _order_with_sort(_area_uuid, children) -> None:
+    for _ in range(TICKS):
+        for _ in range(EVENTS_PER_TICK):
+            for _ in sorted(children, key=lambda _: random()):
+                pass
+
+
+def _order_with_scheduler(area_uuid, children) -> None:
+    scheduler = FairnessScheduler(seed=0)
+    for _ in range(TICKS):
+        scheduler.next_tick()
+        for _ in range(EVENTS_PER_TICK):
+            for _ in scheduler.shuffled(area_uuid, children):
+                pass
+
+
+def main():
+    """Print the duration of ordering the children for all events of one tick."""
+    area = Area("Grid", children=[Area(f"Child {index}") for index in range(NUMBER_OF_CHILDREN)])
+    print(f"{NUMBER_OF_CHILDREN} children, {EVENTS_PER_TICK} events per tick")
+    print(f"{'ordering':>12} {'per tick [ms]':>14}")
+    for name, order in (("scheduler", _order_with_scheduler), ("sort", _order_with_sort)):
+        start = perf_counter()
+        order(area.uuid, area.children)
+        print(f"{name:>12} {(perf_counter() - start) / TICKS * 1e3:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
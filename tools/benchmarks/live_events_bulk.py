@@ -0,0 +1,61 @@
+"""
+Micro-benchmark of the application of bulk live events.
+
+A grid with one community and N homes (each with 3 assets) receives one update event per home,
+as sent by the UI in a bulk live event. The events are routed to their areas via the area uuid
+index of the root area; the depth-first search of the tree that was used before is timed as
+a reference.
+
+Usage: python tools/benchmarks/live_events_bulk.py
+"""
+from time import perf_counter
+
+from gsy_e.gsy_e_core.live_events import LiveEvents, UpdateAreaEvent
+from gsy_e.models.area import Area
+from gsy_e.models.config import create_simulation_config_from_global_config
+
+NUMBER_OF_HOMES = (100, 500, 1000, 2000)
+
+
+def _create_grid(number_of_homes: int) -> Area:
+    homes = [Area(f"Home {index}", children=[Area(f"Home {index} asset {asset}")
+                                             for asset in range(3)])
+             for index in range(number_of_homes)]
+    return Area("Grid", children=[Area("Community", children=homes)],
+                config=create_simulation_config_from_global_config())
+
+
+def _create_events(grid: Area):
+    return [UpdateAreaEvent(home.uuid, {"grid_fee_constant": 1})
+            for home in grid.children[0].children]
+
+
+def _apply_with_tree_search(area: Area, event) -> bool:
+    if event.apply(area) is True:
+        return True
+    return any(_apply_with_tree_search(child, event) for child in area.children)
+
+
+def main():
+    """Print the duration of applying one bulk event per home, with and without the index."""
+    print(f"{'homes':>8} {'index [ms]':>12} {'tree search [ms]':>18}")
+    for number_of_homes in NUMBER_OF_HOMES:
+        grid = _create_grid(number_of_homes)
+        live_events = LiveEvents(grid.config)
+        events = _create_events(grid)
+        start = perf_counter()
+        # pylint: disable=protected-access
+        live_events._handle_events(grid, events)
+        index_duration = perf_counter() - start
+
+        events = _create_events(grid)
+        start = perf_counter()
+        for event in events:
+            assert _apply_with_tree_search(grid, event)
+        tree_search_duration = perf_counter() - start
+        print(f"{number_of_homes:>8} {index_duration * 1e3:>12.1f} "
+              f"{tree_search_duration * 1e3:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
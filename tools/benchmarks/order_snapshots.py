@@ -0,0 +1,69 @@
+"""
+Micro-benchmark of TwoSidedMarket.get_bids on the top market of setup/1000_houses.py.
+
+In the 1000 houses setup, every house load places a bid that is forwarded to the Grid market,
+and the market agent of every house reads all bids of the Grid market via get_bids on every tick
+(TwoSidedEngine.tick). The benchmark measures the duration and the allocated memory of one tick
+of all market agents, for the versioned snapshot of the bids and for the deep copy of the bids
+that get_bids returned before.
+
+Usage: python tools/benchmarks/order_snapshots.py
+"""
+import importlib
+import tracemalloc
+from copy import deepcopy
+from time import perf_counter
+from uuid import uuid4
+
+import pendulum
+from gsy_framework.data_classes import TraderDetails
+
+from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
+from gsy_e.models.config import create_simulation_config_from_global_config
+from gsy_e.models.market.two_sided import TwoSidedMarket
+
+TICKS = 10
+
+
+def _get_number_of_houses() -> int:
+    setup = importlib.import_module("gsy_e.setup.1000_houses")
+    grid = setup.get_setup(create_simulation_config_from_global_config())
+    return len([child for child in grid.children if child.children])
+
+
+def _create_grid_market(number_of_houses: int) -> TwoSidedMarket:
+    time_slot = pendulum.datetime(2021, 10, 6, 12)
+    market = TwoSidedMarket(time_slot=time_slot, bc=NonBlockchainInterface(str(uuid4())))
+    for index in range(number_of_houses):
+        market.bid(30, 0.1, TraderDetails(f"House {index}", f"house_{index}"),
+                   time_slot=time_slot)
+    return market
+
+
+def _measure(read_bids, market: TwoSidedMarket, number_of_agents: int):
+    tracemalloc.start()
+    start = perf_counter()
+    for _ in range(TICKS):
+        for _ in range(number_of_agents):
+            for _ in read_bids(market).values():
+                pass
+    duration = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration / TICKS, peak
+
+
+def main():
+    """Print the duration and peak allocation of one tick of all market agents."""
+    number_of_houses = _get_number_of_houses()
+    market = _create_grid_market(number_of_houses)
+    print(f"{number_of_houses} market agents, {len(market.bids)} bids in the Grid market")
+    print(f"{'get_bids':>12} {'per tick [ms]':>14} {'peak allocation [kB]':>22}")
+    for name, read_bids in (("snapshot", lambda m: m.get_bids()),
+                            ("deepcopy", lambda m: deepcopy(m.bids))):
+        duration, peak = _measure(read_bids, market, number_of_houses)
+        print(f"{name:>12} {duration * 1e3:>14.1f} {peak / 1e3:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Micro-benchmark of TwoSidedMarket.match_recommendations.
+
+Every bid is matched partially with two offers, so that each recommendation produces a residual
+bid that needs to be substituted in the pending recommendations. The time per recommendation
+should stay roughly constant while the number of orders grows.
+
+Usage: python tools/benchmarks/two_sided_matching.py
+"""
+from time import perf_counter
+from uuid import uuid4
+
+import pendulum
+from gsy_framework.data_classes import Bid, BidOfferMatch, Offer, TraderDetails
+
+from gsy_e.gsy_e_core.blockchain_interface import NonBlockchainInterface
+from gsy_e.models.market.two_sided import TwoSidedMarket
+
+ORDERS_PER_SLOT = (250, 500, 1000, 2000, 4000)
+
+
+def _create_market_and_recommendations(number_of_bids: int):
+    time_slot = pendulum.datetime(2021, 10, 6, 12)
+    market = TwoSidedMarket(time_slot=time_slot, bc=NonBlockchainInterface(str(uuid4())))
+    recommendations = []
+    for index in range(number_of_bids):
+        bid = Bid(f"bid_{index}", time_slot, price=60, energy=2,
+                  buyer=TraderDetails(f"Load {index}", f"load_{index}",
+                                      f"Load {index}", f"load_{index}"),
+                  time_slot=time_slot)
+        market.bids[bid.id] = bid
+        for offer_index in (2 * index, 2 * index + 1):
+            offer = Offer(f"offer_{offer_index}", time_slot, price=20, energy=1,
+                          seller=TraderDetails(f"PV {offer_index}", f"pv_{offer_index}",
+                                               f"PV {offer_index}", f"pv_{offer_index}"),
+                          time_slot=time_slot)
+            market.offers[offer.id] = offer
+            recommendations.append(BidOfferMatch(
+                bid=bid.serializable_dict(), offer=offer.serializable_dict(),
+                trade_rate=30, selected_energy=1, market_id=market.id,
+                time_slot=time_slot.format("YYYY-MM-DDTHH:mm")).serializable_dict())
+    return market, recommendations
+
+
+def main():
+    """Print the duration of matching all recommendations for several order book sizes."""
+    print(f"{'bids':>8} {'offers':>8} {'total [s]':>10} {'per recommendation [us]':>24}")
+    for number_of_bids in ORDERS_PER_SLOT:
+        market, recommendations = _create_market_and_recommendations(number_of_bids)
+        number_of_recommendations = len(recommendations)
+        start = perf_counter()
+        market.match_recommendations(recommendations)
+        duration = perf_counter() - start
+        assert not market.bids and not market.offers
+        print(f"{number_of_bids:>8} {2 * number_of_bids:>8} {duration:>10.3f} "
+              f"{duration / number_of_recommendations * 1e6:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()